@@ -0,0 +1,72 @@
+"""Compares per-call decoder construction with the cached decoder registry.
+
+Run with ``python -m benchmarks.decoders``.
+"""
+
+from typing import Dict
+
+import argparse
+import json
+import timeit
+
+import msgspec
+
+from benchmarks.fixtures import iter_fixtures
+from valo_api.utils.decoders import clear_decoders, get_decoder
+
+
+def uncached_decode(return_type, data_response: bool, content: bytes):
+    if data_response:
+
+        class APIResponse(msgspec.Struct):
+            status: int
+            data: return_type
+
+        return msgspec.json.decode(content, type=APIResponse)
+    return msgspec.json.decode(content, type=return_type)
+
+
+def cached_decode(return_type, data_response: bool, content: bytes):
+    return get_decoder(return_type, data_response).decode(content)
+
+
+def run(number: int = 20) -> Dict[str, Dict[str, float]]:
+    clear_decoders()
+    results = {}
+    for filename, endpoint, _, content in iter_fixtures():
+        args = (endpoint.return_type, endpoint.data_response, content)
+        uncached = min(
+            timeit.repeat(lambda: uncached_decode(*args), number=number, repeat=3)
+        )
+        cached = min(
+            timeit.repeat(lambda: cached_decode(*args), number=number, repeat=3)
+        )
+        results[filename] = {
+            "bytes": len(content),
+            "uncached_us": uncached / number * 1e6,
+            "cached_us": cached / number * 1e6,
+            "speedup": uncached / cached,
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--number", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.number)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'fixture':<36}{'bytes':>10}{'per-call':>12}{'cached':>12}{'speedup':>9}")
+    for filename, r in results.items():
+        print(
+            f"{filename:<36}{r['bytes']:>10}{r['uncached_us']:>10.1f}us"
+            f"{r['cached_us']:>10.1f}us{r['speedup']:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
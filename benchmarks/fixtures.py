@@ -0,0 +1,51 @@
+from typing import Dict, Iterator, Tuple
+
+import os
+
+from valo_api.endpoint import Endpoint
+from valo_api.endpoints_config import EndpointsConfig
+
+FIXTURES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "tests",
+    "unit",
+    "endpoints",
+    "mock_responses",
+)
+
+FIXTURE_ENDPOINTS: Dict[str, Tuple[EndpointsConfig, str]] = {
+    "account_details_v1.json": (EndpointsConfig.ACCOUNT_BY_PUUID, "v1"),
+    "account_details_v2.json": (EndpointsConfig.ACCOUNT_BY_PUUID, "v2"),
+    "leaderboard_v1.json": (EndpointsConfig.LEADERBOARD, "v1"),
+    "lifetime_matches_by_puuid_v1.json": (
+        EndpointsConfig.LIFETIME_MATCHES_BY_PUUID,
+        "v1",
+    ),
+    "match_details_v2.json": (EndpointsConfig.MATCH_DETAILS, "v2"),
+    "mmr_details_by_puuid_v2.json": (EndpointsConfig.MMR_DETAILS_BY_PUUID, "v2"),
+    "mmr_history_by_puuid_v1.json": (EndpointsConfig.MMR_HISTORY_BY_PUUID, "v1"),
+    "raw_competitiveupdates_v1.json": (
+        EndpointsConfig.RAW_COMPETITIVE_UPDATES,
+        "v1",
+    ),
+    "raw_matchdetails_v1.json": (EndpointsConfig.RAW_MATCH_DETAILS, "v1"),
+    "raw_matchhistory_v1.json": (EndpointsConfig.RAW_MATCH_HISTORY, "v1"),
+    "raw_mmr_v1.json": (EndpointsConfig.RAW_MMR, "v1"),
+    "status_v1.json": (EndpointsConfig.STATUS, "v1"),
+    "store_featured_v1.json": (EndpointsConfig.STORE_FEATURED, "v1"),
+    "store_featured_v2.json": (EndpointsConfig.STORE_FEATURED, "v2"),
+    "store_offers_v2.json": (EndpointsConfig.STORE_OFFERS, "v2"),
+    "version_info_v1.json": (EndpointsConfig.VERSION_INFO, "v1"),
+    "website_v1.json": (EndpointsConfig.WEBSITE, "v1"),
+}
+
+
+def load_fixture(filename: str) -> bytes:
+    with open(os.path.join(FIXTURES_DIR, filename), "rb") as f:
+        return f.read()
+
+
+def iter_fixtures() -> Iterator[Tuple[str, Endpoint, str, bytes]]:
+    """Yields ``(filename, endpoint, version, content)`` for every fixture."""
+    for filename, (endpoint, version) in FIXTURE_ENDPOINTS.items():
+        yield filename, endpoint.value, version, load_fixture(filename)
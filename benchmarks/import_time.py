@@ -0,0 +1,85 @@
+"""Measures the cold start of the package in fresh interpreters.
+
+Run with ``python -m benchmarks.import_time``.
+"""
+
+from typing import Dict, List
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "import": "import valo_api",
+    "endpoint": "import valo_api; valo_api.get_account_details_by_name",
+    "client": "import valo_api; valo_api.ValoClient",
+    "async_endpoint": "import valo_api; valo_api.get_account_details_by_name_async",
+    "everything": "from valo_api import *",
+}
+
+HEAVY_MODULES = ("requests", "msgspec", "aiohttp", "PIL")
+
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, *[m for m in {modules!r} if m in sys.modules])
+"""
+
+
+def measure(statement: str) -> Dict:
+    """Runs a statement in a new interpreter.
+
+    Returns:
+        The seconds the statement took and the heavy modules it loaded.
+    """
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            _PROBE.format(statement=statement, modules=HEAVY_MODULES),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    return {"seconds": float(output[0]), "modules": output[1:]}
+
+
+def run(number: int = 10) -> Dict[str, Dict]:
+    results = {}
+    for name, statement in SCENARIOS.items():
+        runs: List[Dict] = [measure(statement) for _ in range(number)]
+        times = [r["seconds"] * 1e3 for r in runs]
+        results[name] = {
+            "statement": statement,
+            "min_ms": min(times),
+            "median_ms": statistics.median(times),
+            "modules": runs[-1]["modules"],
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--number", type=int, default=10)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.number)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'scenario':<16}{'min':>10}{'median':>10}  loaded")
+    for name, r in results.items():
+        print(
+            f"{name:<16}{r['min_ms']:>8.1f}ms{r['median_ms']:>8.1f}ms"
+            f"  {', '.join(r['modules']) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""A local HTTP server replaying the recorded fixtures."""
+
+from typing import Dict, Iterator, Tuple
+
+import re
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks.fixtures import iter_fixtures
+from valo_api.config import Config
+from valo_api.endpoint import Endpoint
+from valo_api.utils.fetch_endpoint import parse_endpoint
+
+_PARAMETER = re.compile(r"{(\w+)}")
+
+
+def path_kwargs(endpoint: Endpoint) -> Dict[str, str]:
+    """Returns placeholder values for the path parameters of an endpoint."""
+    return {
+        name: "eu" if name == "region" else "x"
+        for name in _PARAMETER.findall(endpoint.path)
+        if name != "version"
+    }
+
+
+def iter_requests() -> Iterator[Tuple[str, Endpoint, str, Dict[str, str], bytes]]:
+    """Yields ``(filename, endpoint, version, kwargs, content)`` of the
+    fixtures that can be replayed.
+
+    The raw endpoints share one POST route and are skipped.
+    """
+    for filename, endpoint, version, content in iter_fixtures():
+        if endpoint.method == "GET":
+            yield filename, endpoint, version, path_kwargs(endpoint), content
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this small responses
+    # wait for the delayed ACK of the client.
+    disable_nagle_algorithm = True
+    routes: Dict[str, bytes] = {}
+
+    def do_GET(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        content = self.routes.get(urllib.parse.urlsplit(self.path).path)
+        if content is None:
+            content = b'{"status": 404, "errors": [{"message": "Not found"}]}'
+            self.send_response(404)
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServer:
+    """Serves the fixtures on localhost and points the API base URL to it.
+
+    Example::
+
+        with FixtureServer():
+            valo_api.get_status("v1", "x")
+    """
+
+    def __init__(self):
+        routes = {}
+        for _, endpoint, version, kwargs, content in iter_requests():
+            url = parse_endpoint(endpoint.path, version=version, **kwargs)
+            routes[urllib.parse.urlsplit(url).path] = content
+        handler = type("Handler", (_Handler,), {"routes": routes})
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.server.daemon_threads = True
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._base_url = Config.BASE_URL
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "FixtureServer":
+        self._thread.start()
+        Config.BASE_URL = self.url
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        Config.BASE_URL = self._base_url
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,254 @@
+"""Runs all benchmarks over the recorded fixtures and reports them as JSON.
+
+Sections:
+
+- ``import``: cold start of the package, see :mod:`benchmarks.import_time`.
+- ``urls``: rendering of URLs and query arguments per endpoint.
+- ``decode``: decode throughput per fixture with the cached decoders.
+- ``e2e``: latency of sync and async calls against a local server
+  replaying the fixtures, see :mod:`benchmarks.server`.
+- ``memory``: memory held by a decoded response.
+
+Run with ``python -m benchmarks.suite``. ``--baseline`` compares against an
+earlier JSON report and exits with status 1 on regressions.
+"""
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import argparse
+import asyncio
+import functools
+import importlib.metadata
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+import tracemalloc
+
+from benchmarks import import_time
+from benchmarks.fixtures import iter_fixtures
+from benchmarks.server import FixtureServer, iter_requests, path_kwargs
+from valo_api.endpoints_config import EndpointsConfig
+from valo_api.utils.decoders import get_decoder
+from valo_api.utils.fetch_endpoint import parse_endpoint
+
+SECTIONS = ("import", "urls", "decode", "e2e", "memory")
+
+LOWER_IS_BETTER = ("_us", "_ms", "_bytes")
+HIGHER_IS_BETTER = ("_mb_s",)
+
+
+def _best_us(function: Callable[[], Any], number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=3)) / number * 1e6
+
+
+def bench_urls(number: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for value in EndpointsConfig:
+        endpoint = value.value
+        kwargs = {k: "" for k in endpoint.kwargs or ()}
+        kwargs.update(path_kwargs(endpoint), version=next(iter(endpoint.versions)))
+        results[endpoint.f_name] = {
+            "parse_endpoint_us": _best_us(
+                lambda: parse_endpoint(endpoint.path, **kwargs), number
+            ),
+            "build_query_args_us": _best_us(
+                lambda: endpoint.build_query_args(**kwargs), number
+            ),
+            "cache_key_us": _best_us(lambda: endpoint.cache_key(**kwargs), number),
+        }
+    return results
+
+
+def bench_decode(number: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for filename, endpoint, version, content in iter_fixtures():
+        decoder = get_decoder(endpoint.return_type, endpoint.data_response)
+        decode_us = _best_us(lambda: decoder.decode(content), number)
+        results[filename] = {
+            "bytes": len(content),
+            "decode_us": decode_us,
+            "throughput_mb_s": len(content) / decode_us,
+        }
+    return results
+
+
+def bench_memory() -> Dict[str, Dict[str, float]]:
+    results = {}
+    for filename, endpoint, version, content in iter_fixtures():
+        decoder = get_decoder(endpoint.return_type, endpoint.data_response)
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            result = decoder.decode(content)
+            held = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        del result
+        results[filename] = {
+            "bytes": len(content),
+            "decoded_bytes": held,
+            "ratio": held / len(content),
+        }
+    return results
+
+
+def _latencies(call: Callable[[], Any], number: int) -> Iterator[float]:
+    for _ in range(number):
+        start = time.perf_counter()
+        call()
+        yield (time.perf_counter() - start) * 1e3
+
+
+async def _latencies_async(call: Callable[[], Any], number: int) -> List[float]:
+    latencies = []
+    for _ in range(number):
+        start = time.perf_counter()
+        await call()
+        latencies.append((time.perf_counter() - start) * 1e3)
+    return latencies
+
+
+def _summary(latencies: List[float]) -> Dict[str, float]:
+    return {"median_ms": statistics.median(latencies), "min_ms": min(latencies)}
+
+
+def bench_e2e(number: int) -> Dict[str, Dict[str, Any]]:
+    from valo_api.client import ValoClient
+
+    calls: List[Tuple[str, Any, Dict]] = [
+        (filename, endpoint, dict(kwargs, version=version))
+        for filename, endpoint, version, kwargs, _ in iter_requests()
+    ]
+    results: Dict[str, Dict[str, Any]] = {f: {} for f, _, _ in calls}
+    with FixtureServer():
+        with ValoClient() as client:
+            for filename, endpoint, kwargs in calls:
+                call = functools.partial(
+                    endpoint._get_endpoint, client=client, **kwargs
+                )
+                call()
+                results[filename]["sync"] = _summary(list(_latencies(call, number)))
+        try:
+            from valo_api.client import AsyncValoClient
+        except ImportError:
+            return results
+
+        async def run_async():
+            async with AsyncValoClient() as client:
+                for filename, endpoint, kwargs in calls:
+                    call = functools.partial(
+                        endpoint._get_endpoint_async, client=client, **kwargs
+                    )
+                    await call()
+                    latencies = await _latencies_async(call, number)
+                    results[filename]["async"] = _summary(latencies)
+
+        asyncio.run(run_async())
+    return results
+
+
+def _version() -> Optional[str]:
+    try:
+        return importlib.metadata.version("valo_api")
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def run(sections=SECTIONS, number: int = 100) -> Dict[str, Any]:
+    """Runs benchmark sections.
+
+    Args:
+        sections: The sections of :data:`SECTIONS` to run.
+        number: The number of calls per URL measurement, the other sections
+            use a tenth of it.
+
+    Returns:
+        The report.
+    """
+    report: Dict[str, Any] = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "valo_api": _version(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        }
+    }
+    few = max(number // 10, 1)
+    if "import" in sections:
+        report["import"] = import_time.run(few)
+    if "urls" in sections:
+        report["urls"] = bench_urls(number)
+    if "decode" in sections:
+        report["decode"] = bench_decode(few)
+    if "e2e" in sections:
+        report["e2e"] = bench_e2e(few)
+    if "memory" in sections:
+        report["memory"] = bench_memory()
+    return report
+
+
+def _metrics(report: Any, prefix: str = "") -> Iterator[Tuple[str, float]]:
+    if isinstance(report, dict):
+        for key, value in report.items():
+            if key != "meta":
+                yield from _metrics(value, f"{prefix}{key}.")
+    elif isinstance(report, (int, float)) and not isinstance(report, bool):
+        yield prefix[:-1], report
+
+
+def regressions(
+    report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.2
+) -> List[Dict[str, Any]]:
+    """Returns the metrics which got worse than the baseline by more than
+    ``tolerance``, e.g. 0.2 for 20%.
+    """
+    before = dict(_metrics(baseline))
+    worse = []
+    for name, value in _metrics(report):
+        old: Optional[float] = before.get(name)
+        if not old:
+            continue
+        if name.endswith(LOWER_IS_BETTER):
+            change = value / old - 1
+        elif name.endswith(HIGHER_IS_BETTER):
+            change = old / value - 1 if value else float("inf")
+        else:
+            continue
+        if change > tolerance:
+            worse.append({"metric": name, "baseline": old, "value": value})
+    return worse
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("-n", "--number", type=int, default=100)
+    parser.add_argument(
+        "-s", "--section", action="append", choices=SECTIONS, dest="sections"
+    )
+    parser.add_argument("-o", "--output", help="write the report to this file")
+    parser.add_argument("--baseline", help="an earlier report to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    report = run(args.sections or SECTIONS, args.number)
+    if args.baseline:
+        with open(args.baseline) as f:
+            report["regressions"] = regressions(report, json.load(f), args.tolerance)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+    if report.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import msgspec
+import pytest
+
+from tests.unit.endpoints.utils import get_mock_response
+from valo_api.analytics import StringTable, match_columns
+from valo_api.responses.match_history import MatchHistoryPointV3
+
+
+@pytest.fixture
+def match() -> MatchHistoryPointV3:
+    response = get_mock_response("match_details_v2.json")
+    return msgspec.convert(response["data"], MatchHistoryPointV3)
+
+
+def test_string_table():
+    table = StringTable()
+    assert table.code("a") == 0
+    assert table.code("b") == 1
+    assert table.code("a") == 0
+    assert table.code(None) == -1
+    assert table[1] == "b"
+    assert table[-1] is None
+    assert table.lookup("c") == -1
+    assert len(table) == 2
+
+
+def test_match_columns(match):
+    columns = match_columns(match)
+
+    kill_events = [
+        kill
+        for match_round in match.rounds
+        for stats in match_round.player_stats
+        for kill in stats.kill_events
+    ]
+    assert len(columns.kills) == len(kill_events)
+    for row, kill in enumerate(kill_events):
+        assert columns.players[columns.kills.killer[row]] == kill.killer_puuid
+        assert columns.players[columns.kills.victim[row]] == kill.victim_puuid
+        assert columns.weapons[columns.kills.weapon[row]] == kill.damage_weapon_id
+        assert columns.kills.victim_x[row] == kill.victim_death_location.x
+    assert len(columns.locations) == sum(
+        len(kill.player_locations_on_kill) for kill in kill_events
+    )
+
+    damage = sum(
+        stats.damage
+        for match_round in match.rounds
+        for stats in match_round.player_stats
+    )
+    assert sum(columns.round_stats.damage) == damage
+    assert len(columns.round_stats) == sum(len(r.player_stats) for r in match.rounds)
+    assert columns.matches.values == [match.metadata.matchid]
+
+
+def test_match_columns_many(match):
+    columns = match_columns([match, match])
+    single = match_columns(match)
+
+    assert len(columns.kills) == 2 * len(single.kills)
+    assert len(columns.players) == len(single.players)
+    assert set(columns.kills.match) == {0}
+
+
+def test_to_numpy(match):
+    numpy = pytest.importorskip("numpy")
+    columns = match_columns(match)
+
+    arrays = columns.kills.to_numpy()
+
+    assert arrays["victim_x"].dtype == numpy.dtype("i")
+    assert arrays["victim_x"].tolist() == columns.kills.victim_x.tolist()
+    assert set(arrays) >= {"killer", "victim", "weapon", "time_in_round"}
@@ -0,0 +1,212 @@
+import asyncio
+import re
+import time
+
+import pytest
+import responses
+from aioresponses import aioresponses
+
+import valo_api
+from tests.unit.endpoints.utils import get_mock_response
+from valo_api.bulk import fan_out, fan_out_async, run_many, run_many_async
+from valo_api.client import AsyncValoClient, ValoClient
+from valo_api.config import Config
+from valo_api.exceptions.rate_limit import RateLimit
+from valo_api.exceptions.valo_api_exception import ValoAPIException
+from valo_api.responses.match_history import MatchHistoryPointV3
+
+URL = f"{Config.BASE_URL}/valorant/v2/match/"
+ERROR = {"status": 404, "errors": [{"code": 0, "message": "Not found"}]}
+
+
+def test_run_many():
+    in_flight = []
+
+    def work(key):
+        in_flight.append(key)
+        assert len(in_flight) <= 3
+        time.sleep(0.01)
+        in_flight.remove(key)
+        if key == 5:
+            raise ValueError(key)
+        return key * 2
+
+    results = {r.key: r for r in run_many(work, range(10), concurrency=3)}
+    assert len(results) == 10
+    assert isinstance(results[5].error, ValueError) and not results[5].ok
+    assert all(results[k].value == k * 2 for k in results if k != 5)
+
+
+@pytest.mark.asyncio
+async def test_run_many_async():
+    in_flight = []
+
+    async def work(key):
+        in_flight.append(key)
+        assert len(in_flight) <= 3
+        await asyncio.sleep(0.01 * (10 - key))
+        in_flight.remove(key)
+        if key == 5:
+            raise ValueError(key)
+        return key * 2
+
+    results = [r async for r in run_many_async(work, range(10), concurrency=3)]
+    assert sorted(r.key for r in results) == list(range(10))
+    assert [r.key for r in results if not r.ok] == [5]
+
+
+@pytest.mark.asyncio
+async def test_run_many_async_reads_keys_lazily():
+    read = []
+
+    def keys():
+        for key in range(100):
+            read.append(key)
+            yield key
+
+    async def work(key):
+        await asyncio.sleep(0)
+        return key
+
+    results = run_many_async(work, keys(), concurrency=4)
+    first = await results.__anext__()
+    assert first.ok and len(read) <= 5
+    assert len([r async for r in results]) == 99
+
+
+def test_run_many_respects_rate_limit(monkeypatch):
+    slept = []
+    monkeypatch.setattr(time, "sleep", slept.append)
+    monkeypatch.setattr(RateLimit, "remaining", 0)
+    monkeypatch.setattr(RateLimit, "reset_unix", int(time.time()) + 30)
+
+    list(run_many(lambda key: key, range(2), concurrency=1))
+    assert len(slept) == 2 and all(25 <= s <= 30 for s in slept)
+
+
+def test_run_many_timeout():
+    results = {
+        r.key: r
+        for r in run_many(
+            lambda key: time.sleep(key) or key, [0, 0, 1, 1], concurrency=2
+        )
+    }
+    assert all(r.ok for r in results.values())
+
+    started = time.monotonic()
+    results = list(
+        run_many(lambda key: time.sleep(key) or key, [0, 2, 3], 2, timeout=0.2)
+    )
+    assert time.monotonic() - started < 1
+    assert [r.key for r in results] == [0, 2, 3]
+    assert results[0].value == 0
+    assert all(isinstance(r.error, TimeoutError) for r in results[1:])
+
+
+@pytest.mark.asyncio
+async def test_run_many_async_timeout():
+    async def work(key):
+        await asyncio.sleep(key)
+        return key
+
+    results = [r async for r in run_many_async(work, [0, 5, 0], timeout=0.2)]
+    assert sorted((r.key, r.ok) for r in results) == [(0, True), (0, True), (5, False)]
+    assert isinstance(results[-1].error, TimeoutError)
+
+
+@responses.activate
+def test_get_match_details_many():
+    responses.add(
+        responses.GET,
+        re.compile(f"{URL}ok-.*"),
+        json=get_mock_response("match_details_v2.json"),
+    )
+    responses.add(responses.GET, f"{URL}missing", json=ERROR, status=404)
+
+    with ValoClient() as client:
+        results = list(
+            client.get_match_details_many(["ok-1", "missing", "ok-2"], concurrency=2)
+        )
+    results = {r.key: r for r in results}
+    assert isinstance(results["ok-1"].value, MatchHistoryPointV3)
+    assert isinstance(results["ok-2"].value, MatchHistoryPointV3)
+    assert isinstance(results["missing"].error, ValoAPIException)
+
+
+@pytest.mark.asyncio
+async def test_get_match_details_many_async():
+    async with AsyncValoClient() as client:
+        with aioresponses() as m:
+            m.get(
+                re.compile(f"{URL}ok-.*"),
+                payload=get_mock_response("match_details_v2.json"),
+                repeat=True,
+            )
+            m.get(f"{URL}missing", payload=ERROR, status=404)
+            results = [
+                r
+                async for r in client.get_match_details_many_async(
+                    ["ok-1", "missing", "ok-2"], concurrency=2
+                )
+            ]
+    results = {r.key: r for r in results}
+    assert isinstance(results["ok-1"].value, MatchHistoryPointV3)
+    assert isinstance(results["missing"].error, ValoAPIException)
+
+
+@responses.activate
+def test_fan_out():
+    for region in Config.ALL_REGIONS:
+        response = dict(get_mock_response("status_v1.json"), region=region)
+        responses.add(
+            responses.GET,
+            f"{Config.BASE_URL}/valorant/v1/status/{region}",
+            json=response,
+        )
+    responses.replace(
+        responses.GET,
+        f"{Config.BASE_URL}/valorant/v1/status/kr",
+        json=ERROR,
+        status=404,
+    )
+
+    with ValoClient() as client:
+        results = client.fan_out(valo_api.get_status, version="v1", deadline=10)
+    assert list(results) == Config.ALL_REGIONS
+    assert isinstance(results["kr"].error, ValoAPIException)
+    assert all(results[r].ok for r in Config.ALL_REGIONS if r != "kr")
+    assert len(responses.calls) == len(Config.ALL_REGIONS)
+
+
+def test_fan_out_deadline():
+    def status(region, version):
+        time.sleep(1 if region == "na" else 0)
+        return region, version
+
+    results = fan_out(status, ["eu", "na"], deadline=0.2, version="v1")
+    assert results["eu"].value == ("eu", "v1")
+    assert isinstance(results["na"].error, TimeoutError)
+
+
+@pytest.mark.asyncio
+async def test_fan_out_async():
+    async def status(region, version):
+        await asyncio.sleep(1 if region == "na" else 0)
+        return region
+
+    results = await fan_out_async(status, deadline=0.2, version="v1")
+    assert list(results) == Config.ALL_REGIONS
+    assert results["eu"].value == "eu"
+    assert isinstance(results["na"].error, TimeoutError)
+
+    with aioresponses() as m:
+        m.get(
+            re.compile(f"{Config.BASE_URL}/valorant/v1/status/.*"),
+            payload=get_mock_response("status_v1.json"),
+            repeat=True,
+        )
+        async with AsyncValoClient() as client:
+            results = await client.fan_out_async(
+                valo_api.get_status_async, regions=["eu", "ap"], version="v1"
+            )
+    assert all(r.ok for r in results.values())
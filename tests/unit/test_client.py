@@ -0,0 +1,106 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
+import pytest
+import responses
+from aioresponses import aioresponses
+
+from tests.unit.endpoints.utils import get_mock_response
+from valo_api.client import AsyncValoClient, ValoClient, _BaseClient
+from valo_api.config import Config
+from valo_api.responses.status import StatusV1
+from valo_api.utils.rate_limiter import RateLimiter
+
+
+@responses.activate
+def test_client():
+    url = f"{Config.BASE_URL}/valorant/v1/status/eu"
+    responses.add(responses.GET, url, json=get_mock_response("status_v1.json"))
+
+    with ValoClient(pool_maxsize=8, compression=False) as client:
+        adapter = client.session.get_adapter(url)
+        assert adapter._pool_maxsize == 8
+        assert client.session.headers["Accept-Encoding"] == "identity"
+
+        with ThreadPoolExecutor(8) as executor:
+            futures = [
+                executor.submit(client.get_status_v1, region="eu") for _ in range(16)
+            ]
+            assert all(isinstance(f.result(), StatusV1) for f in futures)
+        assert len(responses.calls) == 16
+        assert client.get_status_v1 is client.get_status_v1
+        assert "get_status" in dir(client)
+        with pytest.raises(AttributeError):
+            client.get_status_v1_async
+
+
+@responses.activate
+def test_client_rate_limiter():
+    url = f"{Config.BASE_URL}/valorant/v1/status/eu"
+    responses.add(
+        responses.GET,
+        url,
+        json=get_mock_response("status_v1.json"),
+        headers={"x-ratelimit-limit": "30", "x-ratelimit-remaining": "12"},
+    )
+
+    limiter = RateLimiter()
+    with ValoClient(rate_limiter=limiter) as client:
+        client.get_status_v1(region="eu")
+    assert limiter.limit == 30
+    assert limiter.remaining == 12
+
+
+@pytest.mark.asyncio
+async def test_async_client():
+    url = f"{Config.BASE_URL}/valorant/v1/status/eu"
+    async with AsyncValoClient(limit_per_host=5, ttl_dns_cache=60) as client:
+        session = client.session
+        assert session.connector.limit_per_host == 5
+
+        with aioresponses() as m:
+            m.get(url, payload=get_mock_response("status_v1.json"), repeat=True)
+            status = await client.get_status_v1_async(region="eu")
+            assert isinstance(status, StatusV1)
+            await client.get_status_async(version="v1", region="eu")
+            assert len(m.requests) == 1
+            assert sum(len(calls) for calls in m.requests.values()) == 2
+
+        assert client.session is session
+        assert "get_status_v1_async" in dir(client)
+        with pytest.raises(AttributeError):
+            client.get_status_v1
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_async_client_timeout():
+    async with AsyncValoClient() as client:
+        assert client.session.timeout == aiohttp.client.DEFAULT_TIMEOUT
+    async with AsyncValoClient(timeout=5) as client:
+        assert client.session.timeout.total == 5
+
+
+def test_async_client_event_loop():
+    client = AsyncValoClient()
+
+    async def open_session():
+        return client.session
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(open_session())
+        with pytest.raises(RuntimeError):
+            asyncio.run(open_session())
+        loop.run_until_complete(client.close())
+    finally:
+        loop.close()
+
+
+def test_base_client_is_abstract():
+    class Client(_BaseClient):
+        pass
+
+    with pytest.raises(TypeError):
+        Client()
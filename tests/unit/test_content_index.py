@@ -0,0 +1,120 @@
+import msgspec
+import pytest
+import responses
+from aioresponses import aioresponses
+
+from valo_api.client import ValoClient
+from valo_api.config import Config
+from valo_api.content import ContentIndex, get_content_index, get_content_index_async
+from valo_api.responses.content import ContentV1
+from valo_api.utils.cache import MemoryCache
+
+URL = f"{Config.BASE_URL}/valorant/v1/content"
+
+
+def entity(id: str, name: str, german: str, asset_path: str = None) -> dict:
+    return {
+        "id": id,
+        "name": name,
+        "assetName": name.replace(" ", ""),
+        "assetPath": asset_path,
+        "localizedNames": {"en-US": name, "de-DE": german},
+    }
+
+
+def content_response(version: str = "release-08.00") -> dict:
+    response = {field: [] for field in ContentV1.__struct_fields__}
+    response["version"] = version
+    response["characters"] = [
+        entity("jett", "Jett", "Jett", "ShooterGame/Characters/Jett"),
+    ]
+    response["equips"] = [entity("vandal", "Vandal", "Vandal-Gewehr")]
+    response["skins"] = [
+        entity("prime-vandal", "Prime Vandal", "Prime-Vandal"),
+        entity("vandal-skin", "Vandal", "Standard-Vandal"),
+    ]
+    response["acts"] = [
+        {
+            "id": "act",
+            "parentId": "episode",
+            "type": "act",
+            "name": "ACT I",
+            "isActive": True,
+        }
+    ]
+    return response
+
+
+def make_content(version: str = "release-08.00") -> ContentV1:
+    return msgspec.convert(content_response(version), ContentV1)
+
+
+def test_content_index():
+    index = ContentIndex(make_content())
+
+    assert index.version == "release-08.00"
+    assert len(index) == 5
+    assert "jett" in index
+    assert index.get("prime-vandal").name == "Prime Vandal"
+    assert index.get("unknown") is None
+    assert index.category("act") == "acts"
+    assert index.by_asset_path("shootergame/characters/JETT").id == "jett"
+
+
+def test_content_index_by_name():
+    index = ContentIndex(make_content())
+
+    assert index.by_name("PRIME vandal").id == "prime-vandal"
+    assert index.by_name("VANDAL", category="equips").id == "vandal"
+    assert index.by_name("vandal", category="skins").id == "vandal-skin"
+    assert index.by_name("act i").id == "act"
+    assert index.by_name("Standard-Vandal", locale="de-de").id == "vandal-skin"
+    assert index.by_name("vandal-gewehr", category="equips", locale="de-DE").id == (
+        "vandal"
+    )
+    assert index.by_name("Vandal-Gewehr", locale="fr-FR") is None
+
+
+def test_content_index_localized_name():
+    index = ContentIndex(make_content())
+
+    assert index.localized_name("prime-vandal", "de-DE") == "Prime-Vandal"
+    assert index.localized_name("prime-vandal", "de-de") == "Prime-Vandal"
+    assert index.localized_name("prime-vandal", "fr-FR") is None
+    assert index.localized_name("act", "de-DE") is None
+
+
+def test_content_index_update():
+    index = ContentIndex(make_content())
+
+    assert not index.update(make_content())
+
+    content = make_content("release-08.01")
+    content.skins = content.skins[:1]
+    assert index.update(content)
+    assert index.version == "release-08.01"
+    assert index.get("vandal-skin") is None
+
+
+@responses.activate
+def test_get_content_index():
+    responses.add(responses.GET, URL, json=content_response())
+
+    with ValoClient(cache=MemoryCache()) as client:
+        index = client.get_content_index()
+        assert client.get_content_index() is index
+
+    assert len(responses.calls) == 1
+    assert index.get("jett").name == "Jett"
+    assert get_content_index() is index
+    assert get_content_index(locale="de-DE") is not index
+
+
+@pytest.mark.asyncio
+async def test_get_content_index_async():
+    with aioresponses() as m:
+        m.get(f"{URL}?locale=es-es", payload=content_response("release-09.00"))
+        index = await get_content_index_async(locale="es-ES")
+
+    assert index.version == "release-09.00"
+    assert index.get("jett").name == "Jett"
@@ -0,0 +1,86 @@
+import pytest
+import responses
+from aioresponses import aioresponses
+from responses import matchers
+
+from valo_api.content import (
+    LocalizedContent,
+    get_content_all_locales,
+    get_content_all_locales_async,
+)
+from valo_api.exceptions.valo_api_exception import ValoAPIException
+
+from .test_content_index import URL, content_response, make_content
+
+
+def german_response() -> dict:
+    response = content_response()
+    for category in ("characters", "equips", "skins"):
+        for item in response[category]:
+            item["name"] = item["localizedNames"]["de-DE"]
+    response["acts"][0]["name"] = "AKT I"
+    return response
+
+
+def test_localized_content():
+    content = LocalizedContent(make_content())
+    content.add_locale("en-US", make_content())
+
+    assert content.ids == ["jett", "prime-vandal", "vandal-skin", "vandal", "act"]
+    assert content.locales == ["en-US"]
+    assert content.name("vandal", "en-US") == "Vandal"
+    assert content.name("vandal", "de-DE") is None
+    assert content.name("unknown", "en-US") is None
+    assert content.localized_names("act") == {"en-US": "ACT I"}
+
+
+@responses.activate
+def test_get_content_all_locales():
+    for locale, response in (
+        ("en-us", content_response()),
+        ("de-de", german_response()),
+    ):
+        responses.add(
+            responses.GET,
+            URL,
+            json=response,
+            match=[matchers.query_param_matcher({"locale": locale})],
+        )
+
+    content = get_content_all_locales(["de-DE", "en-US"])
+
+    assert content.locales == ["en-US", "de-DE"]
+    assert content.content.equips[0].localizedNames["de-DE"] == "Vandal-Gewehr"
+    assert content.name("vandal", "de-DE") == "Vandal-Gewehr"
+    assert content.localized_names("act") == {"en-US": "ACT I", "de-DE": "AKT I"}
+
+
+@responses.activate
+def test_get_content_all_locales_error():
+    responses.add(
+        responses.GET,
+        URL,
+        json=content_response(),
+        match=[matchers.query_param_matcher({"locale": "en-us"})],
+    )
+    responses.add(
+        responses.GET,
+        URL,
+        status=404,
+        json={"status": 404, "errors": [{"message": "Not found"}]},
+        match=[matchers.query_param_matcher({"locale": "xx-xx"})],
+    )
+
+    with pytest.raises(ValoAPIException):
+        get_content_all_locales(["xx-XX"])
+
+
+@pytest.mark.asyncio
+async def test_get_content_all_locales_async():
+    with aioresponses() as m:
+        m.get(f"{URL}?locale=en-us", payload=content_response())
+        m.get(f"{URL}?locale=de-de", payload=german_response())
+        content = await get_content_all_locales_async(["en-US", "de-DE"])
+
+    assert content.locales == ["en-US", "de-DE"]
+    assert content.name("prime-vandal", "de-DE") == "Prime-Vandal"
@@ -0,0 +1,102 @@
+import os
+import time
+
+import pytest
+import responses
+
+from tests.unit.test_content_index import URL, content_response, make_content
+from valo_api.content import ContentSnapshot, _indexes, get_content_index
+
+
+@pytest.fixture
+def snapshot(tmp_path) -> ContentSnapshot:
+    return ContentSnapshot(str(tmp_path / "content"))
+
+
+@pytest.fixture(autouse=True)
+def clear_indexes():
+    _indexes.clear()
+    yield
+    _indexes.clear()
+
+
+def test_save_and_load(snapshot):
+    content = make_content()
+
+    path = snapshot.save(content, locale="de-DE")
+
+    assert os.path.exists(path)
+    assert snapshot.load(locale="de-DE") == content
+    assert snapshot.load(locale="de-DE", version=content.version) == content
+    assert snapshot.load() is None
+    assert snapshot.load(locale="fr-FR") is None
+
+
+def test_save_replaces_old_versions(snapshot):
+    old = snapshot.save(make_content("release-08.00"))
+    new = snapshot.save(make_content("release-08.01"))
+
+    assert not os.path.exists(old)
+    assert snapshot.load().version == "release-08.01"
+    assert snapshot.load(version="release-08.00") is None
+    assert os.listdir(snapshot.directory) == [os.path.basename(new)]
+
+
+def test_stale_snapshot(snapshot):
+    path = snapshot.save(make_content())
+    past = time.time() - snapshot.max_age - 1
+    os.utime(path, (past, past))
+
+    assert snapshot.load() is None
+    assert not snapshot.fresh("release-08.00")
+    assert snapshot.load(version="release-08.00") is not None
+
+
+def test_corrupt_snapshot(snapshot):
+    path = snapshot.save(make_content())
+    with open(path, "wb") as f:
+        f.write(b"\x00")
+
+    assert snapshot.load() is None
+
+
+def test_clear(snapshot):
+    snapshot.clear()
+    snapshot.save(make_content())
+
+    snapshot.clear()
+
+    assert snapshot.load() is None
+
+
+def test_shared_directory(snapshot):
+    os.makedirs(snapshot.directory)
+    other = os.path.join(snapshot.directory, "content-cache.db")
+    open(other, "w").close()
+    leftover = os.path.join(
+        snapshot.directory, "content-all-abc123.valo-content.msgpack.tmp"
+    )
+    open(leftover, "w").close()
+
+    snapshot.save(make_content(), locale="en-US")
+    snapshot.save(make_content(), locale="en")
+    assert snapshot.load(locale="en-US") is not None
+
+    snapshot.clear()
+    assert os.listdir(snapshot.directory) == ["content-cache.db"]
+
+
+@responses.activate
+def test_get_content_index_snapshot(snapshot):
+    responses.add(responses.GET, URL, json=content_response())
+
+    index = get_content_index(snapshot=snapshot)
+    assert len(responses.calls) == 1
+    assert snapshot.load() == index.content
+
+    _indexes.clear()
+    index = get_content_index(snapshot=snapshot)
+    assert len(responses.calls) == 1
+    assert index.get("jett").name == "Jett"
+    assert get_content_index(snapshot=snapshot) is index
+    assert len(responses.calls) == 1
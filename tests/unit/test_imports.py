@@ -0,0 +1,75 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parents[2]
+LAZY = ("PIL", "aiohttp")
+WITHOUT_AIOHTTP = """
+import importlib.abc, importlib.util, sys
+
+find_spec = importlib.util.find_spec
+importlib.util.find_spec = lambda name, *args: (
+    None if name == "aiohttp" else find_spec(name, *args)
+)
+
+
+class Block(importlib.abc.MetaPathFinder):
+    def find_spec(self, name, path=None, target=None):
+        if name.split(".")[0] == "aiohttp":
+            raise ModuleNotFoundError(name)
+
+
+sys.meta_path.insert(0, Block())
+"""
+
+
+def run(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+    ).stdout
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import valo_api",
+        "import valo_api; valo_api.get_account_details_by_name",
+        "import valo_api; valo_api.ValoClient",
+    ],
+)
+def test_import_is_lazy(statement):
+    loaded = run(f"{statement}\nimport sys\nprint(*(m in sys.modules for m in {LAZY}))")
+    assert loaded.split() == ["False", "False"]
+
+
+def test_star_import_without_aiohttp():
+    names = run(
+        WITHOUT_AIOHTTP
+        + "import valo_api\n"
+        + "from valo_api import *\n"
+        + "print('AsyncValoClient' in valo_api.__all__, 'ValoClient' in dir(valo_api))"
+    )
+    assert names.split() == ["False", "True"]
+
+
+def test_unknown_attribute():
+    import valo_api
+
+    with pytest.raises(AttributeError):
+        valo_api.__bool__
+    with pytest.raises(AttributeError):
+        valo_api.get_unknown
+    assert "__bool__" not in vars(valo_api)
+
+
+def test_image_endpoint_docstring():
+    import valo_api
+
+    assert "PIL.Image.Image: API Fetch Result" in valo_api.get_crosshair.__doc__
+    assert "ImageResponse" not in valo_api.get_crosshair_v1.__doc__
@@ -0,0 +1,76 @@
+from typing import List
+
+import msgspec
+import pytest
+
+from tests.unit.endpoints.utils import get_mock_response
+from valo_api.leaderboard import LeaderboardIndex
+from valo_api.responses.leaderboard import LeaderboardPlayerV1
+
+from .test_leaderboard_tracker import leaderboard, player
+
+
+@pytest.fixture
+def index() -> LeaderboardIndex:
+    return LeaderboardIndex(
+        leaderboard(
+            1000,
+            [
+                player("d", 4, 150),
+                player("a", 1, 500),
+                player("b", 2, 450),
+                player("c", 3, 200),
+                player("", 5, 50),
+                None,
+            ],
+        )
+    )
+
+
+def puuids(players) -> List[str]:
+    return [p.puuid for p in players]
+
+
+def test_lookups(index):
+    assert len(index) == 5
+    assert index.by_puuid("c").leaderboardRank == 3
+    assert index.by_puuid("x") is None
+    assert index.by_name("B#TAG").puuid == "b"
+    assert index.by_name("b", "Tag").puuid == "b"
+    assert index.by_name("#tag") is None
+    assert index.by_rank(4).puuid == "d"
+    assert index.by_rank(6) is None
+
+
+def test_ranges(index):
+    assert puuids(index.rank_range(2, 3)) == ["b", "c"]
+    assert puuids(index.rank_range(6, 10)) == []
+    assert puuids(index.rr_range(150, 450)) == ["b", "c", "d"]
+    assert puuids(index.rr_range(300)) == ["a", "b"]
+    assert index.percentile(450) == 60
+    assert index.percentile(0) == 0
+
+
+def test_tiers(index):
+    assert index.tier(450) == "radiant"
+    assert index.tier(449) == "immortal_3"
+    assert index.tier(0) == "immortal_1"
+    assert puuids(index.tier_players("radiant")) == ["a", "b"]
+    assert puuids(index.tier_players("immortal_3")) == ["c"]
+    assert puuids(index.tier_players("immortal_2")) == ["d"]
+    with pytest.raises(ValueError):
+        index.tier_players("gold")
+
+
+def test_index_v1():
+    players = msgspec.convert(
+        get_mock_response("leaderboard_v1.json"), List[LeaderboardPlayerV1]
+    )
+    index = LeaderboardIndex(players)
+
+    first = index.by_rank(1)
+    assert index.by_puuid(first.puuid) is first
+    assert index.by_name(f"{first.gameName}#{first.tagLine}") is first
+    assert index.tier(first.rankedRating) is None
+    with pytest.raises(ValueError):
+        index.tier_players("radiant")
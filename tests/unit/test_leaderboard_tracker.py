@@ -0,0 +1,118 @@
+import msgspec
+import pytest
+import responses
+from aioresponses import aioresponses
+
+from valo_api.config import Config
+from valo_api.leaderboard import LeaderboardTracker
+from valo_api.responses.leaderboard import LeaderboardV2
+
+URL = f"{Config.BASE_URL}/valorant/v2/leaderboard/eu"
+
+
+def player(puuid: str, rank: int, rr: int, wins: int = 10) -> dict:
+    return {
+        "PlayerCardID": "card",
+        "TitleID": "title",
+        "IsBanned": False,
+        "IsAnonymized": not puuid,
+        "puuid": puuid,
+        "gameName": puuid,
+        "tagLine": "tag",
+        "leaderboardRank": rank,
+        "rankedRating": rr,
+        "numberOfWins": wins,
+        "competitiveTier": 27,
+    }
+
+
+def leaderboard_response(last_update: int, players: list) -> dict:
+    return {
+        "total_players": len(players),
+        "radiant_threshold": 450,
+        "immortal_3_threshold": 200,
+        "immortal_2_threshold": 90,
+        "immortal_1_threshold": 0,
+        "players": players,
+        "last_update": last_update,
+        "next_update": last_update + 600,
+    }
+
+
+def leaderboard(last_update: int, players: list) -> LeaderboardV2:
+    return msgspec.convert(leaderboard_response(last_update, players), LeaderboardV2)
+
+
+@responses.activate
+def test_leaderboard_tracker():
+    now = [1000]
+    tracker = LeaderboardTracker("eu", clock=lambda: now[0])
+    responses.add(
+        responses.GET,
+        URL,
+        json=leaderboard_response(
+            1000, [player("a", 1, 500), player("b", 2, 400), player("", 3, 300)]
+        ),
+    )
+
+    diff = tracker.poll()
+    assert [p.puuid for p in diff.entered] == ["a", "b"]
+    assert not diff.changed and not diff.dropped
+    assert diff.previous_update is None
+    assert tracker.poll() is None
+    assert len(responses.calls) == 1
+
+    now[0] = 1600
+    responses.replace(
+        responses.GET,
+        URL,
+        json=leaderboard_response(
+            1600, [player("b", 1, 520, wins=11), player("c", 2, 450)]
+        ),
+    )
+    diff = tracker.poll()
+    assert len(responses.calls) == 2
+    assert diff.previous_update == 1000
+    assert [p.puuid for p in diff.entered] == ["c"]
+    assert [p.puuid for p in diff.dropped] == ["a"]
+    (change,) = diff.changed
+    assert (change.puuid, change.rank_delta, change.rr_delta) == ("b", 1, 120)
+    assert change.previous_wins == 10
+
+    assert tracker.poll(force=True) is None
+    assert set(tracker.players) == {"b", "c"}
+
+
+def test_leaderboard_tracker_unchanged_players():
+    tracker = LeaderboardTracker("eu")
+    tracker.update(leaderboard(1000, [player("a", 1, 500)]))
+
+    diff = tracker.update(leaderboard(1600, [player("a", 1, 500)]))
+    assert diff is not None and not diff
+
+
+@pytest.mark.asyncio
+async def test_leaderboard_tracker_async():
+    tracker = LeaderboardTracker("eu", clock=lambda: 0)
+    with aioresponses() as m:
+        m.get(URL, payload=leaderboard_response(1000, [player("a", 1, 500)]))
+        diff = await tracker.poll_async()
+        assert await tracker.poll_async() is None
+
+    assert [p.puuid for p in diff.entered] == ["a"]
+
+
+def test_leaderboard_tracker_rejects_v1():
+    with pytest.raises(ValueError):
+        LeaderboardTracker("eu", version="v1")
+
+
+def test_leaderboard_tracker_index():
+    tracker = LeaderboardTracker("eu")
+    assert tracker.index is None
+
+    tracker.update(leaderboard(1000, [player("a", 1, 500)]))
+    index = tracker.index
+    assert tracker.index is index
+    tracker.update(leaderboard(1600, [player("b", 1, 500)]))
+    assert tracker.index.by_rank(1).puuid == "b"
@@ -0,0 +1,69 @@
+import re
+
+import pytest
+import responses
+from aioresponses import aioresponses
+from responses import matchers
+
+from tests.unit.endpoints.utils import get_mock_response
+from valo_api.client import AsyncValoClient, ValoClient
+from valo_api.config import Config
+from valo_api.pagination import iter_lifetime_matches
+from valo_api.responses.lifetime_match import LifetimeMatchV1
+
+URL = f"{Config.BASE_URL}/valorant/v1/by-puuid/lifetime/matches/eu/puuid"
+
+
+def page_response(page: int, size: int, total: int) -> dict:
+    response = dict(get_mock_response("lifetime_matches_by_puuid_v1.json"))
+    response["data"] = response["data"][(page - 1) * size : min(page * size, total)]
+    return response
+
+
+@responses.activate
+def test_iter_lifetime_matches():
+    for page in range(1, 6):
+        responses.add(
+            responses.GET,
+            URL,
+            json=page_response(page, 2, 5),
+            match=[matchers.query_param_matcher({"page": page, "size": 2})],
+        )
+
+    with ValoClient() as client:
+        matches = list(
+            client.iter_lifetime_matches("eu", puuid="puuid", size=2, prefetch=2)
+        )
+    assert len(matches) == 5
+    assert all(isinstance(m, LifetimeMatchV1) for m in matches)
+    pages = sorted(int(c.request.params["page"]) for c in responses.calls)
+    assert pages[:3] == [1, 2, 3]
+    assert len(pages) <= 4
+
+
+def test_iter_lifetime_matches_arguments():
+    with pytest.raises(ValueError):
+        next(iter_lifetime_matches("eu", name="name"))
+    with pytest.raises(ValueError):
+        next(iter_lifetime_matches("eu", puuid="puuid", size=0))
+
+
+@pytest.mark.asyncio
+async def test_iter_lifetime_matches_async():
+    url = f"{Config.BASE_URL}/valorant/v1/lifetime/matches/eu/name/tag"
+    async with AsyncValoClient() as client:
+        with aioresponses() as m:
+            for page in range(1, 6):
+                m.get(
+                    re.compile(f"{url}\\?.*page={page}.*"),
+                    payload=page_response(page, 3, 7),
+                )
+            matches = [
+                match
+                async for match in client.iter_lifetime_matches_async(
+                    "eu", name="name", tag="tag", size=3, prefetch=3
+                )
+            ]
+    assert len(matches) == 7
+    data = get_mock_response("lifetime_matches_by_puuid_v1.json")["data"]
+    assert [m.stats.kills for m in matches] == [d["stats"]["kills"] for d in data[:7]]
@@ -0,0 +1,85 @@
+import re
+
+import pytest
+import responses
+from aioresponses import aioresponses
+
+import valo_api
+from tests.unit.endpoints.utils import (
+    get_error_responses,
+    get_mock_response,
+    validate_exception,
+)
+from valo_api.client import ValoClient
+from valo_api.config import Config
+from valo_api.exceptions.valo_api_exception import ValoAPIException
+from valo_api.responses.leaderboard import LeaderboardPlayerV1
+from valo_api.responses.lifetime_match import LifetimeMatchV1
+
+URL = f"{Config.BASE_URL}/valorant/v1/by-puuid/lifetime/matches/eu/puuid"
+
+
+@responses.activate
+def test_stream():
+    response = get_mock_response("lifetime_matches_by_puuid_v1.json")
+    responses.add(responses.GET, URL, json=response)
+
+    matches = list(
+        valo_api.get_lifetime_matches_by_puuid_v1_stream(
+            region="eu", puuid="puuid", chunk_size=128
+        )
+    )
+
+    assert len(matches) == len(response["data"])
+    assert all(isinstance(m, LifetimeMatchV1) for m in matches)
+    assert matches == valo_api.get_lifetime_matches_by_puuid_v1(
+        region="eu", puuid="puuid"
+    )
+
+
+@responses.activate
+def test_stream_top_level_list():
+    response = get_mock_response("leaderboard_v1.json")
+    url = f"{Config.BASE_URL}/valorant/v1/leaderboard/eu"
+    responses.add(responses.GET, url, json=response)
+
+    with ValoClient() as client:
+        players = list(client.get_leaderboard_stream(version="v1", region="eu"))
+
+    assert len(players) == len(response)
+    assert all(isinstance(p, LeaderboardPlayerV1) for p in players)
+
+
+@responses.activate
+def test_stream_error():
+    error_response = get_error_responses("lifetime_matches")[0]
+    responses.add(
+        responses.GET, URL, json=error_response, status=error_response["status"]
+    )
+
+    with pytest.raises(ValoAPIException) as excinfo:
+        next(
+            valo_api.get_lifetime_matches_by_puuid_v1_stream(region="eu", puuid="puuid")
+        )
+    validate_exception(error_response, excinfo)
+
+
+def test_stream_unsupported_version():
+    with pytest.raises(ValueError):
+        next(valo_api.get_leaderboard_stream(version="v3", region="eu"))
+
+
+@pytest.mark.asyncio
+async def test_stream_async():
+    response = get_mock_response("lifetime_matches_by_puuid_v1.json")
+    with aioresponses() as m:
+        m.get(re.compile(re.escape(URL) + ".*"), payload=response)
+        matches = [
+            match
+            async for match in valo_api.get_lifetime_matches_by_puuid_v1_stream_async(
+                region="eu", puuid="puuid", chunk_size=128
+            )
+        ]
+
+    assert len(matches) == len(response["data"])
+    assert all(isinstance(m, LifetimeMatchV1) for m in matches)
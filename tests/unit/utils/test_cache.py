@@ -0,0 +1,142 @@
+import pytest
+import responses
+from aioresponses import aioresponses
+
+from tests.unit.endpoints.utils import get_mock_response
+from valo_api.client import AsyncValoClient, ValoClient
+from valo_api.config import Config
+from valo_api.endpoints_config import EndpointsConfig
+from valo_api.utils.cache import CacheEntry, MemoryCache, ResponseCache, cache_key
+
+
+def test_cache_key():
+    assert cache_key("get", "https://a/b", None) == "GET https://a/b"
+    assert cache_key("GET", "https://a/b", {"y": "2", "x": "1"}) == (
+        "GET https://a/b?x=1&y=2"
+    )
+    key = EndpointsConfig.CONTENT.value.cache_key(version="v1", locale="de-DE")
+    assert key == f"GET {Config.BASE_URL}/valorant/v1/content?locale=de-de"
+
+
+def test_memory_cache_lru_eviction():
+    cache = MemoryCache(max_size=10)
+    cache.set("a", CacheEntry(b"1234", 0))
+    cache.set("b", CacheEntry(b"1234", 0))
+    assert cache.get("a") is not None
+    cache.set("c", CacheEntry(b"1234", 0))
+    assert "a" in cache and "b" not in cache and "c" in cache
+    assert cache.size == 8
+
+    cache.set("d", CacheEntry(b"x" * 11, 0))
+    assert "d" not in cache
+
+    cache = MemoryCache(max_entries=1)
+    cache.set("a", CacheEntry(b"", 0))
+    cache.set("b", CacheEntry(b"", 0))
+    assert len(cache) == 1 and "b" in cache
+
+
+def test_cache_entry_fresh():
+    assert CacheEntry(b"", expires_at=10).fresh(now=9)
+    assert not CacheEntry(b"", expires_at=10).fresh(now=10)
+
+
+@responses.activate
+def test_client_cache():
+    url = f"{Config.BASE_URL}/valorant/v1/status/eu"
+    responses.add(responses.GET, url, json=get_mock_response("status_v1.json"))
+    responses.add(
+        responses.GET,
+        f"{Config.BASE_URL}/valorant/v1/account/name/tag",
+        json=get_mock_response("account_details_v1.json"),
+    )
+
+    cache = MemoryCache()
+    with ValoClient(cache=cache) as client:
+        status = client.get_status_v1(region="eu")
+        assert client.get_status_v1(region="eu") is status
+        assert len(responses.calls) == 1
+
+        cache.get(f"GET {url}").expires_at = 0
+        assert client.get_status_v1(region="eu") is not status
+        assert len(responses.calls) == 2
+
+        client.get_account_details_by_name_v1(name="name", tag="tag")
+        client.get_account_details_by_name_v1(name="name", tag="tag")
+        assert len(responses.calls) == 4
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_cache():
+    url = f"{Config.BASE_URL}/valorant/v1/status/eu"
+    cache = MemoryCache()
+    async with AsyncValoClient(cache=cache) as client:
+        with aioresponses() as m:
+            m.get(url, payload=get_mock_response("status_v1.json"))
+            status = await client.get_status_v1_async(region="eu")
+            assert await client.get_status_v1_async(region="eu") is status
+
+    cache.get(f"GET {url}").value = None
+    with ValoClient(cache=cache) as client:
+        assert client.get_status_v1(region="eu") == status
+
+
+@responses.activate
+def test_client_conditional_requests():
+    url = f"{Config.BASE_URL}/valorant/v1/leaderboard/eu"
+    responses.add(
+        responses.GET,
+        url,
+        json=get_mock_response("leaderboard_v1.json"),
+        headers={"ETag": '"v1"'},
+    )
+    responses.add(responses.GET, url, status=304, headers={"ETag": '"v1"'})
+
+    cache = MemoryCache()
+    with ValoClient(cache=cache) as client:
+        leaderboard = client.get_leaderboard_v1(region="eu")
+        assert client.get_leaderboard_v1(region="eu") is leaderboard
+    assert len(responses.calls) == 2
+    assert "If-None-Match" not in responses.calls[0].request.headers
+    assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_async_client_conditional_requests():
+    url = f"{Config.BASE_URL}/valorant/v1/status/eu"
+    cache = MemoryCache()
+    async with AsyncValoClient(cache=cache) as client:
+        with aioresponses() as m:
+            m.get(
+                url,
+                payload=get_mock_response("status_v1.json"),
+                headers={"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"},
+            )
+            m.get(url, status=304)
+            status = await client.get_status_v1_async(region="eu")
+            cache.get(f"GET {url}").expires_at = 0
+            assert await client.get_status_v1_async(region="eu") is status
+            headers = list(m.requests.values())[0][1].kwargs["headers"]
+            assert headers["If-Modified-Since"] == "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert cache.get(f"GET {url}").fresh()
+
+
+@responses.activate
+def test_client_does_not_keep_uncacheable_responses():
+    url = f"{Config.BASE_URL}/valorant/v1/leaderboard/eu"
+    responses.add(responses.GET, url, json=get_mock_response("leaderboard_v1.json"))
+
+    cache = MemoryCache()
+    with ValoClient(cache=cache) as client:
+        client.get_leaderboard_v1(region="eu")
+    assert len(cache) == 0
+
+
+def test_response_cache_is_abstract():
+    class Cache(ResponseCache):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Cache()
@@ -0,0 +1,52 @@
+from typing import List
+
+import json
+
+from tests.unit.endpoints.utils import get_mock_response
+from valo_api.endpoints_config import EndpointsConfig
+from valo_api.responses.status import StatusV1
+from valo_api.utils.decoders import (
+    clear_decoders,
+    get_decoder,
+    response_type,
+    warm_decoders,
+)
+
+
+def test_response_type_is_cached():
+    assert response_type(StatusV1) is response_type(StatusV1)
+    assert response_type(List[StatusV1]) is response_type(List[StatusV1])
+    assert response_type(StatusV1) is not response_type(List[StatusV1])
+
+
+def test_get_decoder_is_cached():
+    assert get_decoder(StatusV1) is get_decoder(StatusV1)
+    assert get_decoder(StatusV1) is not get_decoder(StatusV1, False)
+
+
+def test_endpoint_decoder():
+    endpoint = EndpointsConfig.STATUS.value
+    assert endpoint.decoder("v1") is endpoint.decoder("v1")
+    assert EndpointsConfig.CROSSHAIR.value.decoder("v1") is None
+
+    content = json.dumps(get_mock_response("status_v1.json")).encode()
+    status = endpoint.decoder("v1").decode(content).data
+    assert isinstance(status, StatusV1)
+
+
+def test_warm_decoders():
+    assert warm_decoders() > 0
+    assert len(EndpointsConfig.MATCH_DETAILS.value._decoders) > 0
+
+
+def test_clear_decoders():
+    endpoint = EndpointsConfig.STATUS.value
+    clear_decoders()
+    decoders = warm_decoders()
+    old = endpoint.decoder("v1")
+
+    clear_decoders()
+
+    assert endpoint._decoders == {}
+    assert warm_decoders() == decoders
+    assert endpoint.decoder("v1") is not old
@@ -0,0 +1,85 @@
+import math
+
+import pytest
+import responses
+
+from tests.unit.endpoints.utils import get_mock_response
+from valo_api.client import ValoClient
+from valo_api.config import Config
+from valo_api.responses.match_history import MatchHistoryPointV3
+from valo_api.utils.cache import CacheEntry
+from valo_api.utils.disk_cache import DiskCache, zstandard
+
+
+@pytest.mark.parametrize("compression", [None, "gzip", "zstd"])
+def test_disk_cache(tmp_path, compression):
+    if compression == "zstd" and zstandard is None:
+        pytest.skip("zstandard is not installed")
+    path = str(tmp_path / "cache.sqlite")
+    cache = DiskCache(path, compression=compression)
+    cache.set("a", CacheEntry(b"body" * 100, math.inf, {"etag": "x"}))
+    cache.set("b", CacheEntry(b"body" * 100, 10))
+    cache.close()
+
+    cache = DiskCache(path, compression=compression)
+    entry = cache.get("a")
+    assert entry.content == b"body" * 100
+    assert entry.expires_at == math.inf
+    assert entry.headers == {"etag": "x"}
+    assert entry.value is None
+    assert cache.get("b").expires_at == 10
+    assert cache.get("c") is None
+    assert len(cache) == 2
+
+    cache.delete("a")
+    assert cache.get("a") is None and cache.get("b") is not None
+    cache.clear()
+    assert len(cache) == 0 and cache.size == 0
+
+
+def test_disk_cache_deduplicates_and_evicts(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.sqlite"), max_size=250, compression=None)
+    cache.set("a", CacheEntry(b"a" * 100, math.inf))
+    cache.set("a2", CacheEntry(b"a" * 100, math.inf))
+    cache.set("b", CacheEntry(b"b" * 100, math.inf))
+    assert cache.size == 200
+
+    cache.get("a")
+    cache.set("c", CacheEntry(b"c" * 100, math.inf))
+    assert cache.get("b") is None
+    assert cache.get("a2") is not None and cache.get("c") is not None
+
+    cache.set("d", CacheEntry(b"d" * 300, math.inf))
+    assert cache.get("d") is None
+
+
+def test_disk_cache_drops_replaced_bodies(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.sqlite"), compression=None)
+    cache.set("a", CacheEntry(b"old", 10))
+    cache.set("b", CacheEntry(b"shared", 10))
+    cache.set("c", CacheEntry(b"shared", 10))
+
+    cache.set("a", CacheEntry(b"new", 10))
+    cache.set("b", CacheEntry(b"other", 10))
+
+    assert cache.size == len(b"new") + len(b"shared") + len(b"other")
+    assert cache.get("c").content == b"shared"
+
+
+@responses.activate
+def test_client_disk_cache(tmp_path):
+    match_id = "505e0e1d-3d71-4605-abf7-13267a32e2f2"
+    responses.add(
+        responses.GET,
+        f"{Config.BASE_URL}/valorant/v2/match/{match_id}",
+        json=get_mock_response("match_details_v2.json"),
+    )
+
+    path = str(tmp_path / "cache.sqlite")
+    with ValoClient(cache=DiskCache(path)) as client:
+        match = client.get_match_details_v2(match_id=match_id)
+    with ValoClient(cache=DiskCache(path)) as client:
+        cached = client.get_match_details_v2(match_id=match_id)
+    assert len(responses.calls) == 1
+    assert isinstance(cached, MatchHistoryPointV3)
+    assert cached == match
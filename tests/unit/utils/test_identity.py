@@ -0,0 +1,125 @@
+import msgspec
+import pytest
+import responses
+from aioresponses import aioresponses
+
+from tests.unit.endpoints.utils import get_mock_response
+from valo_api.client import AsyncValoClient, ValoClient
+from valo_api.config import Config
+from valo_api.responses.leaderboard import LeaderboardPlayerV1
+from valo_api.responses.match_history import MatchHistoryPointV3
+from valo_api.utils.identity import Identity, IdentityCache
+
+ACCOUNT = get_mock_response("account_details_v1.json")
+PUUID = ACCOUNT["data"]["puuid"]
+BY_NAME = f"{Config.BASE_URL}/valorant/v1/account/jasminaxrose/7024"
+BY_PUUID = f"{Config.BASE_URL}/valorant/v1/by-puuid/account/{PUUID}"
+
+
+def test_identity_cache():
+    renames = []
+    cache = IdentityCache(on_rename=lambda old, new: renames.append((old, new)))
+
+    assert cache.add("p1", "Name", "EUW", 100)
+    assert not cache.add("p1", "Name", "EUW", 200)
+    assert cache.puuid("name", "euw") == "p1"
+    assert cache.identity("p1") == Identity("p1", "Name", "EUW", 100)
+
+    assert not cache.add("p1", "Old", "EUW", 50)
+    assert cache.add("p1", "New", "1234", 300)
+    assert cache.puuid("name", "euw") is None
+    assert cache.puuid("new", "1234") == "p1"
+    assert renames == [
+        (Identity("p1", "Name", "EUW", 100), Identity("p1", "New", "1234", 300))
+    ]
+
+    assert not cache.add("", "Anonymous", "")
+    cache.invalidate("p1")
+    assert cache.puuid("new", "1234") is None and len(cache) == 0
+
+
+def test_identity_cache_max_entries():
+    cache = IdentityCache(max_entries=2)
+    cache.add("p1", "a", "1")
+    cache.add("p2", "b", "1")
+    cache.puuid("a", "1")
+    cache.add("p1", "a", "1")
+    cache.add("p3", "c", "1")
+
+    assert len(cache) == 2
+    assert cache.puuid("b", "1") is None
+    assert cache.puuid("a", "1") == "p1"
+
+
+def test_identity_cache_observe():
+    cache = IdentityCache()
+    match = msgspec.convert(
+        get_mock_response("match_details_v2.json")["data"], MatchHistoryPointV3
+    )
+    player = msgspec.convert(
+        get_mock_response("leaderboard_v1.json")[0], LeaderboardPlayerV1
+    )
+
+    assert cache.observe([match, player, "other"]) == [match, player, "other"]
+    for p in match.players.all_players:
+        assert cache.puuid(p.name, p.tag) == p.puuid
+        assert cache.identity(p.puuid).updated == match.metadata.game_start
+    assert cache.puuid(player.gameName, player.tagLine) == player.puuid
+
+
+@responses.activate
+def test_client_rewrites_by_name():
+    responses.add(responses.GET, BY_NAME, json=ACCOUNT)
+    responses.add(responses.GET, BY_PUUID, json=ACCOUNT)
+    cache = IdentityCache()
+
+    with ValoClient(identity_cache=cache) as client:
+        client.get_account_details_by_name_v1("jasminaxrose", "7024")
+        assert cache.puuid("JasminaxRose", "7024") == PUUID
+        account = client.get_account_details_by_name_v1("jasminaxrose", "7024")
+        client.get_account_details_by_name_v1("jasminaxrose", "7024", force_update=True)
+
+    assert account.puuid == PUUID
+    assert [c.request.url.split("?")[0] for c in responses.calls] == [
+        BY_NAME,
+        BY_PUUID,
+        BY_NAME,
+    ]
+
+
+@responses.activate
+def test_client_retries_renamed_player_by_name():
+    renamed = dict(
+        ACCOUNT, data=dict(ACCOUNT["data"], puuid="old", name="Renamed", tag="EUW")
+    )
+    responses.add(
+        responses.GET,
+        f"{Config.BASE_URL}/valorant/v1/by-puuid/account/old",
+        json=renamed,
+    )
+    responses.add(responses.GET, BY_NAME, json=ACCOUNT)
+    cache = IdentityCache()
+    cache.add("old", "jasminaxrose", "7024", 0)
+
+    with ValoClient(identity_cache=cache) as client:
+        account = client.get_account_details_by_name_v1("jasminaxrose", "7024")
+
+    assert account.puuid == PUUID
+    assert len(responses.calls) == 2
+    assert cache.puuid("jasminaxrose", "7024") == PUUID
+    assert cache.puuid("renamed", "euw") == "old"
+
+
+@pytest.mark.asyncio
+async def test_client_rewrites_by_name_async():
+    cache = IdentityCache()
+    cache.add(PUUID, "jasminaxrose", "7024")
+
+    with aioresponses() as m:
+        m.get(BY_PUUID, payload=ACCOUNT)
+        async with AsyncValoClient(identity_cache=cache) as client:
+            account = await client.get_account_details_by_name_v1_async(
+                "jasminaxrose", "7024"
+            )
+
+    assert account.puuid == PUUID
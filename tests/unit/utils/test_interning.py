@@ -0,0 +1,73 @@
+import msgspec
+import pytest
+import responses
+
+from tests.unit.endpoints.utils import get_mock_response
+from valo_api.client import ValoClient
+from valo_api.config import Config
+from valo_api.responses.match_history import MatchHistoryPointV3
+from valo_api.utils.interning import intern_strings
+
+
+def decode_match() -> MatchHistoryPointV3:
+    response = get_mock_response("match_details_v2.json")
+    return msgspec.json.decode(
+        msgspec.json.encode(response["data"]), type=MatchHistoryPointV3
+    )
+
+
+def puuids(match: MatchHistoryPointV3):
+    return [
+        event.receiver_puuid
+        for match_round in match.rounds
+        for stats in match_round.player_stats
+        for event in stats.damage_events
+    ]
+
+
+@pytest.mark.parametrize("mode", ["match", "process"])
+def test_intern_strings(mode):
+    match = decode_match()
+    before = puuids(match)
+    assert len({id(p) for p in before}) > len(set(before))
+
+    assert intern_strings(match, mode) is match
+
+    after = puuids(match)
+    assert after == before
+    assert len({id(p) for p in after}) == len(set(after))
+    assert match == decode_match()
+
+
+def test_intern_strings_per_match():
+    first, second = intern_strings([decode_match(), decode_match()], "match")
+
+    assert first.metadata.matchid is not second.metadata.matchid
+
+
+def test_intern_strings_per_process():
+    first, second = intern_strings([decode_match(), decode_match()], "process")
+
+    assert first.metadata.matchid is second.metadata.matchid
+
+
+def test_intern_strings_invalid_mode():
+    with pytest.raises(ValueError):
+        intern_strings(decode_match(), "round")
+    with pytest.raises(ValueError):
+        ValoClient(intern_strings="round")
+
+
+@responses.activate
+def test_client_intern_strings():
+    responses.add(
+        responses.GET,
+        f"{Config.BASE_URL}/valorant/v2/match/match_id",
+        json=get_mock_response("match_details_v2.json"),
+    )
+
+    with ValoClient(intern_strings="match") as client:
+        match = client.get_match_details_v2(match_id="match_id")
+
+    after = puuids(match)
+    assert len({id(p) for p in after}) == len(set(after))
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from valo_api.utils.json_stream import ArrayItemScanner, iter_array_items
+
+json_values = st.recursive(
+    st.none() | st.booleans() | st.integers() | st.text(),
+    lambda children: st.lists(children, max_size=3)
+    | st.dictionaries(st.text(max_size=5), children, max_size=3),
+    max_leaves=10,
+)
+
+
+def chunked(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@given(
+    items=st.lists(json_values, max_size=5),
+    other=json_values,
+    size=st.integers(min_value=1, max_value=16),
+)
+def test_iter_array_items(items, other, size):
+    document = {"status": 200, "other": {"data": other}, "data": items}
+    data = json.dumps(document, indent=1).encode()
+
+    raw = list(iter_array_items(chunked(data, size), ("data",)))
+
+    assert [json.loads(item) for item in raw] == items
+
+
+def test_iter_array_items_top_level():
+    assert list(iter_array_items([b' [1, "a,]", {"b": [2]}] '])) == [
+        b"1",
+        b'"a,]"',
+        b'{"b": [2]}',
+    ]
+    assert list(iter_array_items([b"[]"])) == []
+
+
+def test_iter_array_items_escaped_quotes():
+    data = b'{"data": ["a\\\\", "b\\"]", "c"]}'
+    for size in (1, 2, 3):
+        raw = list(iter_array_items(chunked(data, size), ("data",)))
+        assert [json.loads(item) for item in raw] == ["a\\", 'b"]', "c"]
+
+
+def test_iter_array_items_incomplete():
+    with pytest.raises(ValueError):
+        list(iter_array_items([b'{"data": [1, 2'], ("data",)))
+
+
+def test_scanner_discards_consumed_items():
+    scanner = ArrayItemScanner(("data",))
+    scanner.feed(b'{"data": [')
+    for _ in range(1000):
+        assert scanner.feed(b'{"kills": 1},') == [b'{"kills": 1}']
+    assert len(scanner._buffer) < 100
+    assert scanner.feed(b"{}]}") == [b"{}"]
+    assert scanner.done
@@ -0,0 +1,113 @@
+import msgspec
+import pytest
+import responses
+
+from tests.unit.endpoints.utils import get_mock_response
+from valo_api.client import ValoClient
+from valo_api.config import Config
+from valo_api.responses.match_history import (
+    MatchHistoryPointV3,
+    MatchRoundPlayerLocationV3,
+)
+from valo_api.utils.cache import MemoryCache
+from valo_api.utils.packed_locations import (
+    PackedLocations,
+    PlayerTable,
+    enc_hook,
+    pack_locations,
+)
+
+
+@pytest.fixture
+def match() -> MatchHistoryPointV3:
+    response = get_mock_response("match_details_v2.json")
+    return msgspec.convert(response["data"], MatchHistoryPointV3)
+
+
+def test_pack_locations(match):
+    original = msgspec.convert(
+        get_mock_response("match_details_v2.json")["data"], MatchHistoryPointV3
+    )
+
+    assert pack_locations(match) is match
+
+    kill = match.kills[0]
+    assert isinstance(kill.player_locations_on_kill, PackedLocations)
+    assert kill.player_locations_on_kill == original.kills[0].player_locations_on_kill
+    assert isinstance(kill.player_locations_on_kill[0], MatchRoundPlayerLocationV3)
+    assert match == original
+
+    tables = {
+        id(k.player_locations_on_kill.players)
+        for k in match.kills
+        if isinstance(k.player_locations_on_kill, PackedLocations)
+    }
+    assert len(tables) == 1
+    assert len(kill.player_locations_on_kill.players) <= 10
+
+
+def test_pack_locations_is_idempotent(match):
+    pack_locations(match)
+    packed = match.kills[0].player_locations_on_kill
+
+    pack_locations(match)
+
+    assert match.kills[0].player_locations_on_kill is packed
+
+
+def test_encode_packed_locations(match):
+    expected = msgspec.json.encode(match)
+    pack_locations(match)
+
+    with pytest.raises(TypeError):
+        msgspec.json.encode(match)
+    assert msgspec.json.encode(match, enc_hook=enc_hook) == expected
+
+
+def test_pack_locations_ignores_other_results():
+    result = {"status": 200}
+    assert pack_locations(result) is result
+    assert pack_locations([1, 2]) == [1, 2]
+
+
+def test_packed_locations_slice(match):
+    locations = match.kills[0].player_locations_on_kill
+    packed = PackedLocations.pack(locations, PlayerTable())
+
+    assert packed[1:3] == locations[1:3]
+    assert packed[-1] == locations[-1]
+
+
+@responses.activate
+def test_client_compact_locations():
+    responses.add(
+        responses.GET,
+        f"{Config.BASE_URL}/valorant/v2/match/match_id",
+        json=get_mock_response("match_details_v2.json"),
+    )
+
+    with ValoClient(compact_locations=True) as client:
+        match = client.get_match_details_v2(match_id="match_id")
+
+    assert isinstance(match.kills[0].player_locations_on_kill, PackedLocations)
+
+
+@responses.activate
+def test_shared_cache_keeps_results_unpacked():
+    responses.add(
+        responses.GET,
+        f"{Config.BASE_URL}/valorant/v2/match/match_id",
+        json=get_mock_response("match_details_v2.json"),
+    )
+    cache = MemoryCache()
+
+    with ValoClient(cache=cache, compact_locations=True) as compact:
+        with ValoClient(cache=cache) as default:
+            packed = compact.get_match_details_v2(match_id="match_id")
+            match = default.get_match_details_v2(match_id="match_id")
+            packed_hit = compact.get_match_details_v2(match_id="match_id")
+
+    assert len(responses.calls) == 1
+    assert isinstance(packed.kills[0].player_locations_on_kill, PackedLocations)
+    assert isinstance(packed_hit.kills[0].player_locations_on_kill, PackedLocations)
+    assert isinstance(match.kills[0].player_locations_on_kill, list)
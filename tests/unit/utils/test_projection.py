@@ -0,0 +1,89 @@
+from typing import List, Optional
+
+import msgspec
+import pytest
+import responses
+
+import valo_api
+from tests.unit.endpoints.utils import get_mock_response
+from valo_api.client import ValoClient
+from valo_api.config import Config
+from valo_api.responses.match_history import (
+    MatchHistoryPointV3,
+    MatchMetadataV3,
+    MatchPlayerStatsV3,
+)
+from valo_api.utils.cache import MemoryCache
+from valo_api.utils.projection import project
+
+URL = f"{Config.BASE_URL}/valorant/v2/match/match_id"
+PATHS = ["metadata", "players.all_players.stats"]
+
+
+def test_project():
+    projected = project(MatchHistoryPointV3, PATHS)
+
+    assert projected.__struct_fields__ == ("metadata", "players")
+    players = msgspec.structs.fields(projected)[1].type
+    assert players.__struct_fields__ == ("all_players",)
+    player = msgspec.structs.fields(players)[0].type.__args__[0]
+    assert player.__struct_fields__ == ("stats",)
+    assert msgspec.structs.fields(player)[0].type is MatchPlayerStatsV3
+    assert msgspec.structs.fields(projected)[0].type is MatchMetadataV3
+
+
+def test_project_is_cached():
+    assert project(MatchHistoryPointV3, PATHS) is project(
+        MatchHistoryPointV3, reversed(PATHS)
+    )
+    assert project(MatchHistoryPointV3, ["metadata", "metadata.map"]) is project(
+        MatchHistoryPointV3, ["metadata"]
+    )
+
+
+def test_project_containers():
+    projected = project(Optional[List[MatchHistoryPointV3]], "metadata")
+    item = projected.__args__[0].__args__[0]
+    assert item.__struct_fields__ == ("metadata",)
+
+
+def test_project_struct():
+    class Metadata(msgspec.Struct):
+        metadata: MatchMetadataV3
+
+    assert project(List[MatchHistoryPointV3], Metadata) == List[Metadata]
+
+
+def test_project_unknown_field():
+    with pytest.raises(ValueError):
+        project(MatchHistoryPointV3, ["metadata.unknown"])
+    with pytest.raises(ValueError):
+        project(MatchHistoryPointV3, ["metadata.map.length"])
+
+
+@responses.activate
+def test_endpoint_projection():
+    responses.add(responses.GET, URL, json=get_mock_response("match_details_v2.json"))
+
+    match = valo_api.get_match_details_v2(match_id="match_id", projection=PATHS)
+    full = valo_api.get_match_details_v2(match_id="match_id")
+
+    assert match.__struct_fields__ == ("metadata", "players")
+    assert match.metadata == full.metadata
+    assert [p.stats for p in match.players.all_players] == [
+        p.stats for p in full.players.all_players
+    ]
+
+
+@responses.activate
+def test_endpoint_projection_cache():
+    responses.add(responses.GET, URL, json=get_mock_response("match_details_v2.json"))
+
+    with ValoClient(cache=MemoryCache()) as client:
+        match = client.get_match_details_v2(match_id="match_id", projection=PATHS)
+        full = client.get_match_details_v2(match_id="match_id")
+        again = client.get_match_details_v2(match_id="match_id", projection=PATHS)
+
+    assert len(responses.calls) == 1
+    assert isinstance(full, MatchHistoryPointV3)
+    assert type(again) is type(match)
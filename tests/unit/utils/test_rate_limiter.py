@@ -0,0 +1,145 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+import responses
+
+from tests.unit.endpoints.utils import get_mock_response
+from valo_api.client import ValoClient
+from valo_api.config import Config
+from valo_api.utils.rate_limiter import RateLimiter
+from valo_api.utils.retry import RetryPolicy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_unknown_budget_is_probed():
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock, probe_timeout=10)
+    assert limiter.reserve() == 0
+    assert limiter.reserve() is None
+
+    clock.now += 10
+    assert limiter.reserve() == 0
+    assert limiter.reserve() is None
+
+
+def test_failed_probe_is_released():
+    limiter = RateLimiter(clock=FakeClock())
+    assert limiter.reserve() == 0
+    limiter.release()
+    assert limiter.reserve() == 0
+    assert limiter.reserve() is None
+
+
+@responses.activate
+def test_client_releases_failed_probe():
+    url = f"{Config.BASE_URL}/valorant/v1/status/eu"
+    responses.add(responses.GET, url, body=requests.ConnectionError())
+    responses.add(responses.GET, url, json=get_mock_response("status_v1.json"))
+    limiter = RateLimiter(probe_timeout=3)
+
+    start = time.monotonic()
+    with ValoClient(
+        rate_limiter=limiter, retry_policy=RetryPolicy(base_delay=0)
+    ) as client:
+        client.get_status_v1(region="eu")
+
+    assert time.monotonic() - start < 1
+    assert len(responses.calls) == 2
+
+
+def test_unknown_budget_is_not_limited_without_headers():
+    limiter = RateLimiter(clock=FakeClock())
+    assert limiter.reserve() == 0
+    limiter.update({}, 200)
+    assert all(limiter.reserve() == 0 for _ in range(100))
+    assert limiter.remaining is None
+
+
+def test_concurrent_first_burst():
+    limiter = RateLimiter(period=60, clock=FakeClock())
+    assert limiter.acquire() == 0
+    with ThreadPoolExecutor(8) as executor:
+        futures = [executor.submit(limiter.acquire) for _ in range(8)]
+        time.sleep(0.05)
+        assert not any(f.done() for f in futures)
+
+        limiter.update({"x-ratelimit-limit": "30", "x-ratelimit-remaining": "29"}, 200)
+        delays = [f.result(timeout=1) for f in futures]
+    assert all(d < 1 for d in delays)
+    assert limiter.remaining == 21
+
+
+def test_queues_into_next_periods():
+    clock = FakeClock()
+    limiter = RateLimiter(limit=2, period=60, clock=clock)
+    assert [limiter.reserve() for _ in range(6)] == [0, 0, 60, 60, 120, 120]
+
+    clock.now += 60
+    assert limiter.remaining == 0
+    clock.now += 120
+    assert limiter.remaining == 2
+
+
+def test_learns_from_headers():
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock)
+    limiter.update(
+        {
+            "x-ratelimit-limit": "30",
+            "x-ratelimit-remaining": "1",
+            "x-ratelimit-reset": "10",
+        },
+        200,
+    )
+    assert limiter.limit == 30
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 10
+
+    clock.now += 10
+    assert limiter.remaining == 29
+
+
+def test_retry_after():
+    clock = FakeClock()
+    limiter = RateLimiter(limit=30, clock=clock)
+    limiter.update({"retry-after": "5"}, 429)
+    assert limiter.remaining == 0
+    assert limiter.reserve() == 5
+
+
+def test_shared_between_threads():
+    limiter = RateLimiter(limit=10, period=60, clock=FakeClock())
+    with ThreadPoolExecutor(8) as executor:
+        delays = list(executor.map(lambda _: limiter.reserve(), range(40)))
+    assert sorted(delays) == [0] * 10 + [60] * 10 + [120] * 10 + [180] * 10
+
+
+@pytest.mark.asyncio
+async def test_acquire_async():
+    limiter = RateLimiter(limit=1, period=0.05)
+    delays = await asyncio.gather(*(limiter.acquire_async() for _ in range(3)))
+    assert delays[0] == 0
+    assert 0 < delays[1] <= 0.05
+    assert delays[1] < delays[2]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_burst_async():
+    limiter = RateLimiter(period=0.5)
+    tasks = [asyncio.create_task(limiter.acquire_async()) for _ in range(5)]
+    await asyncio.sleep(0.05)
+    assert sum(t.done() for t in tasks) == 1
+
+    limiter.update({"x-ratelimit-limit": "3", "x-ratelimit-remaining": "2"}, 200)
+    delays = await asyncio.wait_for(asyncio.gather(*tasks), 1)
+    assert sum(d > 0.3 for d in delays) == 2
@@ -0,0 +1,86 @@
+import pytest
+import requests
+import responses
+from aioresponses import aioresponses
+
+from tests.unit.endpoints.utils import get_mock_response
+from valo_api.client import AsyncValoClient, ValoClient
+from valo_api.config import Config
+from valo_api.exceptions.valo_api_exception import ValoAPIException
+from valo_api.responses.status import StatusV1
+from valo_api.utils.retry import RetryPolicy
+
+URL = f"{Config.BASE_URL}/valorant/v1/status/eu"
+ERROR = {"status": 502, "errors": [{"code": 0, "message": "Bad Gateway"}]}
+
+
+def test_backoff():
+    policy = RetryPolicy(base_delay=1, max_delay=5, jitter=False)
+    assert [policy.backoff(n) for n in range(1, 6)] == [1, 2, 4, 5, 5]
+    assert policy.backoff(1, {"retry-after": "7"}) == 7
+    assert 0 <= RetryPolicy(base_delay=1).backoff(3) <= 4
+
+
+@responses.activate
+def test_retry_transient_errors():
+    responses.add(responses.GET, URL, json=ERROR, status=502)
+    responses.add(responses.GET, URL, body=requests.ConnectionError())
+    responses.add(responses.GET, URL, json=get_mock_response("status_v1.json"))
+
+    attempts = []
+    policy = RetryPolicy(base_delay=0, on_attempt=attempts.append)
+    with ValoClient(retry_policy=policy) as client:
+        assert isinstance(client.get_status_v1(region="eu"), StatusV1)
+
+    assert [a.status for a in attempts] == [502, None, 200]
+    assert isinstance(attempts[1].error, requests.ConnectionError)
+    assert attempts[-1].delay is None
+    assert all(a.elapsed >= 0 for a in attempts)
+
+
+@responses.activate
+def test_retry_gives_up():
+    responses.add(responses.GET, URL, json=ERROR, status=502)
+
+    with ValoClient(retry_policy=RetryPolicy(max_attempts=2, base_delay=0)) as c:
+        with pytest.raises(ValoAPIException) as excinfo:
+            c.get_status_v1(region="eu")
+    assert excinfo.value.status == 502
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_retry_after_over_max_delay_is_not_retried():
+    error = {"status": 429, "errors": [{"code": 0, "message": "Rate limited"}]}
+    responses.add(
+        responses.GET, URL, json=error, status=429, headers={"retry-after": "3600"}
+    )
+
+    with ValoClient(retry_policy=RetryPolicy(max_delay=30)) as c:
+        with pytest.raises(ValoAPIException) as excinfo:
+            c.get_status_v1(region="eu")
+    assert excinfo.value.status == 429
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_retry_only_configured_methods():
+    responses.add(responses.GET, URL, json=ERROR, status=502)
+
+    policy = RetryPolicy(base_delay=0, methods=frozenset({"POST"}))
+    with ValoClient(retry_policy=policy) as client:
+        with pytest.raises(ValoAPIException):
+            client.get_status_v1(region="eu")
+    assert len(responses.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_async():
+    attempts = []
+    policy = RetryPolicy(base_delay=0, on_attempt=attempts.append)
+    async with AsyncValoClient(retry_policy=policy) as client:
+        with aioresponses() as m:
+            m.get(URL, payload=ERROR, status=503)
+            m.get(URL, payload=get_mock_response("status_v1.json"))
+            assert isinstance(await client.get_status_v1_async(region="eu"), StatusV1)
+    assert [a.status for a in attempts] == [503, 200]
@@ -0,0 +1,141 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import responses
+from aioresponses import CallbackResult, aioresponses
+
+from tests.unit.endpoints.utils import get_mock_response
+from valo_api.client import AsyncValoClient, ValoClient
+from valo_api.config import Config
+from valo_api.utils.single_flight import SingleFlight
+
+URL = f"{Config.BASE_URL}/valorant/v1/by-puuid/account/puuid"
+
+
+def test_single_flight_threads():
+    single_flight = SingleFlight()
+    started = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        return object()
+
+    with ThreadPoolExecutor(8) as executor:
+        first = executor.submit(single_flight.do, "key", slow)
+        started.wait()
+        others = [executor.submit(single_flight.do, "key", slow) for _ in range(7)]
+        results = {id(f.result()) for f in [first, *others]}
+    assert len(calls) == 1
+    assert len(results) == 1
+    assert len(single_flight) == 0
+
+
+def test_single_flight_errors():
+    single_flight = SingleFlight()
+
+    def fail():
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        single_flight.do("key", fail)
+    assert single_flight.do("key", lambda: 1) == 1
+
+
+@pytest.mark.asyncio
+async def test_single_flight_tasks():
+    single_flight = SingleFlight()
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return object()
+
+    results = await asyncio.gather(
+        *(single_flight.do_async("key", slow) for _ in range(10))
+    )
+    assert len(calls) == 1
+    assert len({id(r) for r in results}) == 1
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("failed")
+
+    results = await asyncio.gather(
+        *(single_flight.do_async("key", fail) for _ in range(3)),
+        return_exceptions=True,
+    )
+    assert all(isinstance(r, ValueError) for r in results)
+    assert len(single_flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancelled_leader():
+    single_flight = SingleFlight()
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return 1
+
+    leader = asyncio.create_task(single_flight.do_async("key", slow))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(single_flight.do_async("key", slow))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == 1
+    assert leader.cancelled()
+    assert len(calls) == 1
+
+    task = asyncio.create_task(single_flight.do_async("key", slow))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    await asyncio.sleep(0)
+    assert len(single_flight) == 0
+    assert len(calls) == 2
+
+
+def test_client_coalesces_requests():
+    def callback(request):
+        time.sleep(0.2)
+        return 200, {}, json.dumps(get_mock_response("account_details_v1.json"))
+
+    with responses.RequestsMock() as rsps:
+        rsps.add_callback(responses.GET, URL, callback=callback)
+        with ValoClient(coalesce=True) as client:
+            with ThreadPoolExecutor(8) as executor:
+                futures = [
+                    executor.submit(client.get_account_details_by_puuid_v1, "puuid")
+                    for _ in range(8)
+                ]
+                results = [f.result() for f in futures]
+        assert len(rsps.calls) == 1
+    assert all(r is results[0] for r in results)
+
+
+@pytest.mark.asyncio
+async def test_async_client_coalesces_requests():
+    async def callback(url, **kwargs):
+        await asyncio.sleep(0.05)
+        return CallbackResult(payload=get_mock_response("account_details_v1.json"))
+
+    async with AsyncValoClient(coalesce=True) as client:
+        with aioresponses() as m:
+            m.get(URL, callback=callback, repeat=True)
+            results = await asyncio.gather(
+                *(
+                    client.get_account_details_by_puuid_v1_async(puuid="puuid")
+                    for _ in range(10)
+                )
+            )
+            assert sum(len(calls) for calls in m.requests.values()) == 1
+    assert all(r is results[0] for r in results)
@@ -4,10 +4,71 @@ This is a Valorant API Wrapper for https://github.com/Henrik-3/unofficial-valora
 
 """
 
+from typing import List
+
+import importlib
+import importlib.util
 import logging
 import os
 
-from .endpoints import *
+# Submodules and endpoint functions are imported on first access (PEP 562), so
+# importing the package does not load requests, msgspec or aiohttp up front.
+_lazy_imports = {
+    "fan_out": ".bulk",
+    "fan_out_async": ".bulk",
+    "get_match_details_many": ".bulk",
+    "get_match_details_many_async": ".bulk",
+    "ValoClient": ".client",
+    "AsyncValoClient": ".client",
+    "ContentIndex": ".content",
+    "ContentSnapshot": ".content",
+    "LocalizedContent": ".content",
+    "get_content_all_locales": ".content",
+    "get_content_all_locales_async": ".content",
+    "get_content_index": ".content",
+    "get_content_index_async": ".content",
+    "LeaderboardIndex": ".leaderboard",
+    "LeaderboardTracker": ".leaderboard",
+    "iter_lifetime_matches": ".pagination",
+    "iter_lifetime_matches_async": ".pagination",
+    "MemoryCache": ".utils.cache",
+    "DiskCache": ".utils.disk_cache",
+    "IdentityCache": ".utils.identity",
+    "RateLimiter": ".utils.rate_limiter",
+    "RetryPolicy": ".utils.retry",
+}
+
+
+def _public_names() -> List[str]:
+    from .endpoints import function_names
+
+    names = [*_lazy_imports, *function_names]
+    if importlib.util.find_spec("aiohttp") is None:
+        names.remove("AsyncValoClient")
+    return names
+
+
+def __getattr__(name: str):
+    if name == "__all__":
+        return ["set_api_key", *_public_names()]
+    error = AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name in _lazy_imports:
+        module = importlib.import_module(_lazy_imports[name], __name__)
+    elif name.startswith("get_"):
+        module = importlib.import_module(".endpoints", __name__)
+    else:
+        raise error
+    try:
+        value = getattr(module, name)
+    except AttributeError:
+        raise error from None
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_public_names()))
+
 
 logging.getLogger("asyncio").setLevel(logging.CRITICAL)
 
@@ -0,0 +1,246 @@
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from array import array
+from dataclasses import dataclass, field, fields
+
+from valo_api.responses.match_history import MatchHistoryPointV3
+
+
+class StringTable:
+    """Dictionary encoding of a string column.
+
+    Every distinct string gets the next integer code, ``None`` is encoded
+    as ``-1``.
+    """
+
+    def __init__(self):
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def code(self, value: Optional[str]) -> int:
+        """Returns the code of a string, adding it if it is new."""
+        if value is None:
+            return -1
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def lookup(self, value: str) -> int:
+        """Returns the code of a string, or -1 if it was never encoded."""
+        return self._codes.get(value, -1)
+
+    def __getitem__(self, code: int) -> Optional[str]:
+        return None if code < 0 else self.values[code]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def _column(typecode: str = "i"):
+    return field(default_factory=lambda: array(typecode))
+
+
+@dataclass
+class Columns:
+    """Base class of the column sets, one typed array per field."""
+
+    def __len__(self) -> int:
+        return len(getattr(self, fields(self)[0].name))
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Returns the columns as NumPy arrays sharing the array buffers.
+
+        Requires the ``numpy`` extra.
+
+        Returns:
+            The arrays by column name.
+        """
+        import numpy
+
+        return {
+            f.name: numpy.frombuffer(
+                getattr(self, f.name), dtype=getattr(self, f.name).typecode
+            )
+            for f in fields(self)
+        }
+
+
+@dataclass
+class KillColumns(Columns):
+    """One row per kill."""
+
+    match: array = _column()
+    """The code of the match id."""
+    round: array = _column()
+    time_in_round: array = _column()
+    """Milliseconds since the round started."""
+    time_in_match: array = _column()
+    killer: array = _column()
+    """The code of the killer puuid, -1 if unknown."""
+    killer_team: array = _column()
+    victim: array = _column()
+    victim_team: array = _column()
+    weapon: array = _column()
+    """The code of the weapon id, -1 if unknown."""
+    victim_x: array = _column()
+    victim_y: array = _column()
+    secondary_fire_mode: array = _column("b")
+
+
+@dataclass
+class DamageColumns(Columns):
+    """One row per damage event, i.e. per attacker, receiver and round."""
+
+    match: array = _column()
+    round: array = _column()
+    attacker: array = _column()
+    attacker_team: array = _column()
+    receiver: array = _column()
+    receiver_team: array = _column()
+    damage: array = _column()
+    headshots: array = _column()
+    bodyshots: array = _column()
+    legshots: array = _column()
+
+
+@dataclass
+class LocationColumns(Columns):
+    """One row per player location at the time of a kill."""
+
+    kill: array = _column()
+    """The row of the kill in :class:`KillColumns`."""
+    player: array = _column()
+    team: array = _column()
+    x: array = _column()
+    y: array = _column()
+    view_radians: array = _column("d")
+
+
+@dataclass
+class RoundStatsColumns(Columns):
+    """One row per player and round."""
+
+    match: array = _column()
+    round: array = _column()
+    player: array = _column()
+    team: array = _column()
+    kills: array = _column()
+    damage: array = _column()
+    score: array = _column()
+    headshots: array = _column()
+    bodyshots: array = _column()
+    legshots: array = _column()
+    loadout_value: array = _column()
+    spent: array = _column()
+    was_afk: array = _column("b")
+
+
+@dataclass
+class MatchColumns:
+    """The events of one or many matches as columns of typed arrays.
+
+    Strings are dictionary encoded: the columns hold integer codes into
+    the string tables, e.g. ``columns.players[code]`` is a puuid.
+    """
+
+    matches: StringTable = field(default_factory=StringTable)
+    """The match ids."""
+    players: StringTable = field(default_factory=StringTable)
+    """The puuids of the players."""
+    teams: StringTable = field(default_factory=StringTable)
+    weapons: StringTable = field(default_factory=StringTable)
+    """The weapon ids."""
+    kills: KillColumns = field(default_factory=KillColumns)
+    damage: DamageColumns = field(default_factory=DamageColumns)
+    locations: LocationColumns = field(default_factory=LocationColumns)
+    round_stats: RoundStatsColumns = field(default_factory=RoundStatsColumns)
+
+    def add(self, match: MatchHistoryPointV3) -> None:
+        """Appends the events of a match to the columns.
+
+        Args:
+            match: The match.
+        """
+        match_code = self.matches.code(match.metadata.matchid)
+        player_code = self.players.code
+        team_code = self.teams.code
+        kills, damage = self.kills, self.damage
+        locations, stats = self.locations, self.round_stats
+        for round_index, match_round in enumerate(match.rounds):
+            for player_stats in match_round.player_stats:
+                player = player_code(player_stats.player_puuid)
+                team = team_code(player_stats.player_team)
+
+                stats.match.append(match_code)
+                stats.round.append(round_index)
+                stats.player.append(player)
+                stats.team.append(team)
+                stats.kills.append(player_stats.kills)
+                stats.damage.append(player_stats.damage)
+                stats.score.append(player_stats.score)
+                stats.headshots.append(player_stats.headshots)
+                stats.bodyshots.append(player_stats.bodyshots)
+                stats.legshots.append(player_stats.legshots)
+                stats.loadout_value.append(player_stats.economy.loadout_value)
+                stats.spent.append(player_stats.economy.spent)
+                stats.was_afk.append(player_stats.was_afk)
+
+                for event in player_stats.damage_events:
+                    damage.match.append(match_code)
+                    damage.round.append(round_index)
+                    damage.attacker.append(player)
+                    damage.attacker_team.append(team)
+                    damage.receiver.append(player_code(event.receiver_puuid))
+                    damage.receiver_team.append(team_code(event.receiver_team))
+                    damage.damage.append(event.damage)
+                    damage.headshots.append(event.headshots)
+                    damage.bodyshots.append(event.bodyshots)
+                    damage.legshots.append(event.legshots)
+
+                for event in player_stats.kill_events:
+                    kill_row = len(kills.match)
+                    kills.match.append(match_code)
+                    kills.round.append(round_index)
+                    kills.time_in_round.append(event.kill_time_in_round)
+                    kills.time_in_match.append(event.kill_time_in_match)
+                    kills.killer.append(player_code(event.killer_puuid))
+                    kills.killer_team.append(team_code(event.killer_team))
+                    kills.victim.append(player_code(event.victim_puuid))
+                    kills.victim_team.append(team_code(event.victim_team))
+                    kills.weapon.append(self.weapons.code(event.damage_weapon_id))
+                    kills.victim_x.append(event.victim_death_location.x)
+                    kills.victim_y.append(event.victim_death_location.y)
+                    kills.secondary_fire_mode.append(event.secondary_fire_mode)
+
+                    for location in event.player_locations_on_kill:
+                        locations.kill.append(kill_row)
+                        locations.player.append(player_code(location.player_puuid))
+                        locations.team.append(team_code(location.player_team))
+                        locations.x.append(location.location.x)
+                        locations.y.append(location.location.y)
+                        locations.view_radians.append(location.view_radians)
+
+
+def match_columns(
+    matches: Union[MatchHistoryPointV3, Iterable[MatchHistoryPointV3]]
+) -> MatchColumns:
+    """Converts matches into columns of typed arrays.
+
+    The columns are :mod:`array` arrays, which
+    :meth:`Columns.to_numpy` turns into NumPy arrays without copying.
+
+    Args:
+        matches: A match or an iterable of matches, e.g. the results of
+            :func:`valo_api.get_match_history_by_puuid`.
+
+    Returns:
+        The columns of all matches, sharing one set of string tables.
+    """
+    columns = MatchColumns()
+    if isinstance(matches, MatchHistoryPointV3):
+        matches = [matches]
+    for match in matches:
+        columns.add(match)
+    return columns
@@ -0,0 +1,312 @@
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
+
+import asyncio
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+
+from valo_api.config import Config
+from valo_api.endpoints_config import EndpointsConfig
+from valo_api.exceptions.rate_limit import RateLimit
+from valo_api.responses.match_history import MatchHistoryPointV3
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+@dataclass
+class BulkResult(Generic[T]):
+    """The result of one item of a bulk request."""
+
+    key: Hashable
+    """The item the result belongs to, e.g. the match id."""
+    value: Optional[T] = None
+    """The result, None if the request failed."""
+    error: Optional[Exception] = None
+    """The error of a failed request."""
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _rate_limit_delay(client) -> float:
+    if client is not None and client.rate_limiter is not None:
+        return 0
+    return RateLimit().reset if RateLimit.remaining == 0 else 0
+
+
+def _timed_out(key: K, timeout: Optional[float]) -> BulkResult:
+    return BulkResult(key, error=TimeoutError(f"{key} did not finish in {timeout}s"))
+
+
+def run_many(
+    function: Callable[[K], T],
+    keys: Iterable[K],
+    concurrency: int = 8,
+    client=None,
+    timeout: Optional[float] = None,
+) -> Iterator[BulkResult[T]]:
+    """Calls ``function`` for every key on a thread pool.
+
+    Results are yielded as they complete, a failing key does not abort the
+    others. While the API rate limit is exhausted no new calls are started.
+
+    Args:
+        function: The function to call with each key.
+        keys: The keys.
+        concurrency: The maximum number of calls in flight.
+        client: The client the calls use, its rate limiter replaces the
+            global rate limit state.
+        timeout: Seconds after which the keys not finished yet get a
+            :class:`TimeoutError` result. Running calls are not interrupted,
+            but their results are discarded.
+
+    Returns:
+        An iterator over the results in completion order.
+    """
+
+    def call(key: K) -> BulkResult[T]:
+        try:
+            return BulkResult(key, value=function(key))
+        except Exception as e:
+            return BulkResult(key, error=e)
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    executor = ThreadPoolExecutor(concurrency)
+    pending: Dict[Future, K] = {}
+    keys = iter(keys)
+    try:
+        while True:
+            for key in keys:
+                delay = _rate_limit_delay(client)
+                if delay > 0:
+                    time.sleep(delay)
+                pending[executor.submit(call, key)] = key
+                if len(pending) >= concurrency:
+                    break
+            if not pending:
+                break
+            remaining = None if deadline is None else deadline - time.monotonic()
+            done, _ = wait(pending, remaining, FIRST_COMPLETED)
+            if not done:
+                for key in [*pending.values(), *keys]:
+                    yield _timed_out(key, timeout)
+                break
+            for future in done:
+                del pending[future]
+                yield future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_many_async(
+    function: Callable[[K], Awaitable[T]],
+    keys: Iterable[K],
+    concurrency: int = 8,
+    client=None,
+    timeout: Optional[float] = None,
+) -> AsyncIterator[BulkResult[T]]:
+    """Awaits ``function`` for every key with at most ``concurrency`` tasks.
+
+    Results are yielded as they complete, a failing key does not abort the
+    others. While the API rate limit is exhausted no new calls are started.
+
+    Args:
+        function: The coroutine function to call with each key.
+        keys: The keys, read as calls finish.
+        concurrency: The maximum number of calls in flight.
+        client: The client the calls use, its rate limiter replaces the
+            global rate limit state.
+        timeout: Seconds after which the keys not finished yet are cancelled
+            and get a :class:`TimeoutError` result.
+
+    Returns:
+        An asynchronous iterator over the results in completion order.
+    """
+
+    async def call(key: K) -> BulkResult[T]:
+        try:
+            return BulkResult(key, value=await function(key))
+        except Exception as e:
+            return BulkResult(key, error=e)
+
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    pending: Dict[asyncio.Future, K] = {}
+    keys = iter(keys)
+    try:
+        while True:
+            for key in keys:
+                delay = _rate_limit_delay(client)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                pending[asyncio.ensure_future(call(key))] = key
+                if len(pending) >= concurrency:
+                    break
+            if not pending:
+                break
+            remaining = None if deadline is None else deadline - loop.time()
+            done, _ = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                for key in [*pending.values(), *keys]:
+                    yield _timed_out(key, timeout)
+                break
+            for task in done:
+                del pending[task]
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def _fan_out_results(
+    regions: List[str], results: Iterable[BulkResult[T]]
+) -> Dict[str, BulkResult[T]]:
+    by_region = {result.key: result for result in results}
+    return {region: by_region[region] for region in regions}
+
+
+def fan_out(
+    function: Callable[..., T],
+    regions: Iterable[str] = Config.ALL_REGIONS,
+    deadline: Optional[float] = None,
+    client=None,
+    **kwargs,
+) -> Dict[str, BulkResult[T]]:
+    """Calls a region-scoped endpoint function for several regions at once.
+
+    Example::
+
+        results = fan_out(valo_api.get_status, version="v1", deadline=5)
+        up = {region: r.value for region, r in results.items() if r.ok}
+
+    Args:
+        function: The endpoint function, e.g. ``valo_api.get_status``. It is
+            called with ``region`` and ``kwargs``.
+        regions: The regions.
+        deadline: Seconds after which the regions without a response get a
+            :class:`TimeoutError` result.
+        client: The :class:`valo_api.client.ValoClient` to use.
+        **kwargs: The other arguments of the endpoint function.
+
+    Returns:
+        The :class:`BulkResult` of every region, in the order of ``regions``.
+    """
+    regions = list(dict.fromkeys(regions))
+    if client is not None:
+        kwargs["client"] = client
+    results = run_many(
+        lambda region: function(region=region, **kwargs),
+        regions,
+        max(len(regions), 1),
+        client,
+        deadline,
+    )
+    return _fan_out_results(regions, results)
+
+
+async def fan_out_async(
+    function: Callable[..., Awaitable[T]],
+    regions: Iterable[str] = Config.ALL_REGIONS,
+    deadline: Optional[float] = None,
+    client=None,
+    **kwargs,
+) -> Dict[str, BulkResult[T]]:
+    """Asynchronous version of :func:`fan_out`.
+
+    Args:
+        function: The asynchronous endpoint function, e.g.
+            ``valo_api.get_status_async``.
+        regions: The regions.
+        deadline: Seconds after which the pending regions are cancelled and
+            get a :class:`TimeoutError` result.
+        client: The :class:`valo_api.client.AsyncValoClient` to use.
+        **kwargs: The other arguments of the endpoint function.
+
+    Returns:
+        The :class:`BulkResult` of every region, in the order of ``regions``.
+    """
+    regions = list(dict.fromkeys(regions))
+    if client is not None:
+        kwargs["client"] = client
+    results = run_many_async(
+        lambda region: function(region=region, **kwargs),
+        regions,
+        max(len(regions), 1),
+        client,
+        deadline,
+    )
+    return _fan_out_results(regions, [result async for result in results])
+
+
+def get_match_details_many(
+    match_ids: Iterable[str],
+    concurrency: int = 8,
+    version: str = "v2",
+    client=None,
+) -> Iterator[BulkResult[MatchHistoryPointV3]]:
+    """Fetches many matches from the API on a thread pool.
+
+    Args:
+        match_ids: The ids of the matches.
+        concurrency: The maximum number of requests in flight.
+        version: The version of the match details endpoint.
+        client: The :class:`valo_api.client.ValoClient` to use.
+
+    Returns:
+        An iterator over :class:`BulkResult` objects, keyed by match id, in
+        completion order.
+    """
+    endpoint = EndpointsConfig.MATCH_DETAILS.value
+    return run_many(
+        lambda match_id: endpoint._get_endpoint(
+            version=version, match_id=match_id, client=client
+        ),
+        match_ids,
+        concurrency,
+        client,
+    )
+
+
+def get_match_details_many_async(
+    match_ids: Iterable[str],
+    concurrency: int = 8,
+    version: str = "v2",
+    client=None,
+) -> AsyncIterator[BulkResult[MatchHistoryPointV3]]:
+    """Fetches many matches from the API concurrently.
+
+    Args:
+        match_ids: The ids of the matches.
+        concurrency: The maximum number of requests in flight.
+        version: The version of the match details endpoint.
+        client: The :class:`valo_api.client.AsyncValoClient` to use.
+
+    Returns:
+        An asynchronous iterator over :class:`BulkResult` objects, keyed by
+        match id, in completion order.
+    """
+    endpoint = EndpointsConfig.MATCH_DETAILS.value
+    return run_many_async(
+        lambda match_id: endpoint._get_endpoint_async(
+            version=version, match_id=match_id, client=client
+        ),
+        match_ids,
+        concurrency,
+        client,
+    )
@@ -0,0 +1,341 @@
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
+
+import abc
+import asyncio
+import functools
+import importlib.util
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import valo_api.endpoints as endpoints
+from valo_api.bulk import (
+    BulkResult,
+    fan_out,
+    fan_out_async,
+    get_match_details_many,
+    get_match_details_many_async,
+)
+from valo_api.content import (
+    ContentIndex,
+    LocalizedContent,
+    get_content_all_locales,
+    get_content_all_locales_async,
+    get_content_index,
+    get_content_index_async,
+)
+from valo_api.pagination import iter_lifetime_matches, iter_lifetime_matches_async
+from valo_api.responses.lifetime_match import LifetimeMatchV1
+from valo_api.responses.match_history import MatchHistoryPointV3
+from valo_api.utils.cache import ResponseCache
+from valo_api.utils.identity import IdentityCache
+from valo_api.utils.interning import INTERN_MODES
+from valo_api.utils.rate_limiter import RateLimiter
+from valo_api.utils.retry import RetryPolicy
+from valo_api.utils.single_flight import SingleFlight
+
+if TYPE_CHECKING:
+    import aiohttp
+
+try:
+    import brotli  # noqa: F401
+
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+
+        _ACCEPT_ENCODING = "gzip, deflate, br"
+    except ImportError:
+        _ACCEPT_ENCODING = "gzip, deflate"
+
+
+def _intern_mode(mode: Optional[str]) -> Optional[str]:
+    if mode is not None and mode not in INTERN_MODES:
+        raise ValueError(f"intern_strings must be one of {', '.join(INTERN_MODES)}")
+    return mode
+
+
+class _BaseClient(abc.ABC):
+    @abc.abstractmethod
+    def _is_endpoint(self, name: str) -> bool:
+        """Whether an endpoint function can be called on this client."""
+
+    def __getattr__(self, name: str) -> Callable:
+        if name.startswith("_") or not self._is_endpoint(name):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        function = getattr(endpoints, name)
+        bound = functools.partial(function, client=self)
+        functools.update_wrapper(bound, function)
+        setattr(self, name, bound)
+        return bound
+
+    def __dir__(self) -> List[str]:
+        return sorted(
+            set(super().__dir__())
+            | {n for n in endpoints.function_names if self._is_endpoint(n)}
+        )
+
+
+class ValoClient(_BaseClient):
+    """Synchronous API client that owns its :class:`requests.Session`.
+
+    Every synchronous endpoint function is available as a method, e.g.
+    ``client.get_account_details_by_name(...)``. A client can be shared
+    between the threads of a :class:`concurrent.futures.ThreadPoolExecutor`,
+    ``pool_maxsize`` should be at least the number of threads.
+
+    Example::
+
+        with ValoClient(pool_maxsize=32) as client:
+            client.get_status("v1", "eu")
+
+    Args:
+        pool_connections: The number of connection pools to cache.
+        pool_maxsize: The number of connections kept alive per pool.
+        pool_block: Whether to wait for a free connection when the pool is full.
+        compression: Whether to accept compressed (gzip, and br if a brotli
+            package is installed) responses.
+        timeout: The timeout of a request in seconds.
+        rate_limiter: Paces the requests to the API rate limit, can be shared
+            with other clients.
+        retry_policy: Retries failed requests.
+        cache: Caches the responses of endpoints with a ``cache_ttl``.
+        coalesce: Whether concurrent identical GET requests share one request
+            and its decoded result.
+        compact_locations: Whether the player locations of matches are
+            packed into arrays, see
+            :func:`valo_api.utils.packed_locations.pack_locations`, and encoded
+            with :func:`valo_api.utils.packed_locations.enc_hook`.
+        intern_strings: Shares equal strings of a result, per ``"match"`` or
+            per ``"process"``, see :func:`valo_api.utils.interning.intern_strings`.
+        identity_cache: Learns the puuids of Riot IDs from the results and
+            sends ``*_by_name`` requests of known players to the
+            ``*_by_puuid`` endpoints, can be shared with other clients.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 32,
+        pool_block: bool = False,
+        compression: bool = True,
+        timeout: Optional[float] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = False,
+        compact_locations: bool = False,
+        intern_strings: Optional[str] = None,
+        identity_cache: Optional[IdentityCache] = None,
+    ):
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.cache = cache
+        self.single_flight = SingleFlight() if coalesce else None
+        self.compact_locations = compact_locations
+        self.intern_strings = _intern_mode(intern_strings)
+        self.identity_cache = identity_cache
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["Accept-Encoding"] = (
+            _ACCEPT_ENCODING if compression else "identity"
+        )
+
+    def close(self):
+        """Closes the session and all pooled connections."""
+        self.session.close()
+
+    def get_match_details_many(
+        self, match_ids: Iterable[str], concurrency: int = 8, version: str = "v2"
+    ) -> Iterator[BulkResult[MatchHistoryPointV3]]:
+        """See :func:`valo_api.bulk.get_match_details_many`."""
+        return get_match_details_many(match_ids, concurrency, version, self)
+
+    def fan_out(self, function: Callable, **kwargs) -> Dict[str, BulkResult]:
+        """See :func:`valo_api.bulk.fan_out`."""
+        return fan_out(function, client=self, **kwargs)
+
+    def iter_lifetime_matches(self, region: str, **kwargs) -> Iterator[LifetimeMatchV1]:
+        """See :func:`valo_api.pagination.iter_lifetime_matches`."""
+        return iter_lifetime_matches(region, client=self, **kwargs)
+
+    def get_content_index(self, locale: Optional[str] = None, **kwargs) -> ContentIndex:
+        """See :func:`valo_api.content.get_content_index`."""
+        return get_content_index(locale, client=self, **kwargs)
+
+    def get_content_all_locales(self, **kwargs) -> LocalizedContent:
+        """See :func:`valo_api.content.get_content_all_locales`."""
+        return get_content_all_locales(client=self, **kwargs)
+
+    def __enter__(self) -> "ValoClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _is_endpoint(self, name: str) -> bool:
+        return not name.endswith("_async") and name in endpoints.function_names
+
+
+if importlib.util.find_spec("aiohttp") is not None:
+
+    class AsyncValoClient(_BaseClient):
+        """Asynchronous API client that owns its :class:`aiohttp.ClientSession`.
+
+        Every ``*_async`` endpoint function is available as a method, e.g.
+        ``await client.get_account_details_by_name_async(...)``.
+        The session is created on first use and is bound to that event loop.
+
+        Example::
+
+            async with AsyncValoClient(limit_per_host=50) as client:
+                await client.get_status_async("v1", "eu")
+
+        Args:
+            limit: The total number of simultaneous connections.
+            limit_per_host: The number of simultaneous connections to one host.
+            keepalive_timeout: Seconds an idle connection is kept alive.
+            ttl_dns_cache: Seconds a DNS lookup is cached.
+            timeout: The total timeout of a request in seconds, None for the
+                defaults of aiohttp.
+            rate_limiter: Paces the requests to the API rate limit, can be
+                shared with other clients.
+            retry_policy: Retries failed requests.
+            cache: Caches the responses of endpoints with a ``cache_ttl``.
+            coalesce: Whether concurrent identical GET requests share one request
+                and its decoded result.
+            compact_locations: Whether the player locations of matches are
+                packed into arrays, see
+                :func:`valo_api.utils.packed_locations.pack_locations`, and encoded
+                with :func:`valo_api.utils.packed_locations.enc_hook`.
+            intern_strings: Shares equal strings of a result, per ``"match"``
+                or per ``"process"``, see
+                :func:`valo_api.utils.interning.intern_strings`.
+            identity_cache: Learns the puuids of Riot IDs from the results and
+                sends ``*_by_name`` requests of known players to the
+                ``*_by_puuid`` endpoints, can be shared with other clients.
+        """
+
+        def __init__(
+            self,
+            limit: int = 100,
+            limit_per_host: int = 30,
+            keepalive_timeout: float = 30.0,
+            ttl_dns_cache: Optional[int] = 300,
+            timeout: Optional[float] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            cache: Optional[ResponseCache] = None,
+            coalesce: bool = False,
+            compact_locations: bool = False,
+            intern_strings: Optional[str] = None,
+            identity_cache: Optional[IdentityCache] = None,
+        ):
+            self.limit = limit
+            self.limit_per_host = limit_per_host
+            self.keepalive_timeout = keepalive_timeout
+            self.ttl_dns_cache = ttl_dns_cache
+            self.timeout = timeout
+            self.rate_limiter = rate_limiter
+            self.retry_policy = retry_policy
+            self.cache = cache
+            self.single_flight = SingleFlight() if coalesce else None
+            self.compact_locations = compact_locations
+            self.intern_strings = _intern_mode(intern_strings)
+            self.identity_cache = identity_cache
+            self._session: Optional["aiohttp.ClientSession"] = None
+            self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        @property
+        def session(self) -> "aiohttp.ClientSession":
+            """The session of this client, created on first access."""
+            loop = asyncio.get_running_loop()
+            if self._session is None or self._session.closed:
+                import aiohttp
+
+                connector = aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                    ttl_dns_cache=self.ttl_dns_cache,
+                    use_dns_cache=self.ttl_dns_cache is not None,
+                )
+                timeout = (
+                    aiohttp.client.DEFAULT_TIMEOUT
+                    if self.timeout is None
+                    else aiohttp.ClientTimeout(total=self.timeout)
+                )
+                self._session = aiohttp.ClientSession(
+                    connector=connector, timeout=timeout
+                )
+                self._loop = loop
+            elif self._loop is not loop:
+                raise RuntimeError(
+                    "AsyncValoClient is bound to a different event loop, "
+                    "close it before using it on another loop"
+                )
+            return self._session
+
+        async def close(self):
+            """Closes the session and all pooled connections."""
+            if self._session is not None and not self._session.closed:
+                await self._session.close()
+            self._session = None
+            self._loop = None
+
+        def get_match_details_many_async(
+            self, match_ids: Iterable[str], concurrency: int = 8, version: str = "v2"
+        ) -> AsyncIterator[BulkResult[MatchHistoryPointV3]]:
+            """See :func:`valo_api.bulk.get_match_details_many_async`."""
+            return get_match_details_many_async(match_ids, concurrency, version, self)
+
+        async def fan_out_async(
+            self, function: Callable, **kwargs
+        ) -> Dict[str, BulkResult]:
+            """See :func:`valo_api.bulk.fan_out_async`."""
+            return await fan_out_async(function, client=self, **kwargs)
+
+        def iter_lifetime_matches_async(
+            self, region: str, **kwargs
+        ) -> AsyncIterator[LifetimeMatchV1]:
+            """See :func:`valo_api.pagination.iter_lifetime_matches_async`."""
+            return iter_lifetime_matches_async(region, client=self, **kwargs)
+
+        async def get_content_index_async(
+            self, locale: Optional[str] = None, **kwargs
+        ) -> ContentIndex:
+            """See :func:`valo_api.content.get_content_index_async`."""
+            return await get_content_index_async(locale, client=self, **kwargs)
+
+        async def get_content_all_locales_async(self, **kwargs) -> LocalizedContent:
+            """See :func:`valo_api.content.get_content_all_locales_async`."""
+            return await get_content_all_locales_async(client=self, **kwargs)
+
+        async def __aenter__(self) -> "AsyncValoClient":
+            _ = self.session
+            return self
+
+        async def __aexit__(self, exc_type, exc_val, exc_tb):
+            await self.close()
+
+        def _is_endpoint(self, name: str) -> bool:
+            return name.endswith("_async") and name in endpoints.function_names
@@ -0,0 +1,567 @@
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import contextlib
+import mmap
+import os
+import re
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+
+import msgspec
+
+from valo_api.bulk import BulkResult, run_many, run_many_async
+from valo_api.config import Config
+from valo_api.endpoints_config import EndpointsConfig
+from valo_api.responses.content import Act, ContentV1, Entity
+
+ContentItem = Union[Entity, Act]
+
+CATEGORIES: Tuple[str, ...] = tuple(
+    name for name in ContentV1.__struct_fields__ if name != "version"
+)
+"""The fields of :class:`ContentV1` holding entity lists."""
+
+
+def _iter_items(
+    content: ContentV1, categories: Sequence[str] = CATEGORIES
+) -> Iterator[Tuple[str, ContentItem]]:
+    for category in categories:
+        for item in getattr(content, category) or ():
+            yield category, item
+
+
+class ContentIndex:
+    """Constant time lookups into a :class:`ContentV1`.
+
+    The index is built once per content version, :meth:`update` only
+    rebuilds it when ``ContentV1.version`` changed. Names are matched case
+    insensitively, optionally within one category (a field of
+    :class:`ContentV1`, e.g. ``"skins"``).
+
+    Args:
+        content: The content to index.
+    """
+
+    def __init__(self, content: Optional[ContentV1] = None):
+        self.content: Optional[ContentV1] = None
+        self._lock = threading.Lock()
+        self._clear()
+        if content is not None:
+            self.update(content)
+
+    @property
+    def version(self) -> Optional[str]:
+        return self.content.version if self.content is not None else None
+
+    def _clear(self):
+        self._by_id: Dict[str, ContentItem] = {}
+        self._categories: Dict[str, str] = {}
+        self._by_asset_path: Dict[str, ContentItem] = {}
+        self._by_name: Dict[Tuple[Optional[str], str], ContentItem] = {}
+        self._by_localized_name: Dict[
+            str, Dict[Tuple[Optional[str], str], ContentItem]
+        ] = {}
+
+    def update(self, content: ContentV1) -> bool:
+        """Indexes ``content`` unless its version is already indexed.
+
+        Args:
+            content: The content.
+
+        Returns:
+            Whether the index was rebuilt.
+        """
+        with self._lock:
+            if self.content is not None and content.version == self.content.version:
+                return False
+            self._clear()
+            self.content = content
+            for category, item in self.items():
+                self._by_id.setdefault(item.id, item)
+                self._categories.setdefault(item.id, category)
+                if getattr(item, "assetPath", None):
+                    self._by_asset_path.setdefault(item.assetPath.casefold(), item)
+                name = item.name.casefold()
+                self._by_name.setdefault((category, name), item)
+                self._by_name.setdefault((None, name), item)
+            return True
+
+    def items(
+        self, category: Optional[str] = None
+    ) -> Iterator[Tuple[str, ContentItem]]:
+        """Iterates over the indexed items.
+
+        Args:
+            category: Only iterate over this category.
+
+        Returns:
+            An iterator over ``(category, item)`` pairs.
+        """
+        if self.content is None:
+            return iter(())
+        if category is not None:
+            return _iter_items(self.content, (category,))
+        return _iter_items(self.content)
+
+    def get(self, id: str) -> Optional[ContentItem]:
+        """Returns the item with an id."""
+        return self._by_id.get(id)
+
+    def category(self, id: str) -> Optional[str]:
+        """Returns the category of the item with an id."""
+        return self._categories.get(id)
+
+    def by_asset_path(self, asset_path: str) -> Optional[ContentItem]:
+        """Returns the item with an asset path, ignoring case."""
+        return self._by_asset_path.get(asset_path.casefold())
+
+    def by_name(
+        self,
+        name: str,
+        category: Optional[str] = None,
+        locale: Optional[str] = None,
+    ) -> Optional[ContentItem]:
+        """Returns the item with a name, ignoring case.
+
+        Args:
+            name: The name.
+            category: Only search this category.
+            locale: Search the names of this locale in ``localizedNames``
+                instead of ``name``.
+
+        Returns:
+            The first item with the name, or None.
+        """
+        if locale is None:
+            return self._by_name.get((category, name.casefold()))
+        return self._localized(locale).get((category, name.casefold()))
+
+    def localized_name(self, id: str, locale: str) -> Optional[str]:
+        """Returns the name of an item in a locale.
+
+        Args:
+            id: The id of the item.
+            locale: The locale, e.g. ``"de-DE"``.
+
+        Returns:
+            The localized name, or None if the item or locale is unknown.
+        """
+        item = self._by_id.get(id)
+        if item is None or not item.localizedNames:
+            return None
+        names = item.localizedNames
+        return names.get(locale) or _casefold_keys(names).get(locale.casefold())
+
+    def _localized(self, locale: str) -> Dict[Tuple[Optional[str], str], ContentItem]:
+        locale = locale.casefold()
+        try:
+            return self._by_localized_name[locale]
+        except KeyError:
+            pass
+        with self._lock:
+            names: Dict[Tuple[Optional[str], str], ContentItem] = {}
+            for category, item in self.items():
+                name = _casefold_keys(item.localizedNames or {}).get(locale)
+                if name is not None:
+                    names.setdefault((category, name.casefold()), item)
+                    names.setdefault((None, name.casefold()), item)
+            return self._by_localized_name.setdefault(locale, names)
+
+    def __contains__(self, id: str) -> bool:
+        return id in self._by_id
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+
+def _casefold_keys(names: Dict[str, str]) -> Dict[str, str]:
+    return {k.casefold(): v for k, v in names.items()}
+
+
+_snapshot_encoder = msgspec.msgpack.Encoder()
+_snapshot_decoder = msgspec.msgpack.Decoder(ContentV1)
+
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^\w.]+", "_", value.casefold())
+
+
+_SNAPSHOT_SUFFIX = ".valo-content.msgpack"
+# Slugs never contain "-", so a locale cannot match the files of another one.
+_SNAPSHOT_NAME = re.compile(
+    r"content-(?P<locale>[\w.]+)-[\w.]+" + re.escape(_SNAPSHOT_SUFFIX)
+)
+_SNAPSHOT_TMP = re.compile(
+    r"content-[\w.]+-\w+" + re.escape(_SNAPSHOT_SUFFIX) + r"\.tmp"
+)
+_STALE_TMP_AGE = 60 * 60
+
+
+class ContentSnapshot:
+    """Keeps decoded content in local MessagePack files.
+
+    There is one file per content version and locale. Files are loaded
+    through :mod:`mmap` and decoded straight into :class:`ContentV1`, which
+    takes milliseconds instead of fetching and decoding the JSON payload.
+    The directory can be shared, only files ending in ``.valo-content.msgpack``
+    are touched.
+
+    Args:
+        directory: The directory of the snapshot files, created if missing.
+        max_age: Seconds after which a snapshot is stale and the content is
+            fetched again to pick up a new version.
+    """
+
+    def __init__(self, directory: str, max_age: float = 24 * 60 * 60):
+        self.directory = directory
+        self.max_age = max_age
+
+    def path(self, version: str, locale: Optional[str] = None) -> str:
+        """Returns the file of a content version and locale."""
+        name = f"content-{self._locale(locale)}-{_slug(version)}{_SNAPSHOT_SUFFIX}"
+        return os.path.join(self.directory, name)
+
+    @staticmethod
+    def _locale(locale: Optional[str]) -> str:
+        return _slug(locale) if locale else "all"
+
+    def _names(self) -> List[str]:
+        try:
+            return os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+
+    def _paths(self, locale: Optional[str]) -> List[str]:
+        locale = self._locale(locale)
+        paths = []
+        for name in self._names():
+            match = _SNAPSHOT_NAME.fullmatch(name)
+            if match is not None and match["locale"] == locale:
+                paths.append(os.path.join(self.directory, name))
+        return sorted(paths, key=os.path.getmtime, reverse=True)
+
+    def _remove_tmp(self, min_age: float = 0):
+        """Deletes temporary files left behind by interrupted saves."""
+        for name in self._names():
+            if _SNAPSHOT_TMP.fullmatch(name):
+                path = os.path.join(self.directory, name)
+                with contextlib.suppress(OSError):
+                    if time.time() - os.path.getmtime(path) >= min_age:
+                        os.unlink(path)
+
+    def fresh(self, version: str, locale: Optional[str] = None) -> bool:
+        """Returns whether a version is stored and younger than ``max_age``."""
+        try:
+            age = time.time() - os.path.getmtime(self.path(version, locale))
+        except OSError:
+            return False
+        return age < self.max_age
+
+    def save(self, content: ContentV1, locale: Optional[str] = None) -> str:
+        """Stores content, replacing the snapshots of older versions.
+
+        Args:
+            content: The content.
+            locale: The locale the content was fetched with.
+
+        Returns:
+            The path of the snapshot file.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(content.version, locale)
+        fd, tmp = tempfile.mkstemp(
+            dir=self.directory,
+            prefix=f"content-{self._locale(locale)}-",
+            suffix=f"{_SNAPSHOT_SUFFIX}.tmp",
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_snapshot_encoder.encode(content))
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        for old in self._paths(locale):
+            if old != path:
+                os.unlink(old)
+        # Younger files may belong to a save in progress.
+        self._remove_tmp(_STALE_TMP_AGE)
+        return path
+
+    def load(
+        self, locale: Optional[str] = None, version: Optional[str] = None
+    ) -> Optional[ContentV1]:
+        """Loads stored content.
+
+        Args:
+            locale: The locale the content was fetched with.
+            version: The content version, defaults to the newest snapshot
+                that is younger than ``max_age``.
+
+        Returns:
+            The content, or None if there is no (fresh) snapshot.
+        """
+        if version is not None:
+            path = self.path(version, locale)
+        else:
+            paths = self._paths(locale)
+            if not paths or time.time() - os.path.getmtime(paths[0]) >= self.max_age:
+                return None
+            path = paths[0]
+        try:
+            with open(path, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as data:
+                return _snapshot_decoder.decode(data)
+        except (OSError, ValueError, msgspec.DecodeError):
+            return None
+
+    def clear(self):
+        """Deletes all snapshots and temporary files."""
+        for name in self._names():
+            if _SNAPSHOT_NAME.fullmatch(name):
+                os.unlink(os.path.join(self.directory, name))
+        self._remove_tmp()
+
+
+_indexes: Dict[Optional[str], ContentIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def _shared_index(locale: Optional[str]) -> ContentIndex:
+    key = locale.casefold() if locale else None
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = ContentIndex()
+        return index
+
+
+def _from_snapshot(
+    snapshot: Optional[ContentSnapshot], index: ContentIndex, locale: Optional[str]
+) -> Optional[ContentV1]:
+    if snapshot is None:
+        return None
+    if index.content is not None and snapshot.fresh(index.version, locale):
+        return index.content
+    return snapshot.load(locale)
+
+
+def get_content_index(
+    locale: Optional[str] = None,
+    version: str = "v1",
+    client=None,
+    snapshot: Optional[ContentSnapshot] = None,
+) -> ContentIndex:
+    """Fetches the content and returns the shared index of a locale.
+
+    The index is kept per locale and only rebuilt when the content version
+    changed. With a client that caches responses the content itself is not
+    fetched again while its cache entry is fresh.
+
+    Args:
+        locale: The locale of the content, None for all localized names.
+        version: The version of the content endpoint.
+        client: The :class:`valo_api.client.ValoClient` to use.
+        snapshot: Loads the content from a fresh snapshot instead of the
+            API, fetched content is stored in it.
+
+    Returns:
+        The content index.
+    """
+    index = _shared_index(locale)
+    content = _from_snapshot(snapshot, index, locale)
+    if content is None:
+        content = EndpointsConfig.CONTENT.value._get_endpoint(
+            version=version, locale=locale, client=client
+        )
+        if snapshot is not None:
+            snapshot.save(content, locale)
+    index.update(content)
+    return index
+
+
+async def get_content_index_async(
+    locale: Optional[str] = None,
+    version: str = "v1",
+    client=None,
+    snapshot: Optional[ContentSnapshot] = None,
+) -> ContentIndex:
+    """Fetches the content asynchronously and returns the shared index.
+
+    See :func:`get_content_index`.
+
+    Args:
+        locale: The locale of the content, None for all localized names.
+        version: The version of the content endpoint.
+        client: The :class:`valo_api.client.AsyncValoClient` to use.
+        snapshot: Loads the content from a fresh snapshot instead of the
+            API, fetched content is stored in it.
+
+    Returns:
+        The content index.
+    """
+    index = _shared_index(locale)
+    content = _from_snapshot(snapshot, index, locale)
+    if content is None:
+        content = await EndpointsConfig.CONTENT.value._get_endpoint_async(
+            version=version, locale=locale, client=client
+        )
+        if snapshot is not None:
+            snapshot.save(content, locale)
+    index.update(content)
+    return index
+
+
+NAMES_PROJECTION: Tuple[str, ...] = ("version",) + tuple(
+    f"{category}.{name}" for category in CATEGORIES for name in ("id", "name")
+)
+"""Decodes only the ids and names of the content entities."""
+
+
+@dataclass
+class LocalizedContent:
+    """The content of several locales, merged into one structure.
+
+    The entities are decoded once from the base locale, the other locales
+    only contribute a name table, aligned with the entity ids.
+    """
+
+    content: ContentV1
+    """The content of the base locale."""
+    ids: List[str] = field(default_factory=list)
+    """The ids of all entities, in field order."""
+    names: Dict[str, List[Optional[str]]] = field(default_factory=dict)
+    """The names of the entities per locale, aligned with :attr:`ids`."""
+    _positions: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        if not self.ids:
+            self.ids = [item.id for _, item in _iter_items(self.content)]
+        for position, id in enumerate(self.ids):
+            self._positions.setdefault(id, position)
+
+    @property
+    def locales(self) -> List[str]:
+        return list(self.names)
+
+    def add_locale(self, locale: str, content: ContentV1):
+        """Adds the names of the content of a locale.
+
+        Args:
+            locale: The locale.
+            content: The content fetched in that locale, only the ids and
+                names are used.
+        """
+        names: List[Optional[str]] = [None] * len(self.ids)
+        for _, item in _iter_items(content):
+            position = self._positions.get(item.id)
+            if position is not None and names[position] is None:
+                names[position] = item.name
+        self.names[locale] = names
+
+    def name(self, id: str, locale: str) -> Optional[str]:
+        """Returns the name of an entity in a locale, or None if unknown."""
+        position = self._positions.get(id)
+        names = self.names.get(locale)
+        if position is None or names is None:
+            return None
+        return names[position]
+
+    def localized_names(self, id: str) -> Dict[str, str]:
+        """Returns the names of an entity in all locales."""
+        position = self._positions.get(id)
+        if position is None:
+            return {}
+        return {
+            locale: names[position]
+            for locale, names in self.names.items()
+            if names[position] is not None
+        }
+
+
+def _merge(locales: Sequence[str], results: Dict[str, BulkResult]) -> LocalizedContent:
+    for result in results.values():
+        if not result.ok:
+            raise result.error
+    merged = LocalizedContent(results[locales[0]].value)
+    for locale in locales:
+        merged.add_locale(locale, results[locale].value)
+    return merged
+
+
+def get_content_all_locales(
+    locales: Sequence[str] = Config.ALL_LOCALS,
+    base_locale: str = "en-US",
+    concurrency: int = 8,
+    version: str = "v1",
+    client=None,
+) -> LocalizedContent:
+    """Fetches the content in several locales concurrently and merges it.
+
+    Only the content of ``base_locale`` is fully decoded, the other locales
+    are decoded with :data:`NAMES_PROJECTION` into per-locale name tables.
+
+    Args:
+        locales: The locales to fetch.
+        base_locale: The locale of the entities, fetched in any case.
+        concurrency: The maximum number of requests in flight.
+        version: The version of the content endpoint.
+        client: The :class:`valo_api.client.ValoClient` to use.
+
+    Returns:
+        The merged content.
+
+    Raises:
+        ValoAPIException: If the content of a locale could not be fetched.
+    """
+    endpoint = EndpointsConfig.CONTENT.value
+    keys = list(dict.fromkeys((base_locale, *locales)))
+
+    def fetch(locale: str) -> ContentV1:
+        projection = None if locale == base_locale else NAMES_PROJECTION
+        return endpoint._get_endpoint(
+            version=version, locale=locale, client=client, projection=projection
+        )
+
+    results = {r.key: r for r in run_many(fetch, keys, concurrency, client)}
+    return _merge(keys, results)
+
+
+async def get_content_all_locales_async(
+    locales: Sequence[str] = Config.ALL_LOCALS,
+    base_locale: str = "en-US",
+    concurrency: int = 8,
+    version: str = "v1",
+    client=None,
+) -> LocalizedContent:
+    """Fetches the content in several locales concurrently and merges it.
+
+    See :func:`get_content_all_locales`.
+
+    Args:
+        locales: The locales to fetch.
+        base_locale: The locale of the entities, fetched in any case.
+        concurrency: The maximum number of requests in flight.
+        version: The version of the content endpoint.
+        client: The :class:`valo_api.client.AsyncValoClient` to use.
+
+    Returns:
+        The merged content.
+
+    Raises:
+        ValoAPIException: If the content of a locale could not be fetched.
+    """
+    endpoint = EndpointsConfig.CONTENT.value
+    keys = list(dict.fromkeys((base_locale, *locales)))
+
+    def fetch(locale: str):
+        projection = None if locale == base_locale else NAMES_PROJECTION
+        return endpoint._get_endpoint_async(
+            version=version, locale=locale, client=client, projection=projection
+        )
+
+    results = {r.key: r async for r in run_many_async(fetch, keys, concurrency, client)}
+    return _merge(keys, results)
@@ -1,10 +1,16 @@
 from typing import (
+    Any,
+    AsyncIterator,
     Awaitable,
     Callable,
+    Dict,
     Generic,
     Iterable,
+    Iterator,
+    Mapping,
     Optional,
     OrderedDict,
+    Sequence,
     Tuple,
     Type,
     TypeVar,
@@ -12,33 +18,44 @@ from typing import (
     get_args,
 )
 
+import asyncio
+import importlib.util
 import io
 import json
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 
 import msgspec
-from PIL import Image
+import requests
 from requests import Response
 
 from valo_api.exceptions.valo_api_exception import ValoAPIException
 from valo_api.responses.error_response import ErrorResponse
-from valo_api.utils.dict_struct import DictStruct
-from valo_api.utils.fetch_endpoint import fetch_endpoint
+from valo_api.utils.cache import VALIDATOR_HEADERS, CacheEntry, ResponseCache, cache_key
+from valo_api.utils.decoders import get_decoder
+from valo_api.utils.fetch_endpoint import fetch_endpoint, parse_endpoint
+from valo_api.utils.interning import intern_strings
+from valo_api.utils.json_stream import iter_array_items, iter_array_items_async
+from valo_api.utils.packed_locations import pack_locations
+from valo_api.utils.projection import Projection, project
+from valo_api.utils.single_flight import SingleFlight
 
-try:
-    from valo_api.utils.fetch_endpoint import fetch_endpoint_async
-except ImportError:
-    pass
+if importlib.util.find_spec("aiohttp") is not None:
+    from valo_api.utils.fetch_endpoint import fetch_endpoint_async, open_endpoint_async
 
 R = TypeVar("R")
+_error_decoder = msgspec.json.Decoder(ErrorResponse)
 
 
-def response_type(api_type: R):
-    class APIResponse(DictStruct):
-        status: int
-        data: api_type
+class ImageResponse:
+    """The return type of endpoints answering with an image.
 
-    return APIResponse
+    The response is opened as a :class:`PIL.Image.Image`, PIL is only
+    imported when the first image arrives.
+    """
+
+    type_name = "PIL.Image.Image"
+    """The name of the returned type in the generated docstrings."""
 
 
 @dataclass
@@ -51,27 +68,72 @@ class Endpoint(Generic[R]):
     kwargs: Optional[OrderedDict[str, Type]] = None
     query_args: Optional[OrderedDict[str, str]] = None
     data_response: bool = True
+    cache_ttl: Optional[float] = None
+    stream_items: Optional[Dict[str, Tuple[Sequence[str], Type]]] = None
+    puuid_endpoint: Optional["Endpoint"] = field(
+        default=None, repr=False, compare=False
+    )
+    """The ``*_by_puuid`` endpoint of a ``*_by_name`` endpoint, used if the
+    client's identity cache knows the puuid."""
+    _decoders: Dict[Optional[str], Optional[msgspec.json.Decoder]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
-    def endpoint_wrappers(
+    def wrapper_specs(
         self,
-    ) -> Iterable[Tuple[str, Callable[..., Union[R, Awaitable[R]]]]]:
+    ) -> Iterator[Tuple[str, Optional[str], bool, bool]]:
+        """Yields the functions generated for this endpoint, without building them.
+
+        Returns:
+            An iterator over ``(name, version, async_function, stream)``, the
+            arguments of :meth:`_get_endpoint_wrapper`.
+        """
+        has_async = "fetch_endpoint_async" in globals()
         for version in self.versions:
-            yield f"{self.f_name}_{version}", self._get_endpoint_wrapper(version)
-            if "fetch_endpoint_async" in globals():
-                yield f"{self.f_name}_{version}_async", self._get_endpoint_wrapper(
-                    version, True
-                )
-        yield self.f_name, self._get_endpoint_wrapper()
+            yield f"{self.f_name}_{version}", version, False, False
+            if has_async:
+                yield f"{self.f_name}_{version}_async", version, True, False
+            if self.stream_items and version in self.stream_items:
+                yield f"{self.f_name}_{version}_stream", version, False, True
+                if has_async:
+                    yield f"{self.f_name}_{version}_stream_async", version, True, True
+        yield self.f_name, None, False, False
+        if has_async:
+            yield f"{self.f_name}_async", None, True, False
+        if self.stream_items:
+            yield f"{self.f_name}_stream", None, False, True
+            if has_async:
+                yield f"{self.f_name}_stream_async", None, True, True
 
-        if "fetch_endpoint_async" in globals():
-            yield f"{self.f_name}_async", self._get_endpoint_wrapper(
-                async_function=True
-            )
+    def endpoint_wrappers(
+        self,
+    ) -> Iterable[Tuple[str, Callable[..., Union[R, Awaitable[R]]]]]:
+        for name, version, async_function, stream in self.wrapper_specs():
+            yield name, self._get_endpoint_wrapper(version, async_function, stream)
 
     def _get_endpoint_wrapper(
-        self, version: Optional[str] = None, async_function: bool = False
+        self,
+        version: Optional[str] = None,
+        async_function: bool = False,
+        stream: bool = False,
     ) -> Union[Callable[..., Union[R, Awaitable[R]]]]:
-        if async_function:
+        if stream and async_function:
+
+            def wrapper(*args, **kwargs) -> AsyncIterator[Any]:
+                kwargs["version"] = kwargs.get("version", version)
+                for k in self.kwargs.keys():
+                    kwargs[k] = kwargs.get(k, "")
+                return self._stream_async(*args, **kwargs)
+
+        elif stream:
+
+            def wrapper(*args, **kwargs) -> Iterator[Any]:
+                kwargs["version"] = kwargs.get("version", version)
+                for k in self.kwargs.keys():
+                    kwargs[k] = kwargs.get(k, "")
+                return self._stream(*args, **kwargs)
+
+        elif async_function:
 
             async def wrapper(*args, **kwargs) -> R:
                 kwargs["version"] = kwargs.get("version", version)
@@ -88,7 +150,8 @@ class Endpoint(Generic[R]):
                 return self._get_endpoint(*args, **kwargs)
 
         doc_title = f"{self.f_name} ({version})" if version else self.f_name
-        doc_title = doc_title.replace("_", " ").title() + " from the API."
+        doc_title = doc_title.replace("_", " ").title() + " from the API"
+        doc_title += " as a stream of items." if stream else "."
         doc_args = "\n\nArgs:\n"
         if self.kwargs:
             for k, v in self.kwargs.items():
@@ -103,12 +166,24 @@ class Endpoint(Generic[R]):
                     pass
         returns = self.recursive_typing_get_args(self.return_type)
         doc_return = f"\n\nReturns:\n    {returns}: API Fetch Result\n"
+        if stream:
+            items = self.stream_items.values()
+            if version is not None:
+                items = [self.stream_items[version]]
+            returns = ", ".join(
+                sorted({self.recursive_typing_get_args(t) for _, t in items})
+            )
+            doc_return = (
+                f"\n\nReturns:\n    Iterator[{returns}]: API Fetch Result Items\n"
+            )
         doc_raise = "\n\nRaises:\n    ValoAPIException: If the API returns an error."
         wrapper.__doc__ = doc_title + doc_args + doc_return + doc_raise
 
         return wrapper
 
     def recursive_typing_get_args(self, type_: Type) -> str:
+        if type_ is ImageResponse:
+            return ImageResponse.type_name
         args = get_args(type_)
         if not args or len(args) == 0:
             return f"{type_.__name__}"
@@ -137,44 +212,463 @@ class Endpoint(Generic[R]):
 
         return filtered_query_args
 
-    def _get_endpoint(self, *args, **kwargs) -> R:
+    def cache_key(self, **kwargs) -> str:
+        """Returns the cache key of a request to this endpoint.
+
+        Args:
+            **kwargs: The arguments of the endpoint.
+
+        Returns:
+            The cache key, built from the rendered URL and query arguments.
+        """
+        return cache_key(
+            self.method,
+            parse_endpoint(self.path, **kwargs),
+            self.build_query_args(**kwargs),
+        )
+
+    def _fill_args(self, args: tuple, kwargs: dict) -> dict:
         args_insert = [a for a in args]
         for k in self.kwargs.keys():
             if k not in kwargs or kwargs[k] is None or kwargs[k] == "":
                 kwargs[k] = args_insert.pop(0) if len(args_insert) > 0 else ""
+        return kwargs
+
+    def _cache(self, client) -> Optional[ResponseCache]:
+        if client is None or client.cache is None or self.cache_ttl is None:
+            return None
+        return client.cache
+
+    def _single_flight(self, client) -> Optional[SingleFlight]:
+        if client is None or client.single_flight is None or self.method != "GET":
+            return None
+        return client.single_flight
+
+    def project(self, projection: Optional[Projection]) -> Optional[Type]:
+        """Returns the return type of this endpoint reduced to a projection.
+
+        Args:
+            projection: The field paths to decode, or a struct type, see
+                :func:`valo_api.utils.projection.project`.
+
+        Returns:
+            The projected type, or None without a projection.
+        """
+        if projection is None:
+            return None
+        if self.return_type is ImageResponse:
+            raise ValueError(f"{self.f_name} does not return JSON")
+        return project(self.return_type, projection)
+
+    @staticmethod
+    def _transforms(client) -> bool:
+        """Whether the client changes decoded results in place."""
+        return client is not None and (
+            client.intern_strings is not None or client.compact_locations
+        )
+
+    def _post_decode(self, result: R, client) -> R:
+        # Only called on freshly decoded results, never on shared cache values.
+        if client is None:
+            return result
+        if client.intern_strings is not None:
+            result = intern_strings(result, client.intern_strings)
+        if client.compact_locations:
+            result = pack_locations(result)
+        if client.identity_cache is not None:
+            result = client.identity_cache.observe(result)
+        return result
+
+    def _by_puuid(self, client, kwargs: dict) -> Optional[Tuple["Endpoint", dict]]:
+        if self.puuid_endpoint is None or client is None:
+            return None
+        if client.identity_cache is None or kwargs.get("force_update"):
+            return None
+        puuid = client.identity_cache.puuid(kwargs["name"], kwargs["tag"])
+        if puuid is None:
+            return None
+        kwargs = {k: v for k, v in kwargs.items() if k not in ("name", "tag")}
+        return self.puuid_endpoint, dict(kwargs, puuid=puuid)
+
+    @staticmethod
+    def _stale_riot_id(client, kwargs: dict, result: Any) -> bool:
+        """Whether a result of a rewritten ``*_by_name`` request belongs to
+        another Riot ID, i.e. the identity cache still knew a renamed player.
+
+        The stale Riot ID is forgotten. Results without a Riot ID are not
+        checked.
+        """
+        name = getattr(result, "name", None)
+        tag = getattr(result, "tag", None)
+        if not isinstance(name, str) or not isinstance(tag, str):
+            return False
+        requested = f"{kwargs['name']}#{kwargs['tag']}".casefold()
+        if f"{name}#{tag}".casefold() == requested:
+            return False
+        client.identity_cache.forget(kwargs["name"], kwargs["tag"])
+        return True
+
+    def _cached(
+        self,
+        entry: CacheEntry,
+        version: Optional[str] = None,
+        projection: Optional[Type] = None,
+        client=None,
+    ) -> R:
+        if entry.value is not None and projection is None:
+            if not self._transforms(client):
+                return entry.value
+        result = self.decoder(version, projection).decode(entry.content)
+        result = result.data if self.data_response else result
+        return self._post_decode(result, client)
+
+    def _store(
+        self,
+        cache: ResponseCache,
+        key: str,
+        content: bytes,
+        headers: Mapping[str, str],
+        result: R,
+    ) -> None:
+        validators = {h: headers[h] for h in VALIDATOR_HEADERS if headers.get(h)}
+        if self.cache_ttl <= 0 and not validators:
+            return
+        cache.set(
+            key,
+            CacheEntry(
+                content=content,
+                expires_at=time.time() + self.cache_ttl,
+                headers=validators,
+                value=result,
+            ),
+        )
+
+    def _revalidated(
+        self,
+        cache: ResponseCache,
+        key: str,
+        entry: CacheEntry,
+        headers: Mapping[str, str],
+        version: Optional[str] = None,
+        projection: Optional[Type] = None,
+        client=None,
+    ) -> R:
+        entry.expires_at = time.time() + self.cache_ttl
+        entry.headers.update(
+            {h: headers[h] for h in VALIDATOR_HEADERS if headers.get(h)}
+        )
+        cache.set(key, entry)
+        return self._cached(entry, version, projection, client)
+
+    def _send(self, client=None, headers=None, stream=False, **kwargs) -> Response:
+        rate_limiter = client.rate_limiter if client is not None else None
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        try:
+            response = fetch_endpoint(
+                self.path,
+                method=self.method,
+                query_args=self.build_query_args(**kwargs),
+                session=client.session if client is not None else None,
+                timeout=client.timeout if client is not None else None,
+                headers=headers,
+                stream=stream,
+                **kwargs,
+            )
+        except BaseException:
+            if rate_limiter is not None:
+                rate_limiter.release()
+            raise
+        if rate_limiter is not None:
+            rate_limiter.update(response.headers, response.status_code)
+        return response
+
+    def _get_endpoint(self, *args, client=None, projection=None, **kwargs) -> R:
+        kwargs = self._fill_args(args, kwargs)
         kwargs = {
             k: json.dumps(v) if isinstance(v, dict) else v for k, v in kwargs.items()
         }
-        response = fetch_endpoint(
-            self.path,
-            method=self.method,
-            query_args=self.build_query_args(**kwargs),
-            **kwargs,
+        by_puuid = self._by_puuid(client, kwargs)
+        if by_puuid is not None:
+            endpoint, puuid_kwargs = by_puuid
+            result = endpoint._get_endpoint(
+                client=client, projection=projection, **puuid_kwargs
+            )
+            if not self._stale_riot_id(client, kwargs, result):
+                return result
+        projection = self.project(projection)
+        single_flight = self._single_flight(client)
+        if single_flight is None:
+            return self._load(client, None, projection, **kwargs)
+        key = self.cache_key(**kwargs)
+        return single_flight.do(
+            (key, projection), lambda: self._load(client, key, projection, **kwargs)
         )
-        return self.parse_response(response, response.content)
 
-    async def _get_endpoint_async(self, *args, **kwargs) -> R:
-        args_insert = [a for a in args]
-        for k in self.kwargs.keys():
-            if k not in kwargs or kwargs[k] is None or kwargs[k] == "":
-                kwargs[k] = args_insert.pop(0) if len(args_insert) > 0 else ""
-        response, content = await fetch_endpoint_async(
-            self.path,
-            method=self.method,
-            query_args=self.build_query_args(**kwargs),
-            **kwargs,
+    def _load(
+        self,
+        client=None,
+        key: Optional[str] = None,
+        projection: Optional[Type] = None,
+        **kwargs,
+    ) -> R:
+        cache = self._cache(client)
+        entry = None
+        if cache is not None:
+            key = key or self.cache_key(**kwargs)
+            entry = cache.get(key)
+            if entry is not None and entry.fresh():
+                return self._cached(entry, kwargs["version"], projection, client)
+        headers = entry.validators() if entry is not None else None
+        retry_policy = client.retry_policy if client is not None else None
+        if retry_policy is None:
+            response = self._send(client, headers, **kwargs)
+        else:
+            response = retry_policy.call(
+                lambda: self._send(client, headers, **kwargs),
+                self.method,
+                lambda r: (r.status_code, r.headers),
+                (requests.ConnectionError, requests.Timeout),
+            )
+        if entry is not None and response.status_code == 304:
+            return self._revalidated(
+                cache,
+                key,
+                entry,
+                response.headers,
+                kwargs["version"],
+                projection,
+                client,
+            )
+        result = self.parse_response(
+            response, response.content, kwargs["version"], projection
+        )
+        if cache is not None:
+            # Only full results without in place transforms are shared, the
+            # others are decoded per hit.
+            shared = projection is None and not self._transforms(client)
+            value = result if shared else None
+            self._store(cache, key, response.content, response.headers, value)
+        return self._post_decode(result, client)
+
+    def _stream_decoder(
+        self, version: Optional[str], projection: Optional[Projection] = None
+    ) -> Tuple[Sequence[str], msgspec.json.Decoder]:
+        try:
+            path, item_type = self.stream_items[version]
+        except (KeyError, TypeError):
+            raise ValueError(f"{self.f_name} {version} cannot be streamed") from None
+        if projection is not None:
+            item_type = project(item_type, projection)
+        return path, get_decoder(item_type, False)
+
+    def _stream(
+        self,
+        *args,
+        client=None,
+        chunk_size: int = 64 * 1024,
+        projection=None,
+        **kwargs,
+    ):
+        """Yields the items of a list response while the body is read.
+
+        Only the item being decoded is kept in memory. Streams are rate
+        limited, but neither cached, coalesced nor retried.
+        """
+        kwargs = self._fill_args(args, kwargs)
+        by_puuid = self._by_puuid(client, kwargs)
+        if by_puuid is not None:
+            endpoint, kwargs = by_puuid
+            yield from endpoint._stream(
+                client=client, chunk_size=chunk_size, projection=projection, **kwargs
+            )
+            return
+        path, decoder = self._stream_decoder(kwargs["version"], projection)
+        with self._send(client, stream=True, **kwargs) as response:
+            if response.ok is False:
+                self.parse_response(response, response.content)
+            for item in iter_array_items(response.iter_content(chunk_size), path):
+                yield self._post_decode(decoder.decode(item), client)
+
+    async def _send_async(
+        self, client=None, headers=None, **kwargs
+    ) -> Tuple[Response, bytes]:
+        rate_limiter = client.rate_limiter if client is not None else None
+        if rate_limiter is not None:
+            await rate_limiter.acquire_async()
+        try:
+            response, content = await fetch_endpoint_async(
+                self.path,
+                method=self.method,
+                query_args=self.build_query_args(**kwargs),
+                session=client.session if client is not None else None,
+                headers=headers,
+                **kwargs,
+            )
+        except BaseException:
+            if rate_limiter is not None:
+                rate_limiter.release()
+            raise
+        if rate_limiter is not None:
+            rate_limiter.update(response.headers, response.status)
+        return response, content
+
+    async def _get_endpoint_async(
+        self, *args, client=None, projection=None, **kwargs
+    ) -> R:
+        kwargs = self._fill_args(args, kwargs)
+        by_puuid = self._by_puuid(client, kwargs)
+        if by_puuid is not None:
+            endpoint, puuid_kwargs = by_puuid
+            result = await endpoint._get_endpoint_async(
+                client=client, projection=projection, **puuid_kwargs
+            )
+            if not self._stale_riot_id(client, kwargs, result):
+                return result
+        projection = self.project(projection)
+        single_flight = self._single_flight(client)
+        if single_flight is None:
+            return await self._load_async(client, None, projection, **kwargs)
+        key = self.cache_key(**kwargs)
+        return await single_flight.do_async(
+            (key, projection),
+            lambda: self._load_async(client, key, projection, **kwargs),
         )
-        return self.parse_response(response, content)
 
-    def parse_response(self, response: Response, content: bytes) -> R:
+    async def _stream_async(
+        self,
+        *args,
+        client=None,
+        chunk_size: int = 64 * 1024,
+        projection=None,
+        **kwargs,
+    ):
+        """Yields the items of a list response while the body is read.
+
+        Only the item being decoded is kept in memory. Streams are rate
+        limited, but neither cached, coalesced nor retried.
+        """
+        kwargs = self._fill_args(args, kwargs)
+        by_puuid = self._by_puuid(client, kwargs)
+        if by_puuid is not None:
+            endpoint, kwargs = by_puuid
+            async for item in endpoint._stream_async(
+                client=client, chunk_size=chunk_size, projection=projection, **kwargs
+            ):
+                yield item
+            return
+        path, decoder = self._stream_decoder(kwargs["version"], projection)
+        rate_limiter = client.rate_limiter if client is not None else None
+        if rate_limiter is not None:
+            await rate_limiter.acquire_async()
+        try:
+            async with open_endpoint_async(
+                self.path,
+                method=self.method,
+                query_args=self.build_query_args(**kwargs),
+                session=client.session if client is not None else None,
+                **kwargs,
+            ) as response:
+                if rate_limiter is not None:
+                    rate_limiter.update(response.headers, response.status)
+                if response.ok is False:
+                    self.parse_response(response, await response.read())
+                chunks = response.content.iter_chunked(chunk_size)
+                async for item in iter_array_items_async(chunks, path):
+                    yield self._post_decode(decoder.decode(item), client)
+        except BaseException:
+            # Does nothing once the response updated the limiter.
+            if rate_limiter is not None:
+                rate_limiter.release()
+            raise
+
+    async def _load_async(
+        self,
+        client=None,
+        key: Optional[str] = None,
+        projection: Optional[Type] = None,
+        **kwargs,
+    ) -> R:
+        cache = self._cache(client)
+        entry = None
+        if cache is not None:
+            key = key or self.cache_key(**kwargs)
+            entry = cache.get(key)
+            if entry is not None and entry.fresh():
+                return self._cached(entry, kwargs["version"], projection, client)
+        headers = entry.validators() if entry is not None else None
+        retry_policy = client.retry_policy if client is not None else None
+        if retry_policy is None:
+            response, content = await self._send_async(client, headers, **kwargs)
+        else:
+            import aiohttp
+
+            response, content = await retry_policy.call_async(
+                lambda: self._send_async(client, headers, **kwargs),
+                self.method,
+                lambda r: (r[0].status, r[0].headers),
+                (aiohttp.ClientConnectionError, asyncio.TimeoutError),
+            )
+        if entry is not None and response.status == 304:
+            return self._revalidated(
+                cache,
+                key,
+                entry,
+                response.headers,
+                kwargs["version"],
+                projection,
+                client,
+            )
+        result = self.parse_response(response, content, kwargs["version"], projection)
+        if cache is not None:
+            # Only full results without in place transforms are shared, the
+            # others are decoded per hit.
+            shared = projection is None and not self._transforms(client)
+            value = result if shared else None
+            self._store(cache, key, content, response.headers, value)
+        return self._post_decode(result, client)
+
+    def decoder(
+        self, version: Optional[str] = None, projection: Optional[Type] = None
+    ) -> Optional[msgspec.json.Decoder]:
+        """Returns the prebuilt decoder for a version of this endpoint.
+
+        Args:
+            version: The version of the endpoint.
+            projection: A projected return type from :meth:`project`.
+
+        Returns:
+            The decoder, or None if the endpoint does not return JSON.
+        """
+        if projection is not None:
+            return get_decoder(projection, self.data_response)
+        try:
+            return self._decoders[version]
+        except KeyError:
+            pass
+        decoder = (
+            None
+            if self.return_type is ImageResponse
+            else get_decoder(self.return_type, self.data_response)
+        )
+        self._decoders[version] = decoder
+        return decoder
+
+    def parse_response(
+        self,
+        response: Response,
+        content: bytes,
+        version: Optional[str] = None,
+        projection: Optional[Type] = None,
+    ) -> R:
         if response.ok is False:
-            error = msgspec.json.decode(content, type=ErrorResponse)
+            error = _error_decoder.decode(content)
             error.headers = dict(response.headers)
             raise ValoAPIException(error)
-        if self.return_type == Image.Image:
-            return Image.open(io.BytesIO(response.content))
-        return_type = (
-            response_type(self.return_type) if self.data_response else self.return_type
-        )
-        result = msgspec.json.decode(content, type=return_type)
+        decoder = self.decoder(version, projection)
+        if decoder is None:
+            from PIL import Image
+
+            return Image.open(io.BytesIO(content))
+        result = decoder.decode(content)
         return result.data if self.data_response else result
@@ -1,11 +1,27 @@
+from typing import Dict, List, Optional, Tuple
+
 from valo_api.endpoint import Endpoint
 from valo_api.endpoints_config import EndpointsConfig
 
-function_names = []
-for name, value in EndpointsConfig.__dict__.items():
-    if hasattr(value, "value") and isinstance(value.value, Endpoint):
-        for name, function in value.value.endpoint_wrappers():
-            function_names.append(name)
-            globals()[name] = function
+# The functions are only built, with their docstrings, on first access.
+_wrappers: Dict[str, Tuple[Endpoint, Optional[str], bool, bool]] = {}
+for value in EndpointsConfig:
+    for name, *spec in value.value.wrapper_specs():
+        _wrappers[name] = (value.value, *spec)
+
+function_names: List[str] = list(_wrappers)
 
 __all__ = function_names
+
+
+def __getattr__(name: str):
+    try:
+        endpoint, version, async_function, stream = _wrappers[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    function = endpoint._get_endpoint_wrapper(version, async_function, stream)
+    return globals().setdefault(name, function)
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(function_names))
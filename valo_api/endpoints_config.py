@@ -1,15 +1,18 @@
 from typing import List, Optional, Union
 
+import math
 from collections import OrderedDict
 from enum import Enum
 
-from PIL import Image
-
-from valo_api.endpoint import Endpoint
+from valo_api.endpoint import Endpoint, ImageResponse
 from valo_api.responses.account_details import AccountDetails
 from valo_api.responses.competitive_updates_raw import CompetitiveUpdatesRawV1
 from valo_api.responses.content import ContentV1
-from valo_api.responses.leaderboard import LeaderboardPlayerV1, LeaderboardV2
+from valo_api.responses.leaderboard import (
+    LeaderboardPlayerV1,
+    LeaderboardPlayerV2,
+    LeaderboardV2,
+)
 from valo_api.responses.lifetime_match import LifetimeMatchV1
 from valo_api.responses.match_details_raw import MatchDetailsRawV1
 from valo_api.responses.match_history import MatchHistoryPointV3
@@ -47,6 +50,7 @@ class EndpointsConfig(Enum):
                 ("queries", "{queries}"),
             ]
         ),
+        cache_ttl=math.inf,
     )
     RAW_MATCH_HISTORY = Endpoint(
         path="/valorant/{version}/raw",
@@ -124,6 +128,7 @@ class EndpointsConfig(Enum):
         data_response=False,
         kwargs=OrderedDict([("version", str), ("locale", Optional[str])]),
         query_args=OrderedDict([("locale", "{locale}")]),
+        cache_ttl=60 * 60,
     )
     STORE_FEATURED = Endpoint(
         path="/valorant/{version}/store-featured",
@@ -138,24 +143,28 @@ class EndpointsConfig(Enum):
         versions=["v2"],
         return_type=StoreOffersV2,
         kwargs=OrderedDict([("version", str)]),
+        cache_ttl=60 * 60,
     )
     STATUS = Endpoint(
         path="/valorant/{version}/status/{region}",
         f_name="get_status",
         return_type=StatusV1,
         kwargs=OrderedDict([("version", str), ("region", str)]),
+        cache_ttl=60,
     )
     VERSION_INFO = Endpoint(
         path="/valorant/{version}/version/{region}",
         f_name="get_version_info",
         return_type=VersionInfoV1,
         kwargs=OrderedDict([("version", str), ("region", str)]),
+        cache_ttl=5 * 60,
     )
     WEBSITE = Endpoint(
         path="/valorant/{version}/website/{countrycode}",
         f_name="get_website",
         return_type=List[WebsiteBannerV1],
         kwargs=OrderedDict([("version", str), ("countrycode", str)]),
+        cache_ttl=60 * 60,
     )
     LEADERBOARD = Endpoint(
         path="/valorant/{version}/leaderboard/{region}",
@@ -183,6 +192,19 @@ class EndpointsConfig(Enum):
                 ("start", "{start}"),
             ]
         ),
+        cache_ttl=0,
+        stream_items={
+            "v1": ((), LeaderboardPlayerV1),
+            "v2": (("players",), Optional[LeaderboardPlayerV2]),
+        },
+    )
+    ACCOUNT_BY_PUUID = Endpoint(
+        path="/valorant/{version}/by-puuid/account/{puuid}",
+        f_name="get_account_details_by_puuid",
+        versions=["v1", "v2"],
+        return_type=AccountDetails,
+        kwargs=OrderedDict([("version", str), ("puuid", str), ("force_update", bool)]),
+        query_args=OrderedDict([("force", "{force_update}")]),
     )
     ACCOUNT_BY_NAME = Endpoint(
         path="/valorant/{version}/account/{name}/{tag}",
@@ -193,14 +215,7 @@ class EndpointsConfig(Enum):
             [("version", str), ("name", str), ("tag", str), ("force_update", bool)]
         ),
         query_args=OrderedDict([("force", "{force_update}")]),
-    )
-    ACCOUNT_BY_PUUID = Endpoint(
-        path="/valorant/{version}/by-puuid/account/{puuid}",
-        f_name="get_account_details_by_puuid",
-        versions=["v1", "v2"],
-        return_type=AccountDetails,
-        kwargs=OrderedDict([("version", str), ("puuid", str), ("force_update", bool)]),
-        query_args=OrderedDict([("force", "{force_update}")]),
+        puuid_endpoint=ACCOUNT_BY_PUUID,
     )
     MATCH_DETAILS = Endpoint(
         path="/valorant/{version}/match/{match_id}",
@@ -208,6 +223,7 @@ class EndpointsConfig(Enum):
         versions=["v2"],
         return_type=MatchHistoryPointV3,
         kwargs=OrderedDict([("version", str), ("match_id", str)]),
+        cache_ttl=math.inf,
     )
     MMR_DETAILS_BY_PUUID = Endpoint(
         path="/valorant/{version}/by-puuid/mmr/{region}/{puuid}",
@@ -229,6 +245,7 @@ class EndpointsConfig(Enum):
                 ("tag", str),
             ]
         ),
+        puuid_endpoint=MMR_DETAILS_BY_PUUID,
     )
     MMR_HISTORY_BY_PUUID = Endpoint(
         path="/valorant/{version}/by-puuid/mmr-history/{region}/{puuid}",
@@ -243,6 +260,7 @@ class EndpointsConfig(Enum):
         kwargs=OrderedDict(
             [("version", str), ("region", str), ("name", str), ("tag", str)]
         ),
+        puuid_endpoint=MMR_HISTORY_BY_PUUID,
     )
     MATCH_HISTORY_BY_PUUID = Endpoint(
         path="/valorant/{version}/by-puuid/matches/{region}/{puuid}",
@@ -266,6 +284,7 @@ class EndpointsConfig(Enum):
                 ("filter", "{game_mode}"),
             ]
         ),
+        stream_items={"v3": (("data",), MatchHistoryPointV3)},
     )
     MATCH_HISTORY_BY_NAME = Endpoint(
         path="/valorant/{version}/matches/{region}/{name}/{tag}",
@@ -290,6 +309,8 @@ class EndpointsConfig(Enum):
                 ("filter", "{game_mode}"),
             ]
         ),
+        stream_items={"v3": (("data",), MatchHistoryPointV3)},
+        puuid_endpoint=MATCH_HISTORY_BY_PUUID,
     )
     LIFETIME_MATCHES_BY_PUUID = Endpoint(
         path="/valorant/{version}/by-puuid/lifetime/matches/{region}/{puuid}",
@@ -314,6 +335,7 @@ class EndpointsConfig(Enum):
                 ("size", "{size}"),
             ]
         ),
+        stream_items={"v1": (("data",), LifetimeMatchV1)},
     )
     LIFETIME_MATCHES_BY_NAME = Endpoint(
         path="/valorant/{version}/lifetime/matches/{region}/{name}/{tag}",
@@ -339,11 +361,13 @@ class EndpointsConfig(Enum):
                 ("size", "{size}"),
             ]
         ),
+        stream_items={"v1": (("data",), LifetimeMatchV1)},
+        puuid_endpoint=LIFETIME_MATCHES_BY_PUUID,
     )
     CROSSHAIR = Endpoint(
         path="/valorant/{version}/crosshair/generate",
         f_name="get_crosshair",
-        return_type=Image.Image,
+        return_type=ImageResponse,
         kwargs=OrderedDict([("version", str), ("crosshair_id", str)]),
         query_args=OrderedDict([("id", "{crosshair_id}")]),
     )
@@ -0,0 +1,350 @@
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from operator import attrgetter
+
+from valo_api.endpoints_config import EndpointsConfig
+from valo_api.responses.leaderboard import (
+    LeaderboardPlayerV1,
+    LeaderboardPlayerV2,
+    LeaderboardV2,
+)
+
+LeaderboardPlayer = Union[LeaderboardPlayerV1, LeaderboardPlayerV2]
+
+TIERS = ("radiant", "immortal_3", "immortal_2", "immortal_1")
+"""The tier buckets of :class:`LeaderboardIndex`, from the highest."""
+
+
+class LeaderboardIndex:
+    """Lookups into a decoded leaderboard without scanning the player list.
+
+    Players are hashed by puuid and ``gameName#tagLine``, and kept in arrays
+    sorted by rank and by RR which are searched with :mod:`bisect`. Build it
+    once per leaderboard update and share it between queries.
+
+    Args:
+        leaderboard: A ``LeaderboardV2`` or the v1 list of players. The tier
+            thresholds are only known for ``LeaderboardV2``.
+    """
+
+    def __init__(
+        self, leaderboard: Union[LeaderboardV2, Sequence[Optional[LeaderboardPlayer]]]
+    ):
+        if isinstance(leaderboard, LeaderboardV2):
+            players = leaderboard.players
+            self.thresholds: Optional[Dict[str, int]] = {
+                tier: getattr(leaderboard, f"{tier}_threshold") for tier in TIERS
+            }
+        else:
+            players = leaderboard
+            self.thresholds = None
+        self.players: List[LeaderboardPlayer] = sorted(
+            (p for p in players if p is not None), key=attrgetter("leaderboardRank")
+        )
+        """The players ordered by rank."""
+        self._ranks = array("i", (p.leaderboardRank for p in self.players))
+        self._by_rr = sorted(self.players, key=attrgetter("rankedRating"))
+        self._rr = array("i", (p.rankedRating for p in self._by_rr))
+        self._by_puuid: Dict[str, LeaderboardPlayer] = {}
+        self._by_name: Dict[str, LeaderboardPlayer] = {}
+        for player in self.players:
+            if player.puuid:
+                self._by_puuid.setdefault(player.puuid, player)
+            if player.gameName:
+                self._by_name.setdefault(
+                    f"{player.gameName}#{player.tagLine}".casefold(), player
+                )
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def by_puuid(self, puuid: str) -> Optional[LeaderboardPlayer]:
+        """Returns the player with a puuid, or None if not on the leaderboard."""
+        return self._by_puuid.get(puuid)
+
+    def by_name(
+        self, name: str, tag: Optional[str] = None
+    ) -> Optional[LeaderboardPlayer]:
+        """Returns a player by name, ignoring case.
+
+        Args:
+            name: The name, or ``"name#tag"`` if no tag is given.
+            tag: The tag.
+
+        Returns:
+            The player, or None if not on the leaderboard.
+        """
+        key = name if tag is None else f"{name}#{tag}"
+        return self._by_name.get(key.casefold())
+
+    def by_rank(self, rank: int) -> Optional[LeaderboardPlayer]:
+        """Returns the player with a leaderboard rank."""
+        index = bisect_left(self._ranks, rank)
+        if index < len(self._ranks) and self._ranks[index] == rank:
+            return self.players[index]
+        return None
+
+    def rank_range(self, start: int, stop: int) -> List[LeaderboardPlayer]:
+        """Returns the players with ``start <= rank <= stop``, ordered by rank."""
+        return self.players[
+            bisect_left(self._ranks, start) : bisect_right(self._ranks, stop)
+        ]
+
+    def rr_range(
+        self, minimum: int, maximum: Optional[int] = None
+    ) -> List[LeaderboardPlayer]:
+        """Returns the players with ``minimum <= RR <= maximum``.
+
+        Args:
+            minimum: The lowest RR.
+            maximum: The highest RR, unbounded if None.
+
+        Returns:
+            The players, from the highest RR.
+        """
+        end = len(self._rr) if maximum is None else bisect_right(self._rr, maximum)
+        return self._by_rr[bisect_left(self._rr, minimum) : end][::-1]
+
+    def percentile(self, rr: int) -> float:
+        """Returns the percentage of players with a lower RR than ``rr``."""
+        if not self._rr:
+            return 0.0
+        return 100 * bisect_left(self._rr, rr) / len(self._rr)
+
+    def tier(self, rr: int) -> Optional[str]:
+        """Returns the tier of :data:`TIERS` an RR falls into.
+
+        Returns:
+            The tier, or None if the RR is below every threshold or the
+            thresholds are unknown.
+        """
+        if self.thresholds is None:
+            return None
+        for tier in TIERS:
+            if rr >= self.thresholds[tier]:
+                return tier
+        return None
+
+    def tier_players(self, tier: str) -> List[LeaderboardPlayer]:
+        """Returns the players of a tier of :data:`TIERS`, from the highest RR.
+
+        Raises:
+            ValueError: If the tier is unknown or the thresholds are unknown.
+        """
+        if self.thresholds is None:
+            raise ValueError("The leaderboard has no tier thresholds")
+        if tier not in TIERS:
+            raise ValueError(f"tier must be one of {', '.join(TIERS)}")
+        position = TIERS.index(tier)
+        maximum = self.thresholds[TIERS[position - 1]] - 1 if position > 0 else None
+        return self.rr_range(self.thresholds[tier], maximum)
+
+
+@dataclass
+class PlayerChange:
+    """The change of a player present in both snapshots."""
+
+    puuid: str
+    rank: int
+    previous_rank: int
+    rr: int
+    previous_rr: int
+    wins: int
+    previous_wins: int
+    tier: int
+    previous_tier: int
+
+    @property
+    def rank_delta(self) -> int:
+        """Positive if the player climbed, e.g. from rank 12 to 10 is 2."""
+        return self.previous_rank - self.rank
+
+    @property
+    def rr_delta(self) -> int:
+        return self.rr - self.previous_rr
+
+
+@dataclass
+class LeaderboardDiff:
+    """The changes between two leaderboard snapshots of a region."""
+
+    last_update: Optional[int]
+    """The ``last_update`` of the new snapshot."""
+    previous_update: Optional[int]
+    """The ``last_update`` of the previous snapshot, None for the first."""
+    changed: List[PlayerChange] = field(default_factory=list)
+    """Players whose rank, RR, wins or tier changed."""
+    entered: List[LeaderboardPlayerV2] = field(default_factory=list)
+    """Players not in the previous snapshot."""
+    dropped: List[LeaderboardPlayerV2] = field(default_factory=list)
+    """Players of the previous snapshot missing from the new one."""
+
+    def __bool__(self) -> bool:
+        return bool(self.changed or self.entered or self.dropped)
+
+
+def _changed(
+    previous: LeaderboardPlayerV2, player: LeaderboardPlayerV2
+) -> Optional[PlayerChange]:
+    if (
+        previous.leaderboardRank == player.leaderboardRank
+        and previous.rankedRating == player.rankedRating
+        and previous.numberOfWins == player.numberOfWins
+        and previous.competitiveTier == player.competitiveTier
+    ):
+        return None
+    return PlayerChange(
+        puuid=player.puuid,
+        rank=player.leaderboardRank,
+        previous_rank=previous.leaderboardRank,
+        rr=player.rankedRating,
+        previous_rr=previous.rankedRating,
+        wins=player.numberOfWins,
+        previous_wins=previous.numberOfWins,
+        tier=player.competitiveTier,
+        previous_tier=previous.competitiveTier,
+    )
+
+
+class LeaderboardTracker:
+    """Polls the leaderboard of a region and emits the changes.
+
+    The leaderboard is only fetched again once its ``next_update`` has
+    passed. The previous snapshot is kept indexed by puuid, so every update
+    is diffed in one pass over the new players. Anonymized players have no
+    puuid and are not tracked.
+
+    Example::
+
+        tracker = LeaderboardTracker("eu")
+        while True:
+            diff = tracker.poll()
+            if diff:
+                handle(diff.changed, diff.entered, diff.dropped)
+            time.sleep(60)
+
+    Args:
+        region: The region of the leaderboard.
+        season_id: The season, None for the current one.
+        version: The version of the leaderboard endpoint, only ``"v2"`` is
+            supported since v1 has no update times.
+        client: The :class:`valo_api.client.ValoClient` or
+            :class:`valo_api.client.AsyncValoClient` to use.
+        clock: Returns the current time in seconds since the epoch.
+    """
+
+    def __init__(
+        self,
+        region: str,
+        season_id: Optional[str] = None,
+        version: str = "v2",
+        client=None,
+        clock: Callable[[], float] = time.time,
+    ):
+        if version != "v2":
+            raise ValueError(f"LeaderboardTracker does not support {version}")
+        self.region = region
+        self.season_id = season_id
+        self.version = version
+        self.client = client
+        self.clock = clock
+        self.leaderboard: Optional[LeaderboardV2] = None
+        """The latest snapshot."""
+        self.players: Dict[str, LeaderboardPlayerV2] = {}
+        """The players of the latest snapshot by puuid."""
+        self._index: Optional[LeaderboardIndex] = None
+
+    @property
+    def due(self) -> bool:
+        """Whether the ``next_update`` of the latest snapshot has passed."""
+        if self.leaderboard is None or self.leaderboard.next_update is None:
+            return True
+        return self.clock() >= self.leaderboard.next_update
+
+    @property
+    def index(self) -> Optional[LeaderboardIndex]:
+        """The :class:`LeaderboardIndex` of the latest snapshot, built once."""
+        if self._index is None and self.leaderboard is not None:
+            self._index = LeaderboardIndex(self.leaderboard)
+        return self._index
+
+    def update(self, leaderboard: LeaderboardV2) -> Optional[LeaderboardDiff]:
+        """Replaces the snapshot and returns the changes.
+
+        Args:
+            leaderboard: The new snapshot.
+
+        Returns:
+            The changes, all players are new for the first snapshot. None if
+            the snapshot has the same ``last_update`` as the previous one.
+        """
+        previous = self.leaderboard
+        if (
+            previous is not None
+            and leaderboard.last_update is not None
+            and leaderboard.last_update == previous.last_update
+        ):
+            # The leaderboard was not updated yet, only move the next poll.
+            self.leaderboard = leaderboard
+            return None
+        diff = LeaderboardDiff(
+            leaderboard.last_update,
+            previous.last_update if previous is not None else None,
+        )
+        old = self.players
+        players: Dict[str, LeaderboardPlayerV2] = {}
+        for player in leaderboard.players:
+            if player is None or not player.puuid:
+                continue
+            players[player.puuid] = player
+            before = old.get(player.puuid)
+            if before is None:
+                diff.entered.append(player)
+            else:
+                change = _changed(before, player)
+                if change is not None:
+                    diff.changed.append(change)
+        if len(players) - len(diff.entered) < len(old):
+            diff.dropped = [p for puuid, p in old.items() if puuid not in players]
+        self.leaderboard = leaderboard
+        self.players = players
+        self._index = None
+        return diff
+
+    def poll(self, force: bool = False) -> Optional[LeaderboardDiff]:
+        """Fetches the leaderboard if it is due and returns the changes.
+
+        Args:
+            force: Fetch even if ``next_update`` has not passed yet.
+
+        Returns:
+            The changes, or None if nothing was fetched or the leaderboard
+            was not updated.
+        """
+        if not force and not self.due:
+            return None
+        return self.update(
+            EndpointsConfig.LEADERBOARD.value._get_endpoint(
+                version=self.version,
+                region=self.region,
+                season_id=self.season_id,
+                client=self.client,
+            )
+        )
+
+    async def poll_async(self, force: bool = False) -> Optional[LeaderboardDiff]:
+        """Asynchronous version of :meth:`poll`."""
+        if not force and not self.due:
+            return None
+        return self.update(
+            await EndpointsConfig.LEADERBOARD.value._get_endpoint_async(
+                version=self.version,
+                region=self.region,
+                season_id=self.season_id,
+                client=self.client,
+            )
+        )
@@ -0,0 +1,154 @@
+from typing import AsyncIterator, Deque, Dict, Iterator, List, Optional, Tuple
+
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from valo_api.endpoint import Endpoint
+from valo_api.endpoints_config import EndpointsConfig
+from valo_api.responses.lifetime_match import LifetimeMatchV1
+
+
+def _lifetime_matches_request(
+    region: str,
+    puuid: Optional[str],
+    name: Optional[str],
+    tag: Optional[str],
+    mode: Optional[str],
+    map: Optional[str],
+    size: int,
+    version: str,
+) -> Tuple[Endpoint, Dict]:
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    kwargs = dict(version=version, region=region, mode=mode, map=map, size=size)
+    if puuid is not None:
+        endpoint = EndpointsConfig.LIFETIME_MATCHES_BY_PUUID
+        return endpoint.value, dict(kwargs, puuid=puuid)
+    if name is None or tag is None:
+        raise ValueError("Either puuid or name and tag are required")
+    endpoint = EndpointsConfig.LIFETIME_MATCHES_BY_NAME
+    return endpoint.value, dict(kwargs, name=name, tag=tag)
+
+
+def iter_lifetime_matches(
+    region: str,
+    puuid: Optional[str] = None,
+    name: Optional[str] = None,
+    tag: Optional[str] = None,
+    mode: Optional[str] = None,
+    map: Optional[str] = None,
+    size: int = 20,
+    prefetch: int = 2,
+    version: str = "v1",
+    client=None,
+) -> Iterator[LifetimeMatchV1]:
+    """Iterates over all lifetime matches of a player, page by page.
+
+    While the current page is consumed, the next ``prefetch`` pages are
+    already fetched on a thread pool. The iteration stops after the first
+    page with less than ``size`` matches.
+
+    Args:
+        region: The region of the player.
+        puuid: The puuid of the player.
+        name: The name of the player, if no puuid is given.
+        tag: The tag of the player, if no puuid is given.
+        mode: Only return matches of this mode.
+        map: Only return matches on this map.
+        size: The number of matches per page.
+        prefetch: The number of pages fetched ahead.
+        version: The version of the endpoint.
+        client: The :class:`valo_api.client.ValoClient` to use.
+
+    Returns:
+        An iterator over the matches.
+    """
+    endpoint, kwargs = _lifetime_matches_request(
+        region, puuid, name, tag, mode, map, size, version
+    )
+
+    def fetch(page: int) -> List[LifetimeMatchV1]:
+        return endpoint._get_endpoint(page=page, client=client, **kwargs)
+
+    executor = ThreadPoolExecutor(max(prefetch, 1))
+    pages: Deque[Future] = deque()
+    try:
+        for page in range(1, max(prefetch, 1) + 1):
+            pages.append(executor.submit(fetch, page))
+        next_page = len(pages) + 1
+        while pages:
+            matches = pages.popleft().result()
+            if len(matches) >= size:
+                pages.append(executor.submit(fetch, next_page))
+                next_page += 1
+            else:
+                for future in pages:
+                    future.cancel()
+                pages.clear()
+            yield from matches
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def iter_lifetime_matches_async(
+    region: str,
+    puuid: Optional[str] = None,
+    name: Optional[str] = None,
+    tag: Optional[str] = None,
+    mode: Optional[str] = None,
+    map: Optional[str] = None,
+    size: int = 20,
+    prefetch: int = 2,
+    version: str = "v1",
+    client=None,
+) -> AsyncIterator[LifetimeMatchV1]:
+    """Iterates asynchronously over all lifetime matches of a player.
+
+    While the current page is consumed, the next ``prefetch`` pages are
+    already fetched concurrently. The iteration stops after the first page
+    with less than ``size`` matches.
+
+    Args:
+        region: The region of the player.
+        puuid: The puuid of the player.
+        name: The name of the player, if no puuid is given.
+        tag: The tag of the player, if no puuid is given.
+        mode: Only return matches of this mode.
+        map: Only return matches on this map.
+        size: The number of matches per page.
+        prefetch: The number of pages fetched ahead.
+        version: The version of the endpoint.
+        client: The :class:`valo_api.client.AsyncValoClient` to use.
+
+    Returns:
+        An asynchronous iterator over the matches.
+    """
+    endpoint, kwargs = _lifetime_matches_request(
+        region, puuid, name, tag, mode, map, size, version
+    )
+
+    def fetch(page: int) -> asyncio.Task:
+        return asyncio.ensure_future(
+            endpoint._get_endpoint_async(page=page, client=client, **kwargs)
+        )
+
+    pages: Deque[asyncio.Task] = deque(
+        fetch(page) for page in range(1, max(prefetch, 1) + 1)
+    )
+    next_page = len(pages) + 1
+    try:
+        while pages:
+            matches = await pages.popleft()
+            if len(matches) >= size:
+                pages.append(fetch(next_page))
+                next_page += 1
+            else:
+                for task in pages:
+                    task.cancel()
+                pages.clear()
+            for match in matches:
+                yield match
+    finally:
+        for task in pages:
+            task.cancel()
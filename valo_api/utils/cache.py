@@ -0,0 +1,142 @@
+from typing import Any, Dict, Mapping, Optional
+
+import abc
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+
+def cache_key(method: str, url: str, query_args: Optional[Mapping[str, Any]]) -> str:
+    """Returns the cache key of a request.
+
+    Args:
+        method: The HTTP method of the request.
+        url: The fully rendered URL of the request.
+        query_args: The query arguments of the request.
+
+    Returns:
+        The cache key.
+    """
+    key = f"{method.upper()} {url}"
+    if query_args:
+        key += f"?{urllib.parse.urlencode(sorted(query_args.items()))}"
+    return key
+
+
+VALIDATOR_HEADERS = ("etag", "last-modified")
+"""The response headers kept to revalidate a stale entry."""
+
+
+@dataclass
+class CacheEntry:
+    """A cached API response."""
+
+    content: bytes
+    """The raw response body."""
+    expires_at: float
+    """The Unix timestamp after which the entry is stale."""
+    headers: Dict[str, str] = field(default_factory=dict)
+    """The response headers worth keeping."""
+    value: Any = None
+    """The decoded response, only kept by in-memory backends."""
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    def fresh(self, now: Optional[float] = None) -> bool:
+        return (time.time() if now is None else now) < self.expires_at
+
+    def validators(self) -> Optional[Dict[str, str]]:
+        """Returns the headers of a conditional request for this entry."""
+        headers = {}
+        if self.headers.get("etag"):
+            headers["If-None-Match"] = self.headers["etag"]
+        if self.headers.get("last-modified"):
+            headers["If-Modified-Since"] = self.headers["last-modified"]
+        return headers or None
+
+
+class ResponseCache(abc.ABC):
+    """Interface of the response cache backends.
+
+    Backends have to be safe to use from several threads.
+    """
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Returns the entry of a key, None if it is not cached."""
+
+    @abc.abstractmethod
+    def set(self, key: str, entry: CacheEntry):
+        """Stores the entry of a key."""
+
+    @abc.abstractmethod
+    def delete(self, key: str):
+        """Removes the entry of a key."""
+
+    @abc.abstractmethod
+    def clear(self):
+        """Removes all entries."""
+
+
+class MemoryCache(ResponseCache):
+    """In-memory LRU cache that evicts by the size of the response bodies.
+
+    Decoded responses are cached as well, so a hit returns the same object
+    to every caller.
+
+    Args:
+        max_size: The maximum total size of the cached bodies in bytes.
+        max_entries: The maximum number of entries.
+    """
+
+    def __init__(
+        self, max_size: int = 256 * 1024 * 1024, max_entries: Optional[int] = None
+    ):
+        self.max_size = max_size
+        self.max_entries = max_entries
+        self.size = 0
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry):
+        if entry.size > self.max_size:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= old.size
+            self._entries[key] = entry
+            self.size += entry.size
+            while self.size > self.max_size or (
+                self.max_entries is not None and len(self._entries) > self.max_entries
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= evicted.size
+
+    def delete(self, key: str):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.size -= entry.size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
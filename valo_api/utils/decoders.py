@@ -0,0 +1,101 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, TypeVar
+
+import threading
+
+import msgspec
+
+from valo_api.utils.dict_struct import DictStruct
+
+T = TypeVar("T")
+
+_response_types: Dict[Any, Type[DictStruct]] = {}
+_decoders: Dict[Tuple[Any, bool], msgspec.json.Decoder] = {}
+_lock = threading.Lock()
+
+
+def response_type(api_type: Type[T]) -> Type[DictStruct]:
+    """Returns the ``{"status": ..., "data": ...}`` envelope for a type.
+
+    The envelope class is only created once per ``api_type``, so msgspec can
+    reuse the type information it built for it.
+
+    Args:
+        api_type: The type of the ``data`` field.
+
+    Returns:
+        The envelope struct type.
+    """
+    try:
+        return _response_types[api_type]
+    except KeyError:
+        pass
+    with _lock:
+        if api_type not in _response_types:
+
+            class APIResponse(DictStruct):
+                status: int
+                data: api_type
+
+            _response_types[api_type] = APIResponse
+        return _response_types[api_type]
+
+
+def get_decoder(return_type: Any, data_response: bool = True) -> msgspec.json.Decoder:
+    """Returns the cached JSON decoder for a response type.
+
+    Args:
+        return_type: The type the response (or its ``data`` field) decodes to.
+        data_response: Whether the payload is wrapped in a ``data`` envelope.
+
+    Returns:
+        A prebuilt :class:`msgspec.json.Decoder`.
+    """
+    key = (return_type, data_response)
+    try:
+        return _decoders[key]
+    except KeyError:
+        pass
+    decode_type = response_type(return_type) if data_response else return_type
+    decoder = msgspec.json.Decoder(decode_type)
+    with _lock:
+        return _decoders.setdefault(key, decoder)
+
+
+def _all_endpoints() -> List[Any]:
+    from valo_api.endpoints_config import EndpointsConfig
+
+    return [e.value for e in EndpointsConfig]
+
+
+def clear_decoders(endpoints: Optional[Iterable[Any]] = None) -> None:
+    """Drops all cached decoders.
+
+    Args:
+        endpoints: The endpoints whose own decoders are dropped as well,
+            defaults to all endpoints of
+            :class:`valo_api.endpoints_config.EndpointsConfig`.
+    """
+    if endpoints is None:
+        endpoints = _all_endpoints()
+    with _lock:
+        _decoders.clear()
+        for endpoint in endpoints:
+            endpoint._decoders.clear()
+
+
+def warm_decoders(endpoints: Optional[Iterable[Any]] = None) -> int:
+    """Builds the decoders of all endpoints ahead of the first request.
+
+    Args:
+        endpoints: The endpoints to warm up, defaults to all endpoints
+            of :class:`valo_api.endpoints_config.EndpointsConfig`.
+
+    Returns:
+        The number of decoders in the registry.
+    """
+    if endpoints is None:
+        endpoints = _all_endpoints()
+    for endpoint in endpoints:
+        for version in endpoint.versions:
+            endpoint.decoder(version)
+    return len(_decoders)
@@ -0,0 +1,184 @@
+from typing import Callable, Dict, Optional, Tuple
+
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from valo_api.utils.cache import CacheEntry, ResponseCache
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def _codecs(
+    compression: Optional[str], level: Optional[int]
+) -> Tuple[Callable[[bytes], bytes], Dict[str, Callable[[bytes], bytes]]]:
+    decompress = {"none": lambda data: data, "gzip": gzip.decompress}
+    if zstandard is not None:
+        decompress["zstd"] = lambda data: zstandard.ZstdDecompressor().decompress(data)
+
+    if compression is None or compression == "none":
+        return lambda data: data, decompress
+    if compression == "gzip":
+        return (
+            lambda data: gzip.compress(data, 6 if level is None else level),
+            decompress,
+        )
+    if compression == "zstd":
+        if zstandard is None:
+            raise ImportError("zstd compression requires the zstandard package")
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+        return compressor.compress, decompress
+    raise ValueError(f"Unknown compression: {compression}")
+
+
+class DiskCache(ResponseCache):
+    """Persistent cache that keeps the raw response bodies in SQLite.
+
+    Bodies are stored once per SHA-256 digest of their content and
+    optionally compressed. When the stored bodies exceed ``max_size`` the
+    least recently used ones are evicted. Decoded objects are not stored,
+    a hit is decoded again.
+
+    Args:
+        path: The SQLite database file.
+        max_size: The maximum total size of the stored bodies in bytes.
+        compression: ``"gzip"``, ``"zstd"`` (requires ``zstandard``) or None.
+        compression_level: The compression level, defaults to the codec's
+            default.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int = 1024 * 1024 * 1024,
+        compression: Optional[str] = "gzip",
+        compression_level: Optional[int] = None,
+    ):
+        self.path = path
+        self.max_size = max_size
+        self.compression = compression or "none"
+        self._compress, self._decompress = _codecs(compression, compression_level)
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS blobs ("
+                "digest TEXT PRIMARY KEY, codec TEXT NOT NULL, data BLOB NOT NULL, "
+                "size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, digest TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, headers TEXT NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS blobs_accessed ON blobs (accessed)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS entries_digest ON entries (digest)"
+            )
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT e.digest, e.expires_at, e.headers, b.codec, b.data "
+                "FROM entries e JOIN blobs b ON b.digest = e.digest WHERE e.key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            digest, expires_at, headers, codec, data = row
+            self._db.execute(
+                "UPDATE blobs SET accessed = ? WHERE digest = ?",
+                (time.time(), digest),
+            )
+        return CacheEntry(
+            content=self._decompress[codec](data),
+            expires_at=expires_at,
+            headers=json.loads(headers),
+        )
+
+    def set(self, key: str, entry: CacheEntry):
+        digest = hashlib.sha256(entry.content).hexdigest()
+        with self._lock, self._db:
+            exists = self._db.execute(
+                "SELECT 1 FROM blobs WHERE digest = ?", (digest,)
+            ).fetchone()
+            if exists is None:
+                data = self._compress(entry.content)
+                if len(data) > self.max_size:
+                    return
+                self._db.execute(
+                    "INSERT INTO blobs VALUES (?, ?, ?, ?, ?)",
+                    (digest, self.compression, data, len(data), time.time()),
+                )
+            old = self._db.execute(
+                "SELECT digest FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (key, digest, entry.expires_at, json.dumps(entry.headers)),
+            )
+            if old is not None and old[0] != digest:
+                # Drop the replaced body unless another key shares it.
+                self._db.execute(
+                    "DELETE FROM blobs WHERE digest = ? AND NOT EXISTS "
+                    "(SELECT 1 FROM entries WHERE digest = ?)",
+                    (old[0], old[0]),
+                )
+            self._evict()
+
+    def _evict(self):
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()
+        total = total[0]
+        if total <= self.max_size:
+            return
+        evicted = []
+        for digest, size in self._db.execute(
+            "SELECT digest, size FROM blobs ORDER BY accessed"
+        ).fetchall():
+            evicted.append((digest,))
+            total -= size
+            if total <= self.max_size:
+                break
+        self._db.executemany("DELETE FROM entries WHERE digest = ?", evicted)
+        self._db.executemany("DELETE FROM blobs WHERE digest = ?", evicted)
+
+    def delete(self, key: str):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._db.execute(
+                "DELETE FROM blobs WHERE digest NOT IN (SELECT digest FROM entries)"
+            )
+
+    def clear(self):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM entries")
+            self._db.execute("DELETE FROM blobs")
+
+    @property
+    def size(self) -> int:
+        """The total size of the stored bodies in bytes."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM blobs"
+            ).fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
@@ -1,15 +1,22 @@
-from typing import Any, Dict, Optional, Type, TypeVar
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional
 
+import asyncio
+import contextlib
+import importlib.util
 import json
 import os
 import urllib.parse
+import weakref
 
 import requests
 from requests import Response
 
 from valo_api.config import Config
 from valo_api.exceptions.rate_limit import set_rate_limit
-from valo_api.utils.dict_struct import DictStruct
+from valo_api.utils.decoders import response_type  # noqa: F401 (re-export)
+
+if TYPE_CHECKING:
+    import aiohttp
 
 
 def parse_endpoint(endpoint_definition, **kwargs):
@@ -52,21 +59,14 @@ def encode_params(**kwargs) -> Dict[str, str]:
     return out
 
 
-T = TypeVar("T")
-
-
-def response_type(api_type: Type[T]):
-    class APIResponse(DictStruct):
-        status: int
-        data: api_type
-
-    return APIResponse
-
-
 def fetch_endpoint(
     endpoint_definition: str,
     query_args: Optional[Dict[str, Any]] = None,
     method: str = "GET",
+    session: Optional[requests.Session] = None,
+    timeout: Optional[float] = None,
+    headers: Optional[Dict[str, str]] = None,
+    stream: bool = False,
     **kwargs,
 ) -> Response:
     """Fetches an endpoint from the API.
@@ -75,18 +75,24 @@ def fetch_endpoint(
         endpoint_definition: The endpoint definition to use.
         query_args: Any additional arguments to pass to the endpoint.
         method: The method to use when fetching the endpoint.
+        session: The session to use, defaults to a shared session.
+        timeout: The timeout of the request in seconds.
+        headers: Additional headers to send.
+        stream: Whether to leave the body unread, to iterate over it.
         **kwargs: Any additional arguments to pass to the endpoint.
 
     Returns:
         A response from the API.
     """
-    fetch_endpoint.session = (
-        fetch_endpoint.session
-        if hasattr(fetch_endpoint, "session")
-        else requests.Session()
-    )
+    if session is None:
+        fetch_endpoint.session = (
+            fetch_endpoint.session
+            if hasattr(fetch_endpoint, "session")
+            else requests.Session()
+        )
+        session = fetch_endpoint.session
     url = parse_endpoint(endpoint_definition, **kwargs)
-    headers = get_headers()
+    headers = {**get_headers(), **(headers or {})}
     if (
         "queries" in query_args
         and query_args["queries"] is not None
@@ -94,47 +100,98 @@ def fetch_endpoint(
     ):
         queries = json.loads(query_args["queries"])
         query_args["queries"] = f"?{urllib.parse.urlencode(queries)}"
-    response = fetch_endpoint.session.request(
-        method, url, params=query_args, json=query_args, headers=headers
+    response = session.request(
+        method,
+        url,
+        params=query_args,
+        json=query_args,
+        headers=headers,
+        timeout=timeout,
+        stream=stream,
     )
     set_rate_limit(response.headers)
     return response
 
 
-try:
-    import aiohttp
+if importlib.util.find_spec("aiohttp") is not None:
+    # aiohttp is only imported once the first asynchronous request is sent.
+    _async_sessions = weakref.WeakKeyDictionary()
 
-    async def fetch_endpoint_async(
+    def default_async_session() -> "aiohttp.ClientSession":
+        """Returns the shared session of the running event loop.
+
+        A session can only be used on the loop it was created on, so one
+        session is kept per event loop.
+
+        Returns:
+            The session of the running event loop.
+        """
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        session = _async_sessions.get(loop)
+        if session is None or session.closed:
+            session = _async_sessions[loop] = aiohttp.ClientSession()
+        return session
+
+    @contextlib.asynccontextmanager
+    async def open_endpoint_async(
         endpoint_definition: str,
         query_args: Optional[Dict[str, Any]] = None,
         method: str = "GET",
+        session: Optional["aiohttp.ClientSession"] = None,
+        headers: Optional[Dict[str, str]] = None,
         **kwargs,
-    ):
-        """Fetches an endpoint from the API asynchronously.
+    ) -> AsyncIterator["aiohttp.ClientResponse"]:
+        """Opens a request to the API, leaving the body unread.
 
         Args:
             endpoint_definition: The endpoint definition to use.
             query_args: Any additional arguments to pass to the endpoint.
             method: The method to use when fetching the endpoint.
+            session: The session to use, defaults to the session of the
+                running event loop.
+            headers: Additional headers to send.
             **kwargs: Any additional arguments to pass to the endpoint.
 
         Returns:
-            A response from the API.
+            A context manager yielding the response, which is released on
+            exit.
         """
-        fetch_endpoint_async.session = (
-            fetch_endpoint_async.session
-            if hasattr(fetch_endpoint_async, "session")
-            else aiohttp.ClientSession()
-        )
+        session = session or default_async_session()
         url = parse_endpoint(endpoint_definition, **kwargs)
-        headers = get_headers()
+        headers = {**get_headers(), **(headers or {})}
         if "queries" in query_args:
             query_args["queries"] = f"?{urllib.parse.urlencode(query_args['queries'])}"
-        async with fetch_endpoint_async.session.request(
+        async with session.request(
             method, url, params=query_args, json=query_args, headers=headers
         ) as response:
             set_rate_limit(response.headers)
-            return response, await response.read()
+            yield response
+
+    async def fetch_endpoint_async(
+        endpoint_definition: str,
+        query_args: Optional[Dict[str, Any]] = None,
+        method: str = "GET",
+        session: Optional["aiohttp.ClientSession"] = None,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ):
+        """Fetches an endpoint from the API asynchronously.
+
+        Args:
+            endpoint_definition: The endpoint definition to use.
+            query_args: Any additional arguments to pass to the endpoint.
+            method: The method to use when fetching the endpoint.
+            session: The session to use, defaults to the session of the
+                running event loop.
+            headers: Additional headers to send.
+            **kwargs: Any additional arguments to pass to the endpoint.
 
-except ImportError:
-    pass
+        Returns:
+            A response from the API.
+        """
+        async with open_endpoint_async(
+            endpoint_definition, query_args, method, session, headers, **kwargs
+        ) as response:
+            return response, await response.read()
@@ -0,0 +1,166 @@
+from typing import Any, Callable, Dict, Optional
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from valo_api.responses.account_details import AccountDetails
+from valo_api.responses.leaderboard import (
+    LeaderboardPlayerV1,
+    LeaderboardPlayerV2,
+    LeaderboardV2,
+)
+from valo_api.responses.match_history import MatchHistoryPointV3
+
+
+@dataclass(frozen=True)
+class Identity:
+    """The Riot ID of a puuid."""
+
+    puuid: str
+    name: str
+    tag: str
+    updated: Optional[int] = None
+    """The Unix timestamp the Riot ID was seen at, None if unknown."""
+
+
+def _name_key(name: str, tag: str) -> str:
+    return f"{name}#{tag}".casefold()
+
+
+class IdentityCache:
+    """Maps Riot IDs (``name#tag``) to puuids and back.
+
+    The cache is filled from decoded results: account details, the players
+    of matches and leaderboard players. A client with an identity cache
+    sends ``*_by_name`` requests of known players to the ``*_by_puuid``
+    endpoints, whose responses and cache keys do not change when a player
+    renames. If such a response has another Riot ID than the requested one,
+    the Riot ID is forgotten and the request is sent by name.
+
+    When a puuid shows up with another Riot ID, the newer one replaces it.
+    The time of an observation is ``last_update_raw`` for account details,
+    ``game_start`` for matches and ``last_update`` for leaderboards.
+
+    Args:
+        max_entries: The maximum number of puuids, the least recently used
+            ones are evicted.
+        on_rename: Called with the old and the new :class:`Identity` when
+            a puuid changes its Riot ID.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 100_000,
+        on_rename: Optional[Callable[[Identity, Identity], None]] = None,
+    ):
+        self.max_entries = max_entries
+        self.on_rename = on_rename
+        self._by_puuid: "OrderedDict[str, Identity]" = OrderedDict()
+        self._by_name: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def add(
+        self, puuid: str, name: str, tag: str, updated: Optional[int] = None
+    ) -> bool:
+        """Records the Riot ID of a puuid.
+
+        Args:
+            puuid: The puuid.
+            name: The name of the Riot ID.
+            tag: The tag of the Riot ID.
+            updated: When the Riot ID was seen, older observations than the
+                recorded one are ignored.
+
+        Returns:
+            Whether the cache changed.
+        """
+        if not puuid or not name:
+            return False
+        identity = Identity(puuid, name, tag, updated)
+        with self._lock:
+            old = self._by_puuid.get(puuid)
+            if old is not None:
+                self._by_puuid.move_to_end(puuid)
+                if (old.name, old.tag) == (name, tag) or (
+                    old.updated is not None
+                    and updated is not None
+                    and updated < old.updated
+                ):
+                    return False
+                if self._by_name.get(_name_key(old.name, old.tag)) == puuid:
+                    del self._by_name[_name_key(old.name, old.tag)]
+            self._by_puuid[puuid] = identity
+            self._by_name[_name_key(name, tag)] = puuid
+            while self.max_entries is not None and len(self._by_puuid) > (
+                self.max_entries
+            ):
+                _, evicted = self._by_puuid.popitem(last=False)
+                key = _name_key(evicted.name, evicted.tag)
+                if self._by_name.get(key) == evicted.puuid:
+                    del self._by_name[key]
+        if old is not None and self.on_rename is not None:
+            self.on_rename(old, identity)
+        return True
+
+    def puuid(self, name: str, tag: str) -> Optional[str]:
+        """Returns the puuid of a Riot ID, ignoring case."""
+        return self._by_name.get(_name_key(name, tag))
+
+    def identity(self, puuid: str) -> Optional[Identity]:
+        """Returns the latest known Riot ID of a puuid."""
+        return self._by_puuid.get(puuid)
+
+    def invalidate(self, puuid: str):
+        """Forgets a puuid and its Riot ID."""
+        with self._lock:
+            identity = self._by_puuid.pop(puuid, None)
+            if identity is not None:
+                key = _name_key(identity.name, identity.tag)
+                if self._by_name.get(key) == puuid:
+                    del self._by_name[key]
+
+    def forget(self, name: str, tag: str):
+        """Forgets the puuid of a Riot ID, e.g. after it turned out stale."""
+        with self._lock:
+            self._by_name.pop(_name_key(name, tag), None)
+
+    def clear(self):
+        with self._lock:
+            self._by_puuid.clear()
+            self._by_name.clear()
+
+    def __len__(self) -> int:
+        return len(self._by_puuid)
+
+    def observe(self, result: Any) -> Any:
+        """Records the Riot IDs found in a decoded result.
+
+        Args:
+            result: A decoded result or a list of them. Account details,
+                matches and leaderboards are recognized, other results are
+                ignored.
+
+        Returns:
+            The same result.
+        """
+        for item in result if isinstance(result, list) else (result,):
+            if isinstance(item, AccountDetails):
+                self.add(item.puuid, item.name, item.tag, item.last_update_raw)
+            elif isinstance(item, MatchHistoryPointV3):
+                for player in item.players.all_players:
+                    self.add(
+                        player.puuid, player.name, player.tag, item.metadata.game_start
+                    )
+            elif isinstance(item, LeaderboardV2):
+                for player in item.players:
+                    if player is not None:
+                        self.add(
+                            player.puuid,
+                            player.gameName,
+                            player.tagLine,
+                            item.last_update,
+                        )
+            elif isinstance(item, (LeaderboardPlayerV1, LeaderboardPlayerV2)):
+                self.add(item.puuid, item.gameName, item.tagLine)
+        return result
@@ -0,0 +1,96 @@
+from typing import Any, Callable, Dict, List, Tuple, Type, Union, get_args, get_origin
+
+import sys
+import threading
+
+import msgspec
+
+INTERN_MODES = ("match", "process")
+"""``"match"`` shares equal strings within each match (or other result
+item), ``"process"`` shares them with every result via :func:`sys.intern`."""
+
+_plans: Dict[Type[msgspec.Struct], Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+_lock = threading.Lock()
+_scalars = (int, float, bool, type(None))
+
+
+def _is_string(type_: Any) -> bool:
+    if type_ is str:
+        return True
+    return get_origin(type_) is Union and str in get_args(type_)
+
+
+def _plan(struct_type: Type[msgspec.Struct]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    try:
+        return _plans[struct_type]
+    except KeyError:
+        pass
+    strings: List[str] = []
+    children: List[str] = []
+    for field in msgspec.structs.fields(struct_type):
+        if _is_string(field.type):
+            strings.append(field.name)
+        elif field.type not in _scalars:
+            children.append(field.name)
+    with _lock:
+        return _plans.setdefault(struct_type, (tuple(strings), tuple(children)))
+
+
+def _table() -> Callable[[str], str]:
+    strings: Dict[str, str] = {}
+
+    def intern(value: str) -> str:
+        return strings.setdefault(value, value)
+
+    return intern
+
+
+def _intern(obj: Any, intern: Callable[[str], str]) -> None:
+    if isinstance(obj, msgspec.Struct):
+        strings, children = _plan(type(obj))
+        for name in strings:
+            value = getattr(obj, name)
+            if type(value) is str:
+                setattr(obj, name, intern(value))
+            elif value is not None:
+                _intern(value, intern)
+        for name in children:
+            value = getattr(obj, name)
+            if value is not None:
+                _intern(value, intern)
+    elif isinstance(obj, list):
+        for index, item in enumerate(obj):
+            if type(item) is str:
+                obj[index] = intern(item)
+            elif not isinstance(item, _scalars):
+                _intern(item, intern)
+    elif isinstance(obj, dict):
+        for key, value in obj.items():
+            if type(value) is str:
+                obj[key] = intern(value)
+            elif not isinstance(value, _scalars):
+                _intern(value, intern)
+
+
+def intern_strings(result: Any, mode: str = "match") -> Any:
+    """Makes equal strings of a decoded result share one object.
+
+    Decoding creates a new string for every occurrence, so puuids, names,
+    teams and asset URLs exist hundreds of times per match. The strings of
+    the result are replaced in place by one shared instance per value.
+
+    Args:
+        result: The decoded result, a struct or a list of structs.
+        mode: One of :data:`INTERN_MODES`.
+
+    Returns:
+        The same result.
+    """
+    if mode == "process":
+        _intern(result, sys.intern)
+    elif mode == "match":
+        for item in result if isinstance(result, list) else (result,):
+            _intern(item, _table())
+    else:
+        raise ValueError(f"mode must be one of {', '.join(INTERN_MODES)}")
+    return result
@@ -0,0 +1,178 @@
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List, Sequence
+
+import re
+
+_STRUCTURAL = re.compile(rb'[\[\]{}",]')
+_STRING_END = re.compile(rb'["\\]')
+_WHITESPACE = b" \t\r\n"
+
+
+class ArrayItemScanner:
+    """Splits a JSON array out of a document that is fed in chunks.
+
+    The array is located by the object keys leading to it, e.g.
+    ``("data",)`` for ``{"status": 200, "data": [...]}`` or ``()`` for a
+    document that is an array itself. Only the raw bytes of the items are
+    returned, so they can be decoded one by one and the buffer never holds
+    more than the item being read.
+
+    Args:
+        path: The object keys leading to the array.
+    """
+
+    def __init__(self, path: Sequence[str] = ()):
+        self.path = [key.encode() for key in path]
+        self.done = False
+        self._buffer = bytearray()
+        self._pos = 0
+        # Containers around the array, as [bracket, current key] pairs.
+        self._stack: List[list] = []
+        self._expect_key = False
+        self._in_items = False
+        self._depth = 0
+        self._item_start = 0
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Adds the next chunk of the document.
+
+        Args:
+            chunk: The next bytes of the document.
+
+        Returns:
+            The raw bytes of the items completed by this chunk.
+        """
+        if self.done:
+            return []
+        self._buffer += chunk
+        items: List[bytes] = []
+        buffer = self._buffer
+        pos = self._pos
+        while not self.done:
+            match = _STRUCTURAL.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+            pos = match.start()
+            char = buffer[pos]
+            if char == 0x22:  # "
+                end = self._string_end(pos + 1)
+                if end < 0:
+                    break
+                if not self._in_items and self._expect_key:
+                    self._stack[-1][1] = bytes(buffer[pos + 1 : end])
+                    self._expect_key = False
+                pos = end + 1
+            elif self._in_items:
+                pos = self._item_char(char, pos, items)
+            else:
+                self._seek_char(char, pos)
+                pos += 1
+        self._pos = pos
+        self._compact()
+        return items
+
+    def _string_end(self, pos: int) -> int:
+        buffer = self._buffer
+        while True:
+            match = _STRING_END.search(buffer, pos)
+            if match is None:
+                return -1
+            if buffer[match.start()] == 0x22:
+                return match.start()
+            pos = match.start() + 2
+            if pos > len(buffer):
+                return -1
+
+    def _seek_char(self, char: int, pos: int):
+        if char in b"{[":
+            if char == 0x5B and self._at_path():
+                self._in_items = True
+                self._item_start = pos + 1
+                return
+            self._stack.append([char, None])
+            self._expect_key = char == 0x7B
+        elif char in b"}]":
+            if self._stack:
+                self._stack.pop()
+            self._expect_key = False
+        elif char == 0x2C:  # ,
+            self._expect_key = bool(self._stack) and self._stack[-1][0] == 0x7B
+
+    def _at_path(self) -> bool:
+        if len(self._stack) != len(self.path):
+            return False
+        return all(
+            bracket == 0x7B and key == expected
+            for (bracket, key), expected in zip(self._stack, self.path)
+        )
+
+    def _item_char(self, char: int, pos: int, items: List[bytes]) -> int:
+        if char in b"{[":
+            self._depth += 1
+        elif char in b"}]":
+            if self._depth == 0:
+                self._emit(pos, items)
+                self.done = True
+                return pos + 1
+            self._depth -= 1
+        elif char == 0x2C and self._depth == 0:
+            self._emit(pos, items)
+            self._item_start = pos + 1
+        return pos + 1
+
+    def _emit(self, end: int, items: List[bytes]):
+        item = bytes(self._buffer[self._item_start : end]).strip(_WHITESPACE)
+        if item:
+            items.append(item)
+
+    def _compact(self):
+        keep = self._item_start if self._in_items else self._pos
+        if self.done:
+            keep = len(self._buffer)
+        if keep > 0 and (keep > 65536 or keep == len(self._buffer)):
+            del self._buffer[:keep]
+            self._pos -= keep
+            self._item_start -= keep
+
+
+def iter_array_items(
+    chunks: Iterable[bytes], path: Sequence[str] = ()
+) -> Iterator[bytes]:
+    """Yields the raw items of a JSON array from a chunked document.
+
+    Args:
+        chunks: The chunks of the document.
+        path: The object keys leading to the array.
+
+    Returns:
+        An iterator over the raw bytes of the items.
+    """
+    scanner = ArrayItemScanner(path)
+    for chunk in chunks:
+        yield from scanner.feed(chunk)
+        if scanner.done:
+            return
+    if not scanner.done:
+        raise ValueError("The document ended before the array was complete")
+
+
+async def iter_array_items_async(
+    chunks: AsyncIterable[bytes], path: Sequence[str] = ()
+) -> AsyncIterator[bytes]:
+    """Yields the raw items of a JSON array from an asynchronous chunked document.
+
+    Args:
+        chunks: The chunks of the document.
+        path: The object keys leading to the array.
+
+    Returns:
+        An asynchronous iterator over the raw bytes of the items.
+    """
+    scanner = ArrayItemScanner(path)
+    async for chunk in chunks:
+        for item in scanner.feed(chunk):
+            yield item
+        if scanner.done:
+            return
+    if not scanner.done:
+        raise ValueError("The document ended before the array was complete")
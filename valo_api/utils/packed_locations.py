@@ -0,0 +1,175 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union, overload
+
+from array import array
+from collections import abc
+
+from valo_api.responses.match_history import Location, MatchRoundPlayerLocationV3
+
+
+class PlayerTable:
+    """The players of one match, shared by all its packed locations.
+
+    Every puuid is stored once, together with the display name and team it
+    had in the match.
+    """
+
+    __slots__ = ("puuids", "display_names", "teams", "_index")
+
+    def __init__(self):
+        self.puuids: List[str] = []
+        self.display_names: List[str] = []
+        self.teams: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def index(self, puuid: str, display_name: str, team: str) -> int:
+        """Returns the index of a player, adding it if it is new."""
+        index = self._index.get(puuid)
+        if index is None:
+            index = self._index[puuid] = len(self.puuids)
+            self.puuids.append(puuid)
+            self.display_names.append(display_name)
+            self.teams.append(team)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.puuids)
+
+
+class PackedLocations(abc.Sequence):
+    """A list of :class:`MatchRoundPlayerLocationV3` stored as packed arrays.
+
+    Coordinates, view angles and player indices are kept in typed arrays,
+    the player strings in the :class:`PlayerTable` of the match. Items are
+    built on access, so code iterating over the locations keeps working.
+    """
+
+    __slots__ = ("players", "player", "x", "y", "view_radians")
+
+    def __init__(self, players: PlayerTable):
+        self.players = players
+        self.player = array("H")
+        self.x = array("i")
+        self.y = array("i")
+        self.view_radians = array("d")
+
+    @classmethod
+    def pack(
+        cls, locations: Iterable[MatchRoundPlayerLocationV3], players: PlayerTable
+    ) -> "PackedLocations":
+        """Packs decoded locations.
+
+        Args:
+            locations: The locations.
+            players: The player table of the match.
+
+        Returns:
+            The packed locations.
+        """
+        packed = cls(players)
+        for location in locations:
+            packed.player.append(
+                players.index(
+                    location.player_puuid,
+                    location.player_display_name,
+                    location.player_team,
+                )
+            )
+            packed.x.append(location.location.x)
+            packed.y.append(location.location.y)
+            packed.view_radians.append(location.view_radians)
+        return packed
+
+    @overload
+    def __getitem__(self, index: int) -> MatchRoundPlayerLocationV3: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[MatchRoundPlayerLocationV3]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        player = self.player[index]
+        return MatchRoundPlayerLocationV3(
+            player_puuid=self.players.puuids[player],
+            player_display_name=self.players.display_names[player],
+            player_team=self.players.teams[player],
+            location=Location(x=self.x[index], y=self.y[index]),
+            view_radians=self.view_radians[index],
+        )
+
+    def __len__(self) -> int:
+        return len(self.player)
+
+    def to_list(self) -> List[MatchRoundPlayerLocationV3]:
+        """Returns the locations as a list of structs."""
+        return self[:]
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, abc.Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"PackedLocations({list(self)!r})"
+
+
+def enc_hook(obj: Any) -> Any:
+    """Encodes :class:`PackedLocations` as lists for msgspec.
+
+    Example::
+
+        msgspec.json.encode(match, enc_hook=enc_hook)
+    """
+    if isinstance(obj, PackedLocations):
+        return obj.to_list()
+    raise NotImplementedError(f"Objects of type {type(obj)} are not supported")
+
+
+def _pack(
+    locations: Optional[Sequence[MatchRoundPlayerLocationV3]], players: PlayerTable
+) -> Optional[Sequence[MatchRoundPlayerLocationV3]]:
+    if locations is None or isinstance(locations, PackedLocations):
+        return locations
+    return PackedLocations.pack(locations, players)
+
+
+def _pack_match(match: Any) -> None:
+    players = PlayerTable()
+    kills = list(getattr(match, "kills", None) or ())
+    for match_round in getattr(match, "rounds", None) or ():
+        plant = getattr(match_round, "plant_events", None)
+        if getattr(plant, "player_locations_on_plant", None) is not None:
+            plant.player_locations_on_plant = _pack(
+                plant.player_locations_on_plant, players
+            )
+        defuse = getattr(match_round, "defuse_events", None)
+        if getattr(defuse, "player_locations_on_defuse", None) is not None:
+            defuse.player_locations_on_defuse = _pack(
+                defuse.player_locations_on_defuse, players
+            )
+        for stats in getattr(match_round, "player_stats", None) or ():
+            kills.extend(getattr(stats, "kill_events", None) or ())
+    for kill in kills:
+        if getattr(kill, "player_locations_on_kill", None) is not None:
+            kill.player_locations_on_kill = _pack(
+                kill.player_locations_on_kill, players
+            )
+
+
+def pack_locations(result: Union[Any, List[Any]]) -> Union[Any, List[Any]]:
+    """Replaces the player location lists of matches with packed arrays.
+
+    The locations on kills, plants and defuses are converted in place into
+    :class:`PackedLocations`, sharing one :class:`PlayerTable` per match.
+    Other results are returned unchanged.
+
+    Args:
+        result: A match, e.g. a ``MatchHistoryPointV3``, or a list of matches.
+
+    Returns:
+        The same result.
+    """
+    for match in result if isinstance(result, list) else (result,):
+        if hasattr(match, "rounds") or hasattr(match, "kills"):
+            _pack_match(match)
+    return result
@@ -0,0 +1,134 @@
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+import threading
+
+import msgspec
+
+from valo_api.utils.dict_struct import DictStruct
+
+Projection = Union[Iterable[str], Type[msgspec.Struct]]
+"""A projection, either field paths such as ``"players.all_players.stats"``
+or a struct type declaring the fields to decode."""
+
+_projections: Dict[Tuple[Any, Any], Any] = {}
+_lock = threading.Lock()
+_generics = {list: List, set: Set, frozenset: FrozenSet}
+
+
+def _is_struct(type_: Any) -> bool:
+    return isinstance(type_, type) and issubclass(type_, msgspec.Struct)
+
+
+def _paths_tree(paths: Iterable[str]) -> Dict[str, Optional[dict]]:
+    tree: Dict[str, Optional[dict]] = {}
+    for path in paths:
+        node = tree
+        *parents, leaf = path.split(".")
+        for name in parents:
+            child = node.get(name, {})
+            if child is None:
+                # The whole parent is already requested.
+                break
+            node = node.setdefault(name, child)
+        else:
+            node[leaf] = None
+    return tree
+
+
+def _project(type_: Any, tree: Any) -> Any:
+    if _is_struct(type_):
+        return tree if _is_struct(tree) else _project_struct(type_, tree)
+    origin = get_origin(type_)
+    args = get_args(type_)
+    if origin is Union:
+        projectable = [a for a in args if _is_struct(a) or get_args(a)]
+        if not projectable:
+            raise ValueError(f"Cannot project into {type_}")
+        return Union[tuple(_project(a, tree) if a in projectable else a for a in args)]
+    if origin in _generics:
+        return _generics[origin][_project(args[0], tree)]
+    if origin is dict and len(args) == 2:
+        return Dict[args[0], _project(args[1], tree)]
+    raise ValueError(f"Cannot project into {type_}")
+
+
+def _project_struct(
+    struct_type: Type[msgspec.Struct], tree: Dict[str, Optional[dict]]
+) -> Type[DictStruct]:
+    fields = {f.name: f for f in msgspec.structs.fields(struct_type)}
+    unknown = set(tree) - set(fields)
+    if unknown:
+        raise ValueError(
+            f"{struct_type.__name__} has no fields {', '.join(sorted(unknown))}"
+        )
+    projected: List[tuple] = []
+    for name, field in fields.items():
+        if name not in tree:
+            continue
+        field_type = field.type
+        if tree[name] is not None:
+            field_type = _project(field_type, tree[name])
+        if field.default is not msgspec.NODEFAULT:
+            default = msgspec.field(default=field.default, name=field.encode_name)
+        elif field.default_factory is not msgspec.NODEFAULT:
+            default = msgspec.field(
+                default_factory=field.default_factory, name=field.encode_name
+            )
+        else:
+            default = msgspec.field(name=field.encode_name)
+        projected.append((name, field_type, default))
+    return msgspec.defstruct(
+        struct_type.__name__, projected, bases=(DictStruct,), kw_only=True
+    )
+
+
+def project(type_: Any, projection: Projection) -> Any:
+    """Returns a reduced version of a response type.
+
+    Only the fields named by the projection are kept, all other fields are
+    skipped while decoding instead of being built into structs. Nested
+    fields are named by dotted paths, lists, dicts and optionals along the
+    path are projected element-wise, e.g. ``["metadata",
+    "players.all_players.stats"]`` on ``List[MatchHistoryPointV3]``.
+
+    Args:
+        type_: The full response type.
+        projection: The field paths to keep, or a struct type which replaces
+            the struct inside lists, dicts and optionals.
+
+    Returns:
+        The projected type, built only once per type and projection.
+
+    Raises:
+        ValueError: If a path names a field the type does not have.
+    """
+    if isinstance(projection, str):
+        projection = [projection]
+    if not _is_struct(projection):
+        paths = set(projection)
+        # Paths below a requested field are already part of it.
+        projection = tuple(
+            sorted(p for p in paths if not any(p.startswith(f"{q}.") for q in paths))
+        )
+    key = (type_, projection)
+    try:
+        return _projections[key]
+    except KeyError:
+        pass
+    tree = projection if _is_struct(projection) else _paths_tree(projection)
+    projected = _project(type_, tree)
+    with _lock:
+        return _projections.setdefault(key, projected)
@@ -0,0 +1,178 @@
+from typing import Callable, Mapping, Optional
+
+import asyncio
+import threading
+import time
+
+_PROBE_POLL = 0.01
+
+
+def _header(headers: Mapping[str, str], name: str) -> Optional[int]:
+    try:
+        return int(headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """Token bucket that paces requests to the API rate limit.
+
+    The bucket holds ``limit`` requests per ``period`` seconds and learns the
+    real budget from the ``x-ratelimit-*`` and ``retry-after`` headers of
+    every response. Requests over budget are queued into the next period
+    instead of being sent and answered with a 429.
+    While the budget is unknown, only one request is sent to probe it and the
+    others wait for its response.
+    One limiter can be shared by threads and asyncio tasks.
+
+    Args:
+        limit: The number of requests per period, None to learn it from the
+            first response.
+        period: The length of a period in seconds.
+        clock: A monotonic clock returning seconds.
+        probe_timeout: The seconds to wait for the response of the probe before
+            another request may probe the budget.
+    """
+
+    def __init__(
+        self,
+        limit: Optional[int] = None,
+        period: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        probe_timeout: float = 10.0,
+    ):
+        self.limit = limit
+        self.period = period
+        self.probe_timeout = probe_timeout
+        self._clock = clock
+        self._tokens: Optional[int] = limit
+        self._reset_at = clock() + period
+        self._probe_until: Optional[float] = None
+        self._learned = threading.Event()
+        if limit is not None:
+            self._learned.set()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        if now < self._reset_at:
+            return
+        windows = 1 + int((now - self._reset_at) // self.period)
+        self._reset_at += windows * self.period
+        if self.limit is not None and self._tokens is not None:
+            self._tokens = min(min(self._tokens, 0) + windows * self.limit, self.limit)
+        else:
+            self._tokens = self.limit
+
+    def reserve(self) -> Optional[float]:
+        """Reserves a request.
+
+        Returns:
+            The number of seconds to wait before sending the request, or None
+            while another request probes the budget. Reserve again after the
+            probe's response, :meth:`acquire` does so.
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            if self._tokens is None:
+                if self._learned.is_set():
+                    return 0.0
+                if self._probe_until is not None and now < self._probe_until:
+                    return None
+                self._probe_until = now + self.probe_timeout
+                return 0.0
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            windows = (-self._tokens - 1) // max(self.limit or 1, 1)
+            return self._reset_at - now + windows * self.period
+
+    def _probe_wait(self) -> float:
+        with self._lock:
+            if self._probe_until is None:
+                return 0.0
+            return max(self._probe_until - self._clock(), 0.0)
+
+    def acquire(self) -> float:
+        """Blocks until a request may be sent.
+
+        Returns:
+            The number of seconds waited.
+        """
+        waited = 0.0
+        delay = self.reserve()
+        if delay is None:
+            start = time.monotonic()
+            while delay is None:
+                self._learned.wait(min(_PROBE_POLL, self._probe_wait()))
+                delay = self.reserve()
+            waited = time.monotonic() - start
+        if delay > 0:
+            time.sleep(delay)
+        return waited + delay
+
+    async def acquire_async(self) -> float:
+        """Waits until a request may be sent without blocking the event loop.
+
+        Returns:
+            The number of seconds waited.
+        """
+        waited = 0.0
+        delay = self.reserve()
+        if delay is None:
+            start = time.monotonic()
+            while delay is None:
+                await asyncio.sleep(min(_PROBE_POLL, self._probe_wait()))
+                delay = self.reserve()
+            waited = time.monotonic() - start
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return waited + delay
+
+    def release(self):
+        """Lets another request probe the budget after the probe failed without
+        a response, e.g. with a connection error. Does nothing once the budget
+        is known.
+        """
+        with self._lock:
+            if not self._learned.is_set():
+                self._probe_until = None
+
+    def update(self, headers: Mapping[str, str], status: Optional[int] = None):
+        """Learns the current budget from the headers of a response.
+
+        Args:
+            headers: The response headers.
+            status: The status code of the response.
+        """
+        limit = _header(headers, "x-ratelimit-limit")
+        remaining = _header(headers, "x-ratelimit-remaining")
+        retry_after = _header(headers, "retry-after")
+        reset = retry_after
+        if reset is None:
+            reset = _header(headers, "x-ratelimit-reset")
+
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._probe_until = None
+            self._learned.set()
+            if limit is not None and limit > 0:
+                self.limit = limit
+            if reset is not None and reset >= 0:
+                self._reset_at = now + reset
+            if status == 429:
+                remaining = 0
+                if reset is None:
+                    self._reset_at = max(self._reset_at, now + self.period)
+            if remaining is not None and remaining >= 0:
+                self._tokens = (
+                    remaining if self._tokens is None else min(self._tokens, remaining)
+                )
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """The number of requests left in the current period."""
+        with self._lock:
+            self._refill(self._clock())
+            return None if self._tokens is None else max(self._tokens, 0)
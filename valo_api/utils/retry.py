@@ -0,0 +1,171 @@
+from typing import Awaitable, Callable, FrozenSet, Mapping, Optional, Tuple, TypeVar
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+
+T = TypeVar("T")
+
+
+@dataclass
+class RetryAttempt:
+    """Timing of one attempt, passed to :attr:`RetryPolicy.on_attempt`."""
+
+    attempt: int
+    """The number of the attempt, starting at 1."""
+    elapsed: float
+    """The duration of the attempt in seconds."""
+    status: Optional[int] = None
+    """The status code of the response, None if the request failed."""
+    error: Optional[BaseException] = None
+    """The error raised by the request."""
+    delay: Optional[float] = None
+    """The seconds until the next attempt, None if there is none."""
+
+
+@dataclass
+class RetryPolicy:
+    """Retries failed requests with exponential backoff.
+
+    The delay before attempt ``n + 1`` is drawn from
+    ``[0, min(max_delay, base_delay * 2 ** (n - 1))]`` (full jitter), or is
+    the ``retry-after`` header of the response if there is one. A response
+    whose ``retry-after`` is longer than ``max_delay`` is not retried but
+    returned (and raised as usual), so a call never blocks longer than
+    ``max_delay`` between attempts.
+
+    Args:
+        max_attempts: The maximum number of attempts, including the first one.
+        base_delay: The backoff of the first retry in seconds.
+        max_delay: The maximum backoff in seconds, also the longest
+            ``retry-after`` that is waited for.
+        jitter: Whether to randomize the backoff.
+        respect_retry_after: Whether to wait as long as ``retry-after`` says.
+        statuses: The status codes to retry.
+        methods: The HTTP methods to retry.
+        on_attempt: Called with a :class:`RetryAttempt` after every attempt.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    jitter: bool = True
+    respect_retry_after: bool = True
+    statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    methods: FrozenSet[str] = frozenset({"GET"})
+    on_attempt: Optional[Callable[[RetryAttempt], None]] = None
+
+    def backoff(self, attempt: int, headers: Optional[Mapping[str, str]] = None):
+        """Returns the seconds to wait after a failed attempt.
+
+        Args:
+            attempt: The number of the failed attempt.
+            headers: The headers of the failed response.
+        """
+        if self.respect_retry_after and headers is not None:
+            try:
+                return max(0.0, float(headers["retry-after"]))
+            except (KeyError, TypeError, ValueError):
+                pass
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay  # nosec B311
+
+    def _next(
+        self,
+        method: str,
+        attempt: int,
+        started: float,
+        status: Optional[int] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        error: Optional[BaseException] = None,
+    ) -> Optional[float]:
+        retry = (
+            attempt < self.max_attempts
+            and method.upper() in self.methods
+            and (error is not None or status in self.statuses)
+        )
+        delay = self.backoff(attempt, headers) if retry else None
+        if delay is not None and delay > self.max_delay:
+            delay = None
+        if self.on_attempt is not None:
+            self.on_attempt(
+                RetryAttempt(
+                    attempt=attempt,
+                    elapsed=time.perf_counter() - started,
+                    status=status,
+                    error=error,
+                    delay=delay,
+                )
+            )
+        return delay
+
+    def call(
+        self,
+        send: Callable[[], T],
+        method: str,
+        inspect: Callable[[T], Tuple[int, Mapping[str, str]]],
+        errors: Tuple[type, ...] = (OSError,),
+    ) -> T:
+        """Sends a request until it succeeds or runs out of attempts.
+
+        Args:
+            send: Sends the request and returns the response.
+            method: The HTTP method of the request.
+            inspect: Returns the status code and headers of a response.
+            errors: The exceptions of ``send`` that are retried.
+
+        Returns:
+            The last response.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            started = time.perf_counter()
+            try:
+                response = send()
+            except errors as e:
+                delay = self._next(method, attempt, started, error=e)
+                if delay is None:
+                    raise
+            else:
+                status, headers = inspect(response)
+                delay = self._next(method, attempt, started, status, headers)
+                if delay is None:
+                    return response
+            time.sleep(delay)
+
+    async def call_async(
+        self,
+        send: Callable[[], Awaitable[T]],
+        method: str,
+        inspect: Callable[[T], Tuple[int, Mapping[str, str]]],
+        errors: Tuple[type, ...] = (OSError, asyncio.TimeoutError),
+    ) -> T:
+        """Sends a request asynchronously until it succeeds or runs out of attempts.
+
+        Args:
+            send: Sends the request and returns the response.
+            method: The HTTP method of the request.
+            inspect: Returns the status code and headers of a response.
+            errors: The exceptions of ``send`` that are retried.
+
+        Returns:
+            The last response.
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            started = time.perf_counter()
+            try:
+                response = await send()
+            except errors as e:
+                delay = self._next(method, attempt, started, error=e)
+                if delay is None:
+                    raise
+            else:
+                status, headers = inspect(response)
+                delay = self._next(method, attempt, started, status, headers)
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
@@ -0,0 +1,110 @@
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+import asyncio
+import threading
+
+T = TypeVar("T")
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _Flight:
+    def __init__(self, task: "asyncio.Future"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent identical calls into one.
+
+    While a call for a key is in flight, every other call with the same key
+    waits for it and receives the same result (or exception) instead of
+    running again. Works across threads (:meth:`do`) and across the tasks of
+    an event loop (:meth:`do_async`). An async call is only cancelled once
+    all of its callers are cancelled.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._futures: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], _Flight] = {}
+
+    def do(self, key: Hashable, function: Callable[[], T]) -> T:
+        """Runs ``function`` unless a call with the same key is in flight.
+
+        Args:
+            key: The key of the call.
+            function: The function to run.
+
+        Returns:
+            The result of the call in flight.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    async def do_async(self, key: Hashable, function: Callable[[], Awaitable[T]]) -> T:
+        """Awaits ``function()`` unless a call with the same key is in flight.
+
+        Args:
+            key: The key of the call.
+            function: Returns the awaitable to run.
+
+        Returns:
+            The result of the call in flight.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            flight = self._futures.get((loop, key))
+            if flight is None:
+                # The call runs in its own task, so cancelling one caller does
+                # not cancel it for the others.
+                flight = self._futures[(loop, key)] = _Flight(
+                    asyncio.ensure_future(function())
+                )
+                flight.task.add_done_callback(
+                    lambda _: self._forget((loop, key), flight)
+                )
+            flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            with self._lock:
+                flight.waiters -= 1
+                abandoned = flight.waiters == 0 and not flight.task.done()
+                if abandoned and self._futures.get((loop, key)) is flight:
+                    del self._futures[(loop, key)]
+            if abandoned:
+                flight.task.cancel()
+
+    def _forget(self, key: Tuple[asyncio.AbstractEventLoop, Hashable], flight):
+        with self._lock:
+            if self._futures.get(key) is flight:
+                del self._futures[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._calls) + len(self._futures)